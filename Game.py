@@ -5,32 +5,49 @@ import warnings
 import pygame
 import os
 import random
+import time
+from contextlib import contextmanager
+from functools import partial
 import pymunk
-print("Pymunk version:", pymunk.version)  # Add this for debugging
 
 import config.config as game_config  # Add this for access to all levels
-from config.render import draw_game_frame, draw_inventory_overlay
+from config.render import draw_game_frame, draw_inventory_overlay, draw_loading_screen, scene_lights, FIREBALL_GLOW_RADIUS, EXPLOSION_GLOW_RADIUS
 
 from config.config import (
-    WIN_W, WIN_H, FPS, LEVEL_1, COL_BG, world_to_screen, LEVEL_NAMES, LEVEL_MONSTER_MIN_MAX
+    WIN_W, WIN_H, FPS, INVENTORY_FPS, SIM_DT, ASSET_PUMP_BUDGET_MS, MAX_SIM_STEPS, MAX_FRAME_SKIP, MAX_FRAME_TIME, VECTORIZED_ENEMIES, AI_BUDGET_MS, LEVEL_1, COL_BG, world_to_screen, LEVEL_NAMES, LEVEL_MONSTER_MIN_MAX
 )
 from config.player import Player
 from config.enemy import Enemy
-from config.fireball import Fireball
-from config.target import Target
+from config.enemy_batch import EnemyBatch, PLAN_SCALAR, PLAN_MOVE
+from config.projectiles import ProjectilePool, FIREBALL, ARROW
 from config.world import World
 from config.camera import Camera
 from config.utils import draw_light_mask
-from config.combat import show_damage_numbers, draw_damage_numbers, show_health_bar, update_health_bars, draw_health_bars
+from config.profiler import FrameProfiler
+from config.debug_draw import DebugDraw, DEBUG_KEYS
+from config.lighting import Lighting
+from config.culling import ViewCuller
+from config.physics import Physics
+from config.ai_scheduler import AIScheduler
+from config.assets import AssetManager, AssetAttribute, level_assets
+from config.sprites import warm_sprite_frames, warm_rotated_frames, clear_sprite_frames
+from config.mili import SWORD_DRAW_SIZE
+from config.text import get_font, render_text
+from config.log import get_logger
+from config.inventory_ui import InventoryOverlay, drop_zone_rect, stat_button_rect, STAT_NAMES
+from config.combat import draw_damage_numbers, update_health_bars, queue_hit, resolve_hits
 from collision import Hitbox, check_entity_collision, resolve_enemy_collision
 from config.item_db import (
-    ITEM_SWORD, ITEM_STAFF, ITEM_BOW,
+    use_icon_assets, ITEM_SWORD, ITEM_STAFF, ITEM_BOW,
     ITEM_HELMET, ITEM_ARMOR, ITEM_BOOTS, ITEM_RING
 )
 from config.player import Item
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
+log = get_logger("game")
+input_log = get_logger("input")  # per-event mouse logging; DEBUG only
+
 # ----------------------------------------
 #
 # -----------------------------
@@ -38,84 +55,70 @@ warnings.filterwarnings("ignore", category=UserWarning)
 # -----------------------------
 
 class Game:
-    def __init__(self, level_index=0, entry_door_idx=None, prev_level_index=None):
+    # Images and sounds, read from self.assets (config/assets.py MANIFEST) on first use
+    monster_img_original = AssetAttribute("monster")
+    monster_img_alt = AssetAttribute("monster_alt")
+    monster_img_boss = AssetAttribute("monster_boss")
+    target_img = AssetAttribute("target")
+    target_img_alt = AssetAttribute("target_alt")
+    hero_img = AssetAttribute("hero")
+    torch_img = AssetAttribute("torch")
+    fireball_img = AssetAttribute("fireball")
+    explosion_imgs = AssetAttribute("explosion")
+    sword_img = AssetAttribute("sword")
+    sword_slash_imgs = AssetAttribute("sword_slash")
+    door_img = AssetAttribute("door_closed")
+    door_img_open = AssetAttribute("door_open")
+    skeleton_walk_frames = AssetAttribute("skeleton_walk")
+    skeleton_attack_frames = AssetAttribute("skeleton_attack")
+    cast_sound = AssetAttribute("cast_sound")
+    explosion_sound = AssetAttribute("explosion_sound")
+    sword_sound = AssetAttribute("sword_sound")
+    slime_damage_sound = AssetAttribute("slime_damage_sound")
+    slime_moving_sound = AssetAttribute("slime_moving_sound")
+    slime_death_sound = AssetAttribute("slime_death_sound")
+
+    def __init__(self, level_index=0, entry_door_idx=None, prev_level_index=None, headless=False, assets=None):
+        boot_time = time.perf_counter()
+        # Headless: no window and no audio device, for simulate.py and CI runs.
+        # step() works as usual; run() and render() still draw, just to a 1x1 surface.
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((WIN_W, WIN_H))
-        pygame.display.set_caption("Belekoks Game")
+        if headless:
+            # convert_alpha() needs a display mode, the dummy driver gives us one
+            self.screen = pygame.display.set_mode((1, 1))
+        else:
+            pygame.mixer.init()
+            self.screen = pygame.display.set_mode((WIN_W, WIN_H))
+            pygame.display.set_caption("Belekoks Game")
         self.clock = pygame.time.Clock()
+        # --- Fixed-timestep state (see run/step/render) ---
+        self.sim_accumulator = 0.0  # unsimulated frame time in seconds
+        self.frames_skipped = 0
 
-        # Load images and sounds with new paths
-        self.monster_img_original = pygame.transform.scale(
-            pygame.image.load("textures/NPC/slime/monster.png").convert_alpha(), (40, 60)
-        )
-        # Only load alternate/boss textures if they exist, else fallback to original
-        try:
-            self.monster_img_alt = pygame.transform.scale(
-                pygame.image.load("textures/NPC/slime/monster_alt.png").convert_alpha(), (40, 60)
-            )
-        except Exception:
-            self.monster_img_alt = self.monster_img_original
-        try:
-            self.monster_img_boss = pygame.transform.scale(
-                pygame.image.load("textures/NPC/slime/monster_boss.png").convert_alpha(), (40, 60)
-            )
-        except Exception:
-            self.monster_img_boss = self.monster_img_original
-        self.target_img = pygame.transform.scale(
-            pygame.image.load("textures/NPC/target/target.png").convert_alpha(), (40, 60)
-        )
-        try:
-            self.target_img_alt = pygame.transform.scale(
-                pygame.image.load("textures/NPC/target/target_alt.png").convert_alpha(), (40, 60)
-            )
-        except Exception:
-            self.target_img_alt = self.target_img
-        self.hero_img = pygame.transform.scale(
-            pygame.image.load("textures/player_movement/hero.png").convert_alpha(), (40, 60)
-        )
-        self.torch_img = pygame.transform.scale(
-            pygame.image.load("textures/torch/torch.png").convert_alpha(), (30, 60)
-        )
-        self.fireball_img = pygame.transform.scale(
-            pygame.image.load("textures/effects/fireball/fireball.png").convert_alpha(), (40, 20)
-        )
-        self.explosion_imgs = [
-            pygame.transform.scale(
-                pygame.image.load(f"textures/effects/fireball_explosion/explosion{i}.png").convert_alpha(), (60, 60)
-            )
-            for i in range(1, 9)
-        ]
-        self.cast_sound = pygame.mixer.Sound("textures/effects/fireball/cast.mp3")
-        self.explosion_sound = pygame.mixer.Sound("textures/effects/fireball_explosion/explosion.mp3")
-        self.player_anim_frames = {
-            "forward": [pygame.transform.scale(pygame.image.load(f"textures/player_movement/front{i}.png").convert_alpha(), (40, 60)) for i in range(1, 9)],
-            "back":    [pygame.transform.scale(pygame.image.load(f"textures/player_movement/back{i}.png").convert_alpha(), (40, 60)) for i in range(1, 9)],
-            "right":   [pygame.transform.scale(pygame.image.load(f"textures/player_movement/right{i}.png").convert_alpha(), (40, 60)) for i in range(1, 9)],
-            "left":    [pygame.transform.scale(pygame.image.load(f"textures/player_movement/left{i}.png").convert_alpha(), (40, 60)) for i in range(1, 9)],
-        }
-        # Sword images
-        self.sword_img = pygame.transform.scale(
-            pygame.image.load("textures/sword/sword.png").convert_alpha(), (80, 80)
-        )
-        self.sword_slash_imgs = [
-            pygame.transform.scale(
-                pygame.image.load(f"textures/sword/sword_slash{i}.png").convert_alpha(), (60, 60)
-            )
-            for i in range(1, 9)
-        ]
-        self.sword_sound = pygame.mixer.Sound("textures/sword/sword_sound.mp3")
-        self.slime_damage_sound = pygame.mixer.Sound("textures/NPC/slime/slime_damage.mp3")
-        self.slime_moving_sound = pygame.mixer.Sound("textures/NPC/slime/slime_moving.mp3")
-        self.slime_death_sound = pygame.mixer.Sound("textures/NPC/slime/slime_death.mp3")
-
-        # --- Load door image before World ---
-        self.door_img = pygame.transform.scale(
-            pygame.image.load("textures/door/door_closed.png").convert_alpha(), (48, 72)
-        )
-        self.door_img_open = pygame.transform.scale(
-            pygame.image.load("textures/door/door_open.png").convert_alpha(), (48, 72)
-        )
+        # --- Assets: decoded on worker threads, the current level's sprites first ---
+        # A restart passes the running game's AssetManager in, so nothing is loaded twice
+        if assets is None:
+            assets = AssetManager(headless=headless, started=boot_time)
+            assets.prioritize(level_assets(self.level_layout(level_index)), 0)
+            assets.start()
+            if not headless:
+                draw_loading_screen(self.screen, 0.0)
+        self.assets = assets
+        use_icon_assets(self.assets)
+        # --- Lighting: persistent darkness buffer ---
+        # The masks are drawn a few per frame once the game is running rather than before the first
+        # frame; a mask that is needed earlier is drawn on the spot.
+        self.torch_glow_radius = 220
+        self.lighting = Lighting()
+        atlas = self.lighting.atlas
+        for radius in (self.torch_glow_radius, EXPLOSION_GLOW_RADIUS):
+            for variant in range(atlas.variants + 1):
+                self.assets.defer(partial(atlas.mask, radius, variant))
+        self.assets.defer(partial(atlas.mask, FIREBALL_GLOW_RADIUS))
 
         # Game state
         self.player = Player(200, 200)
@@ -150,36 +153,22 @@ class Game:
         test_item = scale_item_stats(base_item, 5)
         self.player.inventory[7] = Item(**test_item)
         self.camera = Camera()
-        # Provide a list of enemy/target images to World
-        self.enemy_imgs = [self.monster_img_original, self.monster_img_alt, self.monster_img_boss]
-        self.target_imgs = [self.target_img, self.target_img_alt]
         self.level_index = level_index  # Track current level index
         self.prev_level_index = prev_level_index  # Track previous level index for backtracking
         self.entry_door_idx = entry_door_idx  # Track which door was used to enter
         # Add this before self.load_level(...)
-        self.defeated_enemies_per_level = {}  # Track defeated enemies by level index
-        self.initial_enemy_positions_per_level = {}  # Track initial enemy positions per level
-        # --- Skeleton walk animation frames ---
-        self.skeleton_walk_frames = [
-            pygame.transform.scale(
-                pygame.image.load(f"textures/NPC/skeleton/skeleton_walk{i}.png").convert_alpha(), (40, 60)
-            )
-            for i in range(1, 9)
-        ]
-        # --- Skeleton attack animation frames ---
-        self.skeleton_attack_frames = [
-            pygame.transform.scale(
-                pygame.image.load(f"textures/NPC/skeleton/skeleton_attack{i}.png").convert_alpha(), (40, 60)
-            )
-            for i in range(1, 9)
-        ]
-
+        self.defeated_enemies_per_level = {}  # level index -> spawn positions of its defeated enemies
+        self.hit_queue = []  # (enemy or target, damage) queued by attacks this tick, see resolve_hits
+        self.target_health_bars = {}  # entity id -> health bar shown over a damaged target or enemy
+        self.projectiles = ProjectilePool()  # fireballs and arrows
+        # Which enemies update each tick; headless runs keep the time cap off so they stay reproducible
+        self.ai = AIScheduler(budget_ms=None if headless else AI_BUDGET_MS)
+        # Splash screen until everything the first frame draws is in; the rest streams in while playing
+        self.assets.wait(0, on_progress=None if headless else lambda fraction: draw_loading_screen(self.screen, fraction))
         self.load_level(self.level_index, entry_door_idx=self.entry_door_idx)
-        self.fireballs = []
         self.torch_on_ground = True
         self.torch_following = False
         self.torch_ground_pos = (self.player.x + 60, self.player.y)
-        self.torch_glow_radius = 220  # <-- Restore this line
         # Torch movement attributes
         self.torch_vel_x = random.choice([-1, 1]) * 80.0  # pixels/sec
         self.torch_vel_y = random.choice([-1, 1]) * 80.0
@@ -192,58 +181,114 @@ class Game:
         self.torch_pickup_cooldown = 0.0  # <-- Add this line
         self.t_press_count = 0  # <-- Add this if not present
         self.damage_numbers = []
-        self.target_health_bars = {}
         self.sword_swing_damage = None
         self.sword_swing_hit_targets = set()
         self.entity_hitboxes = []  # Store hitboxes for collision checks
 
-        # Pymunk physics
-        self.space = pymunk.Space()
-        self.space.gravity = (0, 0)
-
-        # Create player body and shape
-        self.player_body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
-        self.player_body.position = (self.player.x, self.player.y)
-        self.player_shape = pymunk.Circle(self.player_body, 20)
-        self.player_shape.collision_type = 1
-        self.space.add(self.player_body, self.player_shape)
+        # --- Per-frame phase timings (F3 overlay, PROFILER_OUTPUT file) ---
+        self.profiler = FrameProfiler()
+        # --- Debug overlays, off until toggled with F5-F9 ---
+        self.debug_draw = DebugDraw()
 
-        # Create enemy bodies and shapes
-        self.enemy_bodies = []
-        self.enemy_shapes = []
-        for enemy in self.world.enemies:
-            body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
-            body.position = (enemy.x, enemy.y)
-            shape = pymunk.Circle(body, 20)
-            shape.collision_type = 2
-            self.space.add(body, shape)
-            self.enemy_bodies.append(body)
-            self.enemy_shapes.append(shape)
+    @property
+    def player_anim_frames(self):
+        return {
+            "forward": self.assets.get("player_front"),
+            "back": self.assets.get("player_back"),
+            "right": self.assets.get("player_right"),
+            "left": self.assets.get("player_left"),
+        }
 
-        # Create wall shapes (static bodies)
-        self.wall_shapes = []
-        for wall_rect in self.world.solids:
-            body = pymunk.Body(body_type=pymunk.Body.STATIC)
-            body.position = (wall_rect.x, wall_rect.y)
-            shape = pymunk.Poly.create_box(body, (wall_rect.width, wall_rect.height))
-            shape.collision_type = 10  # Arbitrary wall type
-            self.space.add(body, shape)
-            self.wall_shapes.append(shape)
+    @property
+    def enemy_imgs(self):
+        return [self.monster_img_original, self.monster_img_alt, self.monster_img_boss]
 
-        # --- Add light mask cache ---
-        self.light_mask_cache = {}
+    @property
+    def target_imgs(self):
+        return [self.target_img, self.target_img_alt]
 
     def get_light_mask(self, radius):
-        # --- Add this helper method for caching ---
-        if radius not in self.light_mask_cache:
-            mask = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-            for r in range(radius, 0, -1):
-                alpha = int(255 * (1 - r / radius))
-                pygame.draw.circle(mask, (0, 0, 0, alpha), (radius, radius), r)
-            self.light_mask_cache[radius] = mask
-        return self.light_mask_cache[radius]
+        return self.lighting.atlas.mask(radius)
+
+    def warm_sprites(self):
+        """Fill the sprite cache with the frames every level draws (now, or once the asset is loaded)."""
+        self.assets.on_ready("fireball", lambda img: warm_rotated_frames(img, (FIREBALL.width, FIREBALL.height)))
+        self.assets.on_ready("sword", lambda img: warm_sprite_frames([img], SWORD_DRAW_SIZE))
+        self.assets.on_ready("sword_slash", lambda imgs: warm_sprite_frames(imgs, SWORD_DRAW_SIZE))
+
+    def enemy_batch_for_level(self):
+        """Return the vectorized batch for the current enemy list, or None when disabled."""
+        if not VECTORIZED_ENEMIES or not EnemyBatch.available():
+            return None
+        batch = self.enemy_batch
+        # Kills are mirrored into the batch row by row (despawn_enemy); spawns rebuild it
+        if batch is None or batch.enemies is not self.world.enemies or batch.n != len(batch.enemies):
+            if batch is not None:
+                batch.flush()
+            self.enemy_batch = EnemyBatch(self.world.enemies)
+        return self.enemy_batch
+
+    def update_enemies(self, dt):
+        """Step every enemy the AI scheduler wakes this tick; returns True if any of them moved.
+
+        Enemy rects live in world.enemy_grid and are only refreshed when an enemy
+        actually moves, so enemy-vs-enemy blocking is a neighbour query instead of
+        a fresh list of every other enemy's rect. Slime aggro/wander/attack math is
+        done for all slimes at once by EnemyBatch when NumPy is available. Distant
+        enemies update less often or sleep (config.ai_scheduler), each with its own dt.
+        """
+        moved = False
+        enemy_grid = self.world.enemy_grid
+        physics = self.physics
+        torch_pos = self.torch_ground_pos
+        torch_active = self.torch_on_ground or self.torch_following
+        schedule = self.ai.schedule(self.world, self.ai.points(self), dt)
+        batch = self.enemy_batch_for_level()
+        if batch is not None:
+            row_dt = batch.tick_lengths(schedule)
+            modes, plan_dx, plan_dy, plan_step = batch.plan(row_dt, self.player)
+        for i, enemy, enemy_dt in schedule:
+            prev_x, prev_y = enemy.x, enemy.y
+            if batch is not None and modes[i] != PLAN_SCALAR:
+                if modes[i] == PLAN_MOVE:
+                    enemy.move_and_collide(plan_dx[i], plan_dy[i], plan_step[i], physics)
+            else:
+                # Determine target for each enemy: chase only if player or torch is in range
+                if enemy.sees_target(self.player.x, self.player.y):
+                    monster_target = (self.player.x, self.player.y)
+                elif torch_active and enemy.sees_target(torch_pos[0], torch_pos[1]):
+                    monster_target = torch_pos
+                else:
+                    monster_target = (enemy.x, enemy.y)  # Idle
+                enemy.update(enemy_dt, monster_target, physics, player=self.player)
+            if enemy.x != prev_x or enemy.y != prev_y:
+                physics.move_enemy(enemy)
+                enemy_grid.move(enemy, enemy.draw_enemy())
+                moved = True
+        if batch is not None:
+            batch.resolve_attacks(row_dt, self.player)
+        self.ai.finish(len(schedule))
+        return moved
+
+    def despawn_enemy(self, enemy):
+        """Remove a killed enemy's entity, physics shape and AI batch row, each in O(1)."""
+        self.physics.remove_enemy(enemy)
+        batch = self.enemy_batch
+        index = self.world.remove_enemy(enemy)
+        if index is not None and batch is not None and batch.enemies is self.world.enemies:
+            batch.remove(index)
+
+    def level_layout(self, level_index):
+        """The map load_level(level_index) would load."""
+        level_keys = sorted(k for k in dir(game_config) if k.startswith("LEVEL_"))
+        if not 0 <= level_index < len(level_keys):
+            level_index = 0
+        return getattr(game_config, level_keys[level_index])
 
     def load_level(self, level_index, entry_door_pos=None, entry_door_idx=None):
+        # The last level's frames go with their atlas pages; enemies warm theirs as World spawns them
+        clear_sprite_frames()
+        self.warm_sprites()
         # Get all levels from config.py (LEVEL_1, LEVEL_2, etc.)
         level_keys = [k for k in dir(game_config) if k.startswith("LEVEL_")]
         level_keys.sort()  # Ensure LEVEL_1, LEVEL_2, ...
@@ -259,43 +304,34 @@ class Game:
             monster_level_min, monster_level_max = LEVEL_MONSTER_MIN_MAX[self.level_index]
         else:
             monster_level_min, monster_level_max = 1, game_level
+        # Only wait for the sprites this level places; the others keep loading in the background
+        needed = level_assets(level_layout)
         self.world = World(
             level_layout,
-            self.enemy_imgs,
-            self.target_imgs,
-            door_img=self.door_img,
-            door_img_open=self.door_img_open,
+            self.enemy_imgs if "monster" in needed else [],
+            self.target_imgs if "target" in needed else [],
+            door_img=self.door_img if "door_closed" in needed else None,
+            door_img_open=self.door_img_open if "door_open" in needed else None,
             game_level=game_level,
             monster_level_min=monster_level_min,
             monster_level_max=monster_level_max,
-            skeleton_walk_frames=self.skeleton_walk_frames,
-            skeleton_attack_frames=self.skeleton_attack_frames
+            skeleton_walk_frames=self.skeleton_walk_frames if "skeleton_walk" in needed else None,
+            skeleton_attack_frames=self.skeleton_attack_frames if "skeleton_attack" in needed else None,
+            wall_texture=self.assets.get("wall"),
+            ground_texture=self.assets.get("ground"),
         )
-        self.fireballs = []
-        self.enemy_bodies = []
-        self.enemy_shapes = []
-        # --- Track and filter enemies by initial positions ---
-        # Save initial enemy positions for this level if not already saved
-        if self.level_index not in self.initial_enemy_positions_per_level:
-            self.initial_enemy_positions_per_level[self.level_index] = [
-                (enemy.x, enemy.y) for enemy in self.world.enemies
-            ]
-        # Remove defeated enemies for this level
+        self.projectiles.clear()  # spent records stay pooled for the next level
+        self.enemy_batch = None
+        self.ai.reset()
+        self.target_health_bars.clear()  # keyed by entity id, and ids start over with the new world
+        # Remove defeated enemies for this level (recorded by their spawn positions)
+        self.hit_queue.clear()
         defeated = self.defeated_enemies_per_level.get(self.level_index, set())
         filtered_enemies = []
         for enemy in self.world.enemies:
-            enemy_id = (enemy.x, enemy.y)
-            if enemy_id not in defeated:
+            if enemy.spawn_pos not in defeated:
                 filtered_enemies.append(enemy)
-        self.world.enemies = filtered_enemies
-        for enemy in self.world.enemies:
-            body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
-            body.position = (enemy.x, enemy.y)
-            shape = pymunk.Circle(body, 20)
-            shape.collision_type = 2
-            self.space.add(body, shape)
-            self.enemy_bodies.append(body)
-            self.enemy_shapes.append(shape)
+        self.world.set_enemies(filtered_enemies)
         # Find all doors in the level
         door_positions = []
         for y, row in enumerate(level_layout):
@@ -358,10 +394,17 @@ class Game:
             else:
                 self.player.x, self.player.y = 200, 200
         self.player.hp = self.player.max_hp
+        # A new space per level: the previous level's walls, bodies and handlers go with the old one
+        self.physics = Physics(self.world, self.player)
         self.camera = Camera()
+        # Bake the tiles around where the camera settles; the rest bake when they come into view
+        self.world.bake_tiles(pygame.Rect(int(self.player.x - WIN_W / 2), int(self.player.y - WIN_H / 2), WIN_W, WIN_H))
         self.door_positions = door_positions  # Store for later use
         self.door_transition = None  # (idx, start_time, direction)
         self.door_transition_duration = 2.0  # seconds
+        self.prev_positions = {}  # id(obj) -> (obj, x, y) before the last simulation tick
+        self.queued_sword_swing = False  # input waiting for the next simulation tick
+        self.queued_fireball = False
         self.level_name_timer = 5.0  # Show level name for 5 seconds
         self.inventory_open = False  # <-- Add this line
         self.inventory_tab = 0  # 0=Inventory, 1=Stats, 2=Skills
@@ -369,19 +412,22 @@ class Game:
         self.dragged_item = None
         self.dragged_item_idx = None
         self.dragged_item_rect = None
+        self.inventory_ui = InventoryOverlay()
 
     def run(self):
-        print("Game loop started")  # Debug: confirm loop starts
+        log.info("Game loop started (pygame %s, pymunk %s)", pygame.version.ver, pymunk.version)
         running = True
         game_over = False
-        next_level_triggered = False  # Add this flag to prevent multiple triggers per frame
-        last_door_idx = None  # Track which door was last used
         # --- Main event loop ---
+        # Input, pause screens and rendering run once per frame; the game simulation
+        # advances in fixed SIM_DT ticks from an accumulator (see step/render).
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            shoot_fireball = False
-            sword_swing = False
-            next_level_triggered = False  # Reset at the start of each frame
+            self.profiler.end_frame()
+            # The paused inventory screen barely changes, so it runs at a lower frame rate
+            dt = min(self.clock.tick(INVENTORY_FPS if self.inventory_open else FPS) / 1000.0, MAX_FRAME_TIME)
+            self.profiler.begin_frame()
+            # Convert whatever the loader threads finished since the last frame
+            self.assets.pump(ASSET_PUMP_BUDGET_MS)
 
             # --- Torch pickup cooldown decrement ---
             if self.torch_pickup_cooldown > 0:
@@ -392,18 +438,17 @@ class Game:
                 game_over = True
 
             for e in pygame.event.get():
-                # --- DEBUG: Print all mouse events ---
-                if e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-                    print(f"DEBUG: Mouse event type={e.type}, button={getattr(e, 'button', None)}, pos={pygame.mouse.get_pos()}")
+                if input_log.debug_enabled and e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+                    input_log.debug("Mouse event type=%s button=%s pos=%s", pygame.event.event_name(e.type), getattr(e, "button", None), e.pos)
                 if e.type == pygame.QUIT:
                     running = False
                 elif self.inventory_open:
-                    # --- DEBUG: Print mouse events in inventory ---
-                    if e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
-                        print(f"INVENTORY DEBUG: type={e.type}, button={getattr(e, 'button', None)}, tab={self.inventory_tab}, pos={pygame.mouse.get_pos()}")
+                    if input_log.debug_enabled and e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                        input_log.debug("Inventory mouse event type=%s button=%s tab=%s pos=%s", pygame.event.event_name(e.type), e.button, self.inventory_tab, e.pos)
                     if e.type == pygame.KEYDOWN:
                         if e.key in (pygame.K_i, pygame.K_TAB, pygame.K_ESCAPE):
                             self.inventory_open = False
+                            self.inventory_ui.close()
                         elif e.key in (pygame.K_LEFT, pygame.K_a):
                             self.inventory_tab = (self.inventory_tab - 1) % 3
                         elif e.key in (pygame.K_RIGHT, pygame.K_d):
@@ -414,17 +459,13 @@ class Game:
                             self.inventory_tab = 1
                         elif e.key == pygame.K_3:
                             self.inventory_tab = 2
+                    elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and self.inventory_ui.tab_at(e.pos) is not None:
+                        self.inventory_tab = self.inventory_ui.tab_at(e.pos)
                     elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and self.inventory_tab == 1:
                         mx, my = pygame.mouse.get_pos()
-                        # Centered and spaced buttons
-                        btn_w, btn_h = 32, 32
-                        btn_x = self.screen.get_width() // 2 + 180
-                        btn_y_start = 220 + 11 * 40
-                        stat_names = ["strength", "dexterity", "vitality", "intelligence"]
-                        for i, stat in enumerate(stat_names):
-                            btn_rect = pygame.Rect(btn_x, btn_y_start + i * 56, btn_w, btn_h)
-                            if btn_rect.collidepoint(mx, my):
-                                self.player.assign_stat(stat)
+                        for i, stat in enumerate(STAT_NAMES):
+                            if stat_button_rect(self.screen.get_width(), i).collidepoint(mx, my):
+                                self.player.assign_stat(stat.lower())
                                 break
                     elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and self.inventory_tab == 0:
                         mx, my = pygame.mouse.get_pos()
@@ -589,11 +630,7 @@ class Game:
                                             dropped = True  # If slot does not match, just return item to original slot
                                             break
                             # --- Drop zone logic (lower third + 80px) ---
-                            drop_zone_w, drop_zone_h = 420, 180
-                            drop_zone_x = self.screen.get_width() // 2 - drop_zone_w // 2
-                            drop_zone_y = int(self.screen.get_height() * 2 / 3 - drop_zone_h // 2 + 80)
-                            drop_zone_rect = pygame.Rect(drop_zone_x, drop_zone_y, drop_zone_w, drop_zone_h)
-                            if not dropped and drop_zone_rect.collidepoint(mx, my):
+                            if not dropped and drop_zone_rect(self.screen).collidepoint(mx, my):
                                 # Remove item from inventory or equipment
                                 if isinstance(self.dragged_item_idx, int):
                                     self.player.inventory[self.dragged_item_idx] = None
@@ -614,14 +651,14 @@ class Game:
                         if e.key == pygame.K_ESCAPE:
                             running = False
                         elif e.key == pygame.K_r:
-                            # Restart game: re-initialize everything and reset player HP
-                            self.__init__()
+                            # Restart game: re-initialize everything (but the loaded assets) and reset player HP
+                            self.__init__(headless=self.headless, assets=self.assets)
                             self.player.hp = self.player.max_hp
                             game_over = False
                     elif e.type == pygame.MOUSEBUTTONDOWN:
                         mx, my = pygame.mouse.get_pos()
                         if restart_rect.collidepoint(mx, my):
-                            self.__init__()
+                            self.__init__(headless=self.headless, assets=self.assets)
                             self.player.hp = self.player.max_hp
                             game_over = False
                         elif exit_rect.collidepoint(mx, my):
@@ -634,7 +671,7 @@ class Game:
                         elif e.key in (pygame.K_i, pygame.K_TAB):
                             self.inventory_open = True
                         elif e.key == pygame.K_f:
-                            shoot_fireball = True
+                            self.queued_fireball = True
                         elif e.key == pygame.K_t:
                             now = pygame.time.get_ticks()
                             if now - self.last_t_press_time < 400:
@@ -656,6 +693,10 @@ class Game:
                                 self.torch_pickup_cooldown = 0.3
                                 self.torch_vel_x = random.choice([-1, 1]) * 80.0
                                 self.torch_vel_y = random.choice([-1, 1]) * 80.0
+                        elif e.key == pygame.K_F3:
+                            self.profiler.toggle_overlay()
+                        elif e.key in DEBUG_KEYS:
+                            self.debug_draw.toggle(DEBUG_KEYS[e.key])
                         elif e.key == pygame.K_RETURN:
                             # Try to open a nearby door
                             for door in getattr(self.world, "doors", []):
@@ -670,47 +711,14 @@ class Game:
                             # Instead, reload the current level:
                             self.load_level(self.level_index, entry_door_idx=self.entry_door_idx)
                             game_over = False  # Reset game over state
-                            next_level_triggered = False  # Ensure next level is not triggered
                     elif e.type == pygame.MOUSEBUTTONDOWN:
                         if e.button == 1:  # Left mouse button
-                            sword_swing = True
+                            self.queued_sword_swing = True
+            self.profiler.mark("input")
 
             if self.inventory_open:
-                draw_inventory_overlay(self, self.inventory_tab)
-                # --- Draw dragged item if any ---
-                if self.dragged_item is not None and self.dragged_item_rect is not None:
-                    mx, my = pygame.mouse.get_pos()
-                    slot_size = self.dragged_item_rect.width
-                    if hasattr(self.dragged_item, "image") and self.dragged_item.image:
-                        item_img = pygame.transform.scale(self.dragged_item.image, (slot_size - 12, slot_size - 12))
-                        self.screen.blit(item_img, (mx - (slot_size - 12) // 2, my - (slot_size - 12) // 2))
-                    else:
-                        pygame.draw.circle(self.screen, (200, 200, 80), (mx, my), slot_size // 3)
-                    # --- Draw drop zone (lower by extra 80 pixels) ---
-                    drop_zone_w, drop_zone_h = 420, 180
-                    drop_zone_x = self.screen.get_width() // 2 - drop_zone_w // 2
-                    drop_zone_y = int(self.screen.get_height() * 2 / 3 - drop_zone_h // 2 + 80)
-                    drop_zone_rect = pygame.Rect(drop_zone_x, drop_zone_y, drop_zone_w, drop_zone_h)
-                    pygame.draw.rect(self.screen, (180, 180, 180), drop_zone_rect, border_radius=24)
-                    dash_color = (120, 120, 120)
-                    dash_len = 18
-                    gap_len = 10
-                    # Top edge
-                    for x in range(drop_zone_x, drop_zone_x + drop_zone_w, dash_len + gap_len):
-                        pygame.draw.line(self.screen, dash_color, (x, drop_zone_y), (min(x + dash_len, drop_zone_x + drop_zone_w), drop_zone_y), 3)
-                    # Bottom edge
-                    for x in range(drop_zone_x, drop_zone_x + drop_zone_w, dash_len + gap_len):
-                        pygame.draw.line(self.screen, dash_color, (x, drop_zone_y + drop_zone_h), (min(x + dash_len, drop_zone_x + drop_zone_w), drop_zone_y + drop_zone_h), 3)
-                    # Left edge
-                    for y in range(drop_zone_y, drop_zone_y + drop_zone_h, dash_len + gap_len):
-                        pygame.draw.line(self.screen, dash_color, (drop_zone_x, y), (drop_zone_x, min(y + dash_len, drop_zone_y + drop_zone_h)), 3)
-                    # Right edge
-                    for y in range(drop_zone_y, drop_zone_y + drop_zone_h, dash_len + gap_len):
-                        pygame.draw.line(self.screen, dash_color, (drop_zone_x + drop_zone_w, y), (drop_zone_x + drop_zone_w, min(y + dash_len, drop_zone_y + drop_zone_h)), 3)
-                    font = pygame.font.SysFont("arial", 36, bold=True)
-                    drop_text = font.render("Drop Item Here", True, (60, 60, 60))
-                    self.screen.blit(drop_text, (drop_zone_x + drop_zone_w // 2 - drop_text.get_width() // 2,
-                                                 drop_zone_y + drop_zone_h // 2 - drop_text.get_height() // 2))
+                if draw_inventory_overlay(self, self.inventory_tab):
+                    pygame.display.flip()
                 # --- Fade "Level required" messages only in inventory overlay ---
                 for dmg in self.damage_numbers[:]:
                     if isinstance(dmg.get("value", ""), str) and dmg.get("value", "").startswith("Level "):
@@ -720,9 +728,6 @@ class Game:
                             self.damage_numbers.remove(dmg)
                 continue  # Pause game updates while inventory is open
 
-            # Regenerate HP and Mana each frame (only when not paused)
-            self.player.update_regeneration(dt)
-
             # --- Door transition animation logic ---
             if self.door_transition is not None:
                 idx, start_time, direction = self.door_transition
@@ -736,44 +741,7 @@ class Game:
                 self.world.draw(self.screen, self.camera.x, self.camera.y, self.camera.view_rect())
 
                 # --- LIGHTING OVERLAY (same as normal frame) ---
-                darkness = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-                darkness.fill((0, 0, 0, self.darkness_alpha))
-
-                # Torch glow
-                if self.torch_on_ground or self.torch_following:
-                    torch_px, torch_py = world_to_screen(
-                        self.torch_ground_pos[0] - 15 + self.torch_wiggle_offset[0],
-                        self.torch_ground_pos[1] - 30 + self.torch_wiggle_offset[1],
-                        self.camera.x, self.camera.y
-                    )
-                    torch_center = (torch_px + 15, torch_py + 30)
-                else:
-                    torch_center = None
-
-                if torch_center:
-                    mask = self.get_light_mask(self.torch_glow_radius)
-                    x = torch_center[0] - self.torch_glow_radius
-                    y = torch_center[1] - self.torch_glow_radius
-                    darkness.blit(mask, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-
-                # Fireball and explosion glow
-                fireball_glow_radius = 80
-                explosion_glow_radius = 180
-                for fireball in self.fireballs:
-                    fx, fy = world_to_screen(fireball.x, fireball.y, self.camera.x, self.camera.y)
-                    fireball_center = (int(fx), int(fy))
-                    if fireball.exploding:
-                        mask = self.get_light_mask(explosion_glow_radius)
-                        x = fireball_center[0] - explosion_glow_radius
-                        y = fireball_center[1] - explosion_glow_radius
-                        darkness.blit(mask, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-                    else:
-                        mask = self.get_light_mask(fireball_glow_radius)
-                        x = fireball_center[0] - fireball_glow_radius
-                        y = fireball_center[1] - fireball_glow_radius
-                        darkness.blit(mask, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-
-                self.screen.blit(darkness, (0, 0))
+                self.lighting.render(self.screen, self.darkness_alpha, scene_lights(self))
                 pygame.display.flip()
 
                 # After animation, actually change level
@@ -814,38 +782,22 @@ class Game:
                         self.entry_door_idx = entry_idx
                         self.load_level(self.level_index, entry_door_idx=entry_idx)
                     self.door_transition = None
-                    next_level_triggered = False
+                    self.sim_accumulator = 0.0
                 continue  # Skip rest of loop this frame
 
-            # --- After input handling, check for player entering open door ---
-            for idx, door in enumerate(getattr(self.world, "doors", [])):
-                dist = math.hypot(self.player.x - door.x, self.player.y - door.y)
-                if door.open and dist < 80 and not next_level_triggered and self.door_transition is None:
-                    print("Level complete! Loading next/previous level...")
-                    # --- Backtrack logic: only allow backtracking if we are not at the first level ---
-                    if self.prev_level_index is not None and self.level_index != 0 and idx == self.entry_door_idx:
-                        # Start door transition for backtracking
-                        self.door_transition = (idx, pygame.time.get_ticks() / 1000.0, "back")
-                        next_level_triggered = True
-                        break
-                    # --- Forward logic ---
-                    self.door_transition = (idx, pygame.time.get_ticks() / 1000.0, "forward")
-                    next_level_triggered = True
-                    break
-
             if game_over:
                 # Draw game over overlay
                 overlay = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
                 overlay.fill((0, 0, 0, 180))
                 self.screen.blit(overlay, (0, 0))
-                font_big = pygame.font.SysFont("arial", 72, bold=True)
-                font_btn = pygame.font.SysFont("arial", 36, bold=True)
-                text_game_over = font_big.render("GAME OVER", True, (255, 80, 80))
+                font_big = get_font("arial", 72, bold=True)
+                font_btn = get_font("arial", 36, bold=True)
+                text_game_over = render_text(font_big, "GAME OVER", (255, 80, 80))
                 self.screen.blit(text_game_over, (WIN_W // 2 - text_game_over.get_width() // 2, WIN_H // 2 - 180))
 
                 # Draw buttons
-                restart_text = font_btn.render("Restart (R)", True, (255, 255, 255))
-                exit_text = font_btn.render("Exit (ESC)", True, (255, 255, 255))
+                restart_text = render_text(font_btn, "Restart (R)", (255, 255, 255))
+                exit_text = render_text(font_btn, "Exit (ESC)", (255, 255, 255))
                 restart_rect = pygame.Rect(WIN_W // 2 - 160, WIN_H // 2, 320, 60)
                 exit_rect = pygame.Rect(WIN_W // 2 - 160, WIN_H // 2 + 80, 320, 60)
                 pygame.draw.rect(self.screen, (80, 160, 80), restart_rect, border_radius=12)
@@ -857,438 +809,317 @@ class Game:
                 pygame.display.flip()
                 continue
 
-            # --- Animation and combat logic ---
-            # Update player animation
-            self.player.update_animation(dt)
-            # Update sword swing animation and logic
-            if sword_swing and not self.player.sword_swinging:
-                self.player.start_sword_swing()
-                weapon = self.player.equipment.get("Main Hand")
-                if weapon is not None and hasattr(weapon, "get_attack_damage"):
-                    # Roll weapon damage
-                    weapon_damage = weapon.get_attack_damage()
-                    # Roll player base melee damage: 1-5 for strength 1, 6-10 for strength 2, etc.
-                    min_dmg = 1 + (self.player.strength - 1) * 5
-                    max_dmg = 5 + (self.player.strength - 1) * 5
-                    player_base_melee_damage = random.randint(min_dmg, max_dmg)
-                    # Final damage is product of both rolls
-                    self.sword_swing_damage = weapon_damage * player_base_melee_damage
-                else:
-                    # No weapon: just roll player base melee damage
-                    min_dmg = 1 + (self.player.strength - 1) * 5
-                    max_dmg = 5 + (self.player.strength - 1) * 5
-                    self.sword_swing_damage = random.randint(min_dmg, max_dmg)
-                self.sword_swing_hit_targets = set()
-                self.sword_sound.play()
-            if hasattr(self.player, "update_sword"):
-                self.player.update_sword(dt, len(self.sword_slash_imgs))
+            # --- Fixed-timestep simulation ---
+            self.sim_accumulator += dt
+            steps = 0
+            while self.sim_accumulator >= SIM_DT and steps < MAX_SIM_STEPS:
+                self.sim_accumulator -= SIM_DT
+                steps += 1
+                if self.sim_accumulator < SIM_DT or steps == MAX_SIM_STEPS:
+                    self.snapshot_positions()  # last tick before rendering
+                sword_swing, self.queued_sword_swing = self.queued_sword_swing, False
+                shoot_fireball, self.queued_fireball = self.queued_fireball, False
+                self.step(SIM_DT, sword_swing=sword_swing, shoot_fireball=shoot_fireball)
+                if self.door_transition is not None or self.player.hp <= 0:
+                    break
+            # Under load, skip a few renders to let the simulation catch up, then drop
+            # the backlog rather than spiralling (the game slows down instead)
+            if self.sim_accumulator >= SIM_DT:
+                if self.frames_skipped < MAX_FRAME_SKIP:
+                    self.frames_skipped += 1
+                    continue
+                self.sim_accumulator %= SIM_DT
+            self.frames_skipped = 0
 
-            # Fireball shooting logic
-            if shoot_fireball:
-                dx, dy = self.player.last_dir if hasattr(self.player, "last_dir") else (1, 0)
-                if dx != 0 or dy != 0:
-                    facing_left = dx < 0
-                    fireball_cost = 20  # Match Fireball.cost default
-                    if hasattr(self.player, "mana") and self.player.mana >= fireball_cost:
-                        weapon = self.player.equipment.get("Main Hand")
-                        weapon_magic = 1  # Default to 1 if not magic weapon
-                        if weapon is not None and hasattr(weapon, "get_magic_damage"):
-                            if getattr(weapon, "magic_min", 0) and getattr(weapon, "magic_max", 0):
-                                weapon_magic = weapon.get_magic_damage() or 1
-                        spell_damage = random.randint(self.player.intelligence * 10, self.player.intelligence * 10 + 9)
-                        fireball_damage = weapon_magic * spell_damage
-                        # Always pass fireball_damage as argument
-                        fireball = Fireball(self.player.x, self.player.y, dx, dy, facing_left=facing_left, damage=fireball_damage, cost=fireball_cost)
-                        self.fireballs.append(fireball)
-                        self.player.mana -= fireball_cost
-                        if self.player.mana < 0:
-                            self.player.mana = 0
-                        self.cast_sound.play()
-                    else:
-                        pass
+            # --- DRAWING ---
+            self.render(self.sim_accumulator / SIM_DT, dt)
+        self.profiler.end_frame()
+        self.profiler.close()
 
-            # --- Sword damage to targets and enemies ---
-            if hasattr(self.player, "sword_swinging") and self.player.sword_swinging:
-                # Calculate sword hitbox in front of player, facing mouse or last direction
-                mx, my = pygame.mouse.get_pos()
-                world_mx = mx + self.camera.x
-                world_my = my + self.camera.y
-                px, py = self.player.x, self.player.y
+    def step(self, dt, sword_swing=False, shoot_fireball=False, aim=None, keys=None):
+        """Advance the game simulation by one fixed tick of dt seconds.
 
-                dx = world_mx - px
-                dy = world_my - py
-                mag = math.hypot(dx, dy)
-                if mag > 0:
-                    dx /= mag
-                    dy /= mag
-                else:
-                    dx, dy = self.player.last_dir
+        aim is the world point the player faces and swings at and keys the held-key
+        state (anything indexable by pygame key constants); both default to the real
+        mouse and keyboard so simulate.py can drive the game without them.
+        """
+        if aim is None:
+            mx, my = pygame.mouse.get_pos()
+            aim = (mx + self.camera.x, my + self.camera.y)
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        # Regenerate HP and Mana each tick (only when not paused)
+        self.player.update_regeneration(dt)
 
-                sword_w, sword_h = 48, 48
-                offset = 32
-                hitbox_x = px + dx * offset - sword_w // 2
-                hitbox_y = py + dy * offset - sword_h // 2
-                sword_hitbox = pygame.Rect(int(hitbox_x), int(hitbox_y), sword_w, sword_h)
+        # --- After input handling, check for player entering open door ---
+        for idx, door in enumerate(getattr(self.world, "doors", [])):
+            dist = math.hypot(self.player.x - door.x, self.player.y - door.y)
+            if door.open and dist < 80 and self.door_transition is None:
+                log.info("Level complete! Loading next/previous level...")
+                # --- Backtrack logic: only allow backtracking if we are not at the first level ---
+                if self.prev_level_index is not None and self.level_index != 0 and idx == self.entry_door_idx:
+                    # Start door transition for backtracking
+                    self.door_transition = (idx, pygame.time.get_ticks() / 1000.0, "back")
+                    break
+                # --- Forward logic ---
+                self.door_transition = (idx, pygame.time.get_ticks() / 1000.0, "forward")
+                break
 
-                # Targets
-                for target in self.world.targets:
-                    if (
-                        hasattr(target, "respawn_timer") and target.respawn_timer <= 0
-                        and sword_hitbox.colliderect(target.rect())
-                        and id(target) not in self.sword_swing_hit_targets
-                    ):
-                        damage = self.sword_swing_damage if self.sword_swing_damage is not None else random.randint(10, 15)
-                        target.hit_points -= damage
-                        show_damage_numbers(self, target.x, target.y - 40, damage)
-                        show_health_bar(self, target)
-                        self.sword_swing_hit_targets.add(id(target))
-                        if target.hit_points <= 0:
-                            target.respawn_timer = 5.0
-                            self.world.remove_target_solid(target)
-                            target.hit_points = 300  # Reset HP for respawn
+        # --- Animation and combat logic ---
+        # Update player animation
+        self.player.update_animation(dt)
+        # Update sword swing animation and logic
+        if sword_swing and not self.player.sword_swinging:
+            self.player.start_sword_swing()
+            weapon = self.player.equipment.get("Main Hand")
+            if weapon is not None and hasattr(weapon, "get_attack_damage"):
+                # Roll weapon damage
+                weapon_damage = weapon.get_attack_damage()
+                # Roll player base melee damage: 1-5 for strength 1, 6-10 for strength 2, etc.
+                min_dmg = 1 + (self.player.strength - 1) * 5
+                max_dmg = 5 + (self.player.strength - 1) * 5
+                player_base_melee_damage = random.randint(min_dmg, max_dmg)
+                # Final damage is product of both rolls
+                self.sword_swing_damage = weapon_damage * player_base_melee_damage
+            else:
+                # No weapon: just roll player base melee damage
+                min_dmg = 1 + (self.player.strength - 1) * 5
+                max_dmg = 5 + (self.player.strength - 1) * 5
+                self.sword_swing_damage = random.randint(min_dmg, max_dmg)
+            self.sword_swing_hit_targets = set()
+            self.sword_sound.play()
+        if hasattr(self.player, "update_sword"):
+            self.player.update_sword(dt, len(self.sword_slash_imgs))
 
-                # Enemies - now allow sword to kill enemies and remove their hitbox
-                enemies_to_remove = set()
-                for i, enemy in enumerate(self.world.enemies):
-                    enemy_rect = enemy.draw_enemy() if hasattr(enemy, "draw_enemy") else pygame.Rect(enemy.x-20, enemy.y-30, 40, 60)
-                    if (
-                        hasattr(enemy, "hit_points")
-                        and sword_hitbox.colliderect(enemy_rect)
-                        and id(enemy) not in self.sword_swing_hit_targets
-                    ):
-                        damage = self.sword_swing_damage if self.sword_swing_damage is not None else random.randint(10, 15)
-                        enemy.hit_points -= damage
-                        show_damage_numbers(self, enemy.x, enemy.y - 40, damage)
-                        show_health_bar(self, enemy)
-                        self.sword_swing_hit_targets.add(id(enemy))
-                        self.slime_damage_sound.play()
-                        if enemy.hit_points <= 0:
-                            self.slime_death_sound.play()
-                            self.player.add_xp(getattr(enemy, "xp_reward", 5))
-                            # --- Drop logic ---
-                            drop_items = None
-                            if hasattr(enemy, "get_drop"):
-                                drop_items = enemy.get_drop()
-                            if drop_items:
-                                # drop_items is now a list, not a dict
-                                for drop_item in drop_items:
-                                    item_visual = drop_item.get("image", None)
-                                    self.dropped_items.append({
-                                        "item_data": drop_item,
-                                        "x": enemy.x,
-                                        "y": enemy.y,
-                                        "image": item_visual,
-                                        "rect": pygame.Rect(int(enemy.x-24), int(enemy.y-24), 48, 48)
-                                    })
-                            enemies_to_remove.add(i)
-                            # --- Track defeated enemy by initial position ---
-                            # Use initial positions from initial_enemy_positions_per_level
-                            initial_positions = self.initial_enemy_positions_per_level.get(self.level_index, [])
-                            # Find the closest initial position to this enemy
-                            min_dist = float('inf')
-                            closest_pos = None
-                            for pos in initial_positions:
-                                dist = math.hypot(enemy.x - pos[0], enemy.y - pos[1])
-                                if dist < min_dist:
-                                    min_dist = dist
-                                    closest_pos = pos
-                            if closest_pos is not None:
-                                defeated = self.defeated_enemies_per_level.setdefault(self.level_index, set())
-                                defeated.add(closest_pos)
-                # Remove defeated enemies and their hitboxes
-                self.world.enemies = [e for i, e in enumerate(self.world.enemies) if i not in enemies_to_remove]
-                self.enemy_bodies = [b for i, b in enumerate(self.enemy_bodies) if i not in enemies_to_remove]
-                self.enemy_shapes = [s for i, s in enumerate(self.enemy_shapes) if i not in enemies_to_remove]
+        # Fireball shooting logic (a bow in the main hand shoots arrows instead)
+        if shoot_fireball:
+            dx, dy = self.player.last_dir if hasattr(self.player, "last_dir") else (1, 0)
+            weapon = self.player.equipment.get("Main Hand")
+            aimed = dx != 0 or dy != 0
+            if aimed and getattr(weapon, "item_class", None) == "range":
+                # Weapon roll times a dexterity roll, like the sword's strength roll
+                min_dmg = 1 + (self.player.dexterity - 1) * 5
+                max_dmg = 5 + (self.player.dexterity - 1) * 5
+                arrow_damage = (weapon.get_attack_damage() or 1) * random.randint(min_dmg, max_dmg)
+                # Silent for now: textures/ has no bow sound yet (add an "arrow_sound" MANIFEST entry for one)
+                self.projectiles.spawn(ARROW, self.player.x, self.player.y, dx, dy, arrow_damage)
+            elif aimed:
+                fireball_cost = 20  # Mana cost to cast a fireball
+                if hasattr(self.player, "mana") and self.player.mana >= fireball_cost:
+                    weapon_magic = 1  # Default to 1 if not magic weapon
+                    if weapon is not None and hasattr(weapon, "get_magic_damage"):
+                        if getattr(weapon, "magic_min", 0) and getattr(weapon, "magic_max", 0):
+                            weapon_magic = weapon.get_magic_damage() or 1
+                    spell_damage = random.randint(self.player.intelligence * 10, self.player.intelligence * 10 + 9)
+                    fireball_damage = weapon_magic * spell_damage
+                    self.projectiles.spawn(FIREBALL, self.player.x, self.player.y, dx, dy, fireball_damage)
+                    self.player.mana -= fireball_cost
+                    if self.player.mana < 0:
+                        self.player.mana = 0
+                    self.cast_sound.play()
 
-            # Reset buffer only when animation ends
-            if hasattr(self.player, "sword_swinging") and not self.player.sword_swinging:
-                self.sword_swing_damage = None
-                self.sword_swing_hit_targets = set()
+        # --- Sword damage to targets and enemies ---
+        if hasattr(self.player, "sword_swinging") and self.player.sword_swinging:
+            # Calculate sword hitbox in front of player, facing the aim point or last direction
+            world_mx, world_my = aim
+            px, py = self.player.x, self.player.y
 
-            # --- Fireball update and combat ---
-            fireballs_to_remove = set()
-            enemies_to_remove = set()
-            for f_idx, fireball in enumerate(self.fireballs):
-                if hasattr(fireball, "exploding") and fireball.exploding:
-                    fireball.explosion_timer += dt
-                    if fireball.explosion_timer >= 0.05:
-                        fireball.explosion_timer = 0.0
-                        fireball.explosion_frame += 1
-                        if fireball.explosion_frame >= len(self.explosion_imgs):
-                            fireballs_to_remove.add(f_idx)
-                    continue
-                fireball.update(dt)
-                if not (0 <= fireball.x < self.world.w * 48 and 0 <= fireball.y < self.world.h * 48):
-                    if not fireball.exploding:
-                        fireball.exploding = True
-                        self.explosion_sound.play()
-                    continue
-                for i, enemy in enumerate(self.world.enemies):
-                    # Fix: correct ternary syntax for enemy_rect
-                    if hasattr(enemy, "draw_enemy"):
-                        enemy_rect = enemy.draw_enemy()
-                    else:
-                        enemy_rect = pygame.Rect(enemy.x-20, enemy.y-30, 40, 60)
-                    if fireball.rect().colliderect(enemy_rect):
-                        if not fireball.exploding:
-                            fireball.exploding = True
-                            self.explosion_sound.play()
-                        damage = fireball.damage  # <-- Use fireball's actual damage
-                        if hasattr(enemy, "hit_points"):
-                            enemy.hit_points -= damage
-                            show_damage_numbers(self, enemy.x, enemy.y - 40, damage)
-                            show_health_bar(self, enemy)
-                            self.slime_damage_sound.play()
-                            if enemy.hit_points <= 0:
-                                self.slime_death_sound.play()
-                                self.player.add_xp(getattr(enemy, "xp_reward", 5))
-                                # --- Drop logic ---
-                                drop_items = None
-                                if hasattr(enemy, "get_drop"):
-                                    drop_items = enemy.get_drop()
-                                if drop_items:
-                                    for drop_item in drop_items:
-                                        item_visual = drop_item.get("image", None)
-                                        self.dropped_items.append({
-                                            "item_data": drop_item,
-                                            "x": enemy.x,
-                                            "y": enemy.y,
-                                            "image": item_visual,
-                                            "rect": pygame.Rect(int(enemy.x-24), int(enemy.y-24), 48, 48)
-                                        })
-                                enemies_to_remove.add(i)
-                                # --- Track defeated enemy by initial position ---
-                                initial_positions = self.initial_enemy_positions_per_level.get(self.level_index, [])
-                                min_dist = float('inf')
-                                closest_pos = None
-                                for pos in initial_positions:
-                                    dist = math.hypot(enemy.x - pos[0], enemy.y - pos[1])
-                                    if dist < min_dist:
-                                        min_dist = dist
-                                        closest_pos = pos
-                                if closest_pos is not None:
-                                    defeated = self.defeated_enemies_per_level.setdefault(self.level_index, set())
-                                    defeated.add(closest_pos)
-                        break
-                else:
-                    for t_idx, target in enumerate(self.world.targets):
-                        if hasattr(target, "respawn_timer") and target.respawn_timer <= 0 and fireball.rect().colliderect(target.rect()):
-                            if not fireball.exploding:
-                                fireball.exploding = True
-                                self.explosion_sound.play()
-                            damage = fireball.damage  # <-- Use fireball's actual damage
-                            target.hit_points -= damage
-                            show_damage_numbers(self, target.x, target.y - 40, damage)
-                            show_health_bar(self, target)
-                            if target.hit_points <= 0:
-                                target.respawn_timer = 5.0
-                                self.world.remove_target_solid(target)
-                                target.hit_points = 300
-                            break
+            dx = world_mx - px
+            dy = world_my - py
+            mag = math.hypot(dx, dy)
+            if mag > 0:
+                dx /= mag
+                dy /= mag
+            else:
+                dx, dy = self.player.last_dir
 
-            self.fireballs = [f for i, f in enumerate(self.fireballs) if i not in fireballs_to_remove]
-            # Remove defeated enemies and their hitboxes in sync
-            if enemies_to_remove:
-                self.world.enemies = [e for i, e in enumerate(self.world.enemies) if i not in enemies_to_remove]
-                self.enemy_bodies = [b for i, b in enumerate(self.enemy_bodies) if i not in enemies_to_remove]
-                self.enemy_shapes = [s for i, s in enumerate(self.enemy_shapes) if i not in enemies_to_remove]
+            sword_w, sword_h = 48, 48
+            offset = 32
+            hitbox_x = px + dx * offset - sword_w // 2
+            hitbox_y = py + dy * offset - sword_h // 2
+            sword_hitbox = pygame.Rect(int(hitbox_x), int(hitbox_y), sword_w, sword_h)
 
-            # Update targets' respawn timers
-            for target in self.world.targets:
-                if target.respawn_timer > 0:
-                    target.respawn_timer -= dt
-                    if target.respawn_timer <= 0:
-                        self.world.add_target_solid(target)
+            # Each target or enemy is hit once per swing; resolve_hits() applies the damage
+            for target in self.world.target_grid.query(sword_hitbox):
+                if (
+                    target.respawn_timer <= 0
+                    and sword_hitbox.colliderect(target.rect())
+                    and target.entity_id not in self.sword_swing_hit_targets
+                ):
+                    damage = self.sword_swing_damage if self.sword_swing_damage is not None else random.randint(10, 15)
+                    queue_hit(self, target, damage)
+                    self.sword_swing_hit_targets.add(target.entity_id)
+            for enemy in self.world.enemy_grid.colliding(sword_hitbox):
+                if enemy.entity_id not in self.sword_swing_hit_targets:
+                    damage = self.sword_swing_damage if self.sword_swing_damage is not None else random.randint(10, 15)
+                    queue_hit(self, enemy, damage)
+                    self.sword_swing_hit_targets.add(enemy.entity_id)
 
-            # Camera update
-            self.camera.update(self.player.x, self.player.y, dt)
-            view = self.camera.view_rect()
+        # Reset buffer only when animation ends
+        if hasattr(self.player, "sword_swinging") and not self.player.sword_swinging:
+            self.sword_swing_damage = None
+            self.sword_swing_hit_targets = set()
+        self.profiler.mark("sword")
 
-            # --- DRAWING ---
-            draw_game_frame(self, dt)
-            # --- Dropped item pickup logic ---
-            player_rect = self.player.rect()
-            for dropped in self.dropped_items[:]:
-                keys = pygame.key.get_pressed()
-                if player_rect.colliderect(dropped["rect"]) and keys[pygame.K_e]:
-                    # Find first empty inventory slot
-                    for idx in range(len(self.player.inventory)):
-                        if self.player.inventory[idx] is None:
-                            from config.player import Item
-                            self.player.inventory[idx] = Item(**dropped["item_data"])
-                            break
-                    self.dropped_items.remove(dropped)
-            # Draw dropped items on ground with a shining effect and pickup hint
-            for dropped in self.dropped_items:
-                px, py = world_to_screen(dropped["x"], dropped["y"], self.camera.x, self.camera.y)
-                # Draw item image if available
-                if dropped["image"]:
-                    img = pygame.transform.scale(dropped["image"], (40, 40))
-                    self.screen.blit(img, (px - 20, py - 20))
-                else:
-                    # Always draw a circle for dropped items if no image
-                    pygame.draw.circle(self.screen, (255, 215, 0), (px, py), 20)
-                # --- Shining effect ---
-                shine_radius = 28
-                shine_alpha = int(128 + 64 * math.sin(pygame.time.get_ticks() / 300.0 + px + py))
-                shine_surface = pygame.Surface((shine_radius*2, shine_radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(shine_surface, (255, 255, 160, shine_alpha), (shine_radius, shine_radius), shine_radius)
-                self.screen.blit(shine_surface, (px - shine_radius, py - shine_radius), special_flags=pygame.BLEND_RGBA_ADD)
-                # --- Pickup hint ---
-                if player_rect.colliderect(dropped["rect"]):
-                    font = pygame.font.SysFont("arial", 22, bold=True)
-                    hint_surf = font.render("Press E to pick up", True, (255, 255, 160))
-                    # Draw hint just above the item
-                    self.screen.blit(hint_surf, (px - hint_surf.get_width() // 2, py - 44))
-                    # --- Draw fade message if present ---
-                    for dmg in self.damage_numbers:
-                        # Only check for string values before calling .startswith
-                        if isinstance(dmg.get("value", ""), str) and dmg.get("value", "").startswith("Level ") and abs(dmg["x"] - px) < 40 and abs(dmg["y"] - (py - 44)) < 40:
-                            msg_surf = font.render(str(dmg["value"]), True, dmg["color"])
-                            msg_surf.set_alpha(dmg["alpha"])
-                            self.screen.blit(msg_surf, (px - msg_surf.get_width() // 2, py - 72))
-            # Remove all other drawing code from the main loop!
+        # --- Projectile update ---
+        for projectile, hit in self.projectiles.update(dt, self.world, self.physics, len(self.explosion_imgs)):
+            if projectile.kind.explodes:
+                self.explosion_sound.play()
+            if hit is not None:  # otherwise a wall, the end of its range or the map edge
+                queue_hit(self, hit, projectile.damage)
 
-            mx, my = pygame.mouse.get_pos()
-            world_mx = mx + self.camera.x
-            world_my = my + self.camera.y
-            self.player.update_direction_towards(world_mx, world_my)
+        # --- Hit resolution: every hit queued this tick lands here ---
+        resolve_hits(self)
+        self.profiler.mark("fireball")
 
-            # Update health bars each frame
-            update_health_bars(self, dt)
-            # Draw health bars for targets
-            draw_health_bars(self, self.screen, self.camera)
+        # Update targets' respawn timers
+        for target in self.world.targets:
+            if target.respawn_timer > 0:
+                target.respawn_timer -= dt
+                if target.respawn_timer <= 0:
+                    self.physics.add_solid(self.world.add_target_solid(target))
 
-            # Example: check collision between player and each enemy manually
-            for i, enemy_shape in enumerate(self.enemy_shapes):
-                # Get positions
-                px, py = self.player_body.position
-                ex, ey = self.enemy_bodies[i].position
-                # Get radii
-                pr = self.player_shape.radius
-                er = enemy_shape.radius
-                # Check circle collision by distance
-                dist = math.hypot(px - ex, py - ey)
-                if dist < pr + er:
-                    print("Player collided with enemy!")
-                    # ...your logic...
+        # Camera update
+        self.camera.update(self.player.x, self.player.y, dt)
 
-            # You can add similar checks for other entities (torch, fireballs, etc.)
-            # Example for torch (if you add a pymunk shape for it):
-            # if self.player_shape.shapes_collide(self.torch_shape).points:
-            #     print("Player collided with torch!")
-            #     # ...your logic...
+        # --- Dropped item pickup logic ---
+        player_rect = self.player.rect()
+        for dropped in self.world.drop_grid.colliding(player_rect):
+            if keys[pygame.K_e]:
+                # Find first empty inventory slot
+                for idx in range(len(self.player.inventory)):
+                    if self.player.inventory[idx] is None:
+                        from config.player import Item
+                        self.player.inventory[idx] = Item(**dropped["item_data"])
+                        break
+                self.dropped_items.remove(dropped)
+                self.world.remove_drop(dropped)
+        self.player.update_direction_towards(aim[0], aim[1])
 
-            # --- Player movement ---
-            self.player.move_and_collide(dt, self.world.solids)
-            self.player_body.position = (self.player.x, self.player.y)
+        # Update health bars each frame
+        update_health_bars(self, dt)
+        # --- Player movement ---
+        self.player.move_and_collide(dt, self.physics, keys)
+        self.physics.move_player(self.player)
+        self.profiler.mark("player")
 
-            # --- Enemy movement and attack ---
-            slime_moving = False
-            # Remove old monster_target logic
-            # Instead, for each enemy, determine if player or torch is in visibility range
-            for i, enemy in enumerate(self.world.enemies):
-                prev_x, prev_y = enemy.x, enemy.y
-                other_enemy_rects = [e.draw_enemy() for j, e in enumerate(self.world.enemies) if j != i]
-                player_rect = self.player.rect()
-                # Determine target for each enemy
-                player_in_range = enemy.sees_target(self.player.x, self.player.y)
-                torch_in_range = False
-                torch_pos = self.torch_ground_pos
-                if self.torch_on_ground or self.torch_following:
-                    torch_x, torch_y = torch_pos
-                    torch_in_range = enemy.sees_target(torch_x, torch_y)
-                # Only chase if player or torch is in range
-                if player_in_range:
-                    monster_target = (self.player.x, self.player.y)
-                elif torch_in_range:
-                    monster_target = torch_pos
-                else:
-                    monster_target = (enemy.x, enemy.y)  # Idle
-                enemy.update(dt, monster_target, self.world.solids, player_rect, other_enemy_rects, player=self.player)
-                # Defensive: only update enemy_bodies if index exists
-                if i < len(self.enemy_bodies):
-                    self.enemy_bodies[i].position = (enemy.x, enemy.y)
-                if enemy.x != prev_x or enemy.y != prev_y:
-                    slime_moving = True
+        # --- Enemy movement and attack ---
+        slime_moving = self.update_enemies(dt)
+        # Contacts between the moved bodies are reported by the physics handlers
+        self.physics.step(dt)
+        self.profiler.mark("enemies")
 
-            
-            # --- Torch movement and wiggle logic ---
-            if self.torch_following:
-                # Smoothly move torch toward player, but cap movement per frame
-                px, py = self.player.x, self.player.y
-                tx, ty = self.torch_ground_pos
-                dx = px - tx
-                dy = py - ty
-                dist = math.hypot(dx, dy)
-                max_step = 320 * dt  # torch max speed (pixels/sec)
-                if dist > 0.5:
-                    step = min(dist, max_step)
-                    move_x = dx / dist * step
-                    move_y = dy / dist * step
-                    # Calculate next position
-                    next_tx = tx + move_x
-                    next_ty = ty + move_y
-                    torch_rect = pygame.Rect(int(next_tx - 8), int(next_ty - 16), 16, 32)
-                    player_rect = self.player.rect()
-                    # Prevent torch from entering player's hitbox in follow mode
-                    if torch_rect.collidepoint(player_rect.topleft):
-                        # Do not update torch position if it would collide
-                        pass
-                    else:
-                        self.torch_ground_pos = (next_tx, next_ty)
-                # Wiggle animation: update 8 times per second
-                self.torch_wiggle_timer += dt
-                if self.torch_wiggle_timer >= 0.125:
-                    self.torch_wiggle_timer = 0.0
-                    wiggle_x = random.randint(-4, 4)
-                    wiggle_y = random.randint(-4, 4)
-                    self.torch_wiggle_offset = (wiggle_x, wiggle_y)
-            elif self.torch_on_ground:
-                # Torch moves on its own when on ground
-                self.torch_move_timer += dt
-                if self.torch_move_timer > 2.0:
-                    self.torch_move_timer = 0.0
-                    self.torch_vel_x += random.uniform(-40, 40)
-                    self.torch_vel_y += random.uniform(-40, 40)
-                    speed = math.hypot(self.torch_vel_x, self.torch_vel_y)
-                    max_speed = 120.0
-                    if speed > max_speed:
-                        self.torch_vel_x *= max_speed / speed
-                        self.torch_vel_y *= max_speed / speed
-                orig_tx, orig_ty = self.torch_ground_pos
-                tx = orig_tx + self.torch_vel_x * dt
-                ty = orig_ty + self.torch_vel_y * dt
-                torch_rect = pygame.Rect(int(tx - 8), int(ty - 16), 16, 32)
-                collided = False
-                # Check collision with walls
-                for wall in self.world.solids:
-                    if torch_rect.colliderect(wall):
-                        collided = True
-                        break
-                # Prevent torch from entering player's hitbox (rect)
+        # --- Torch movement and wiggle logic ---
+        if self.torch_following:
+            # Smoothly move torch toward player, but cap movement per frame
+            px, py = self.player.x, self.player.y
+            tx, ty = self.torch_ground_pos
+            dx = px - tx
+            dy = py - ty
+            dist = math.hypot(dx, dy)
+            max_step = 320 * dt  # torch max speed (pixels/sec)
+            if dist > 0.5:
+                step = min(dist, max_step)
+                move_x = dx / dist * step
+                move_y = dy / dist * step
+                # Calculate next position
+                next_tx = tx + move_x
+                next_ty = ty + move_y
+                torch_rect = pygame.Rect(int(next_tx - 8), int(next_ty - 16), 16, 32)
                 player_rect = self.player.rect()
+                # Prevent torch from entering player's hitbox in follow mode
                 if torch_rect.collidepoint(player_rect.topleft):
-                    collided = True
-                    # Move torch back to previous position and bounce away
-                    # Calculate direction away from player center
-                    away_dx = tx - self.player.x
-                    away_dy = ty - self.player.y
-                    away_dist = math.hypot(away_dx, away_dy)
-                    if away_dist > 0:
-                        # Push torch away by the minimum amount to be outside player hitbox
-                        push_strength = max(self.player.w, self.player.h) // 2 + 8
-                        tx = self.player.x + (away_dx / away_dist) * (push_strength + 2)
-                        ty = self.player.y + (away_dy / away_dist) * (push_strength + 2)
-                    else:
-                        # If exactly overlapping, move torch directly up
-                        ty = self.player.y - (self.player.h // 2 + 8)
-                if not collided:
-                    self.torch_ground_pos = (tx, ty)
+                    # Do not update torch position if it would collide
+                    pass
+                else:
+                    self.torch_ground_pos = (next_tx, next_ty)
+            # Wiggle animation: update 8 times per second
+            self.torch_wiggle_timer += dt
+            if self.torch_wiggle_timer >= 0.125:
+                self.torch_wiggle_timer = 0.0
+                wiggle_x = random.randint(-4, 4)
+                wiggle_y = random.randint(-4, 4)
+                self.torch_wiggle_offset = (wiggle_x, wiggle_y)
+        elif self.torch_on_ground:
+            # Torch moves on its own when on ground
+            self.torch_move_timer += dt
+            if self.torch_move_timer > 2.0:
+                self.torch_move_timer = 0.0
+                self.torch_vel_x += random.uniform(-40, 40)
+                self.torch_vel_y += random.uniform(-40, 40)
+                speed = math.hypot(self.torch_vel_x, self.torch_vel_y)
+                max_speed = 120.0
+                if speed > max_speed:
+                    self.torch_vel_x *= max_speed / speed
+                    self.torch_vel_y *= max_speed / speed
+            orig_tx, orig_ty = self.torch_ground_pos
+            tx = orig_tx + self.torch_vel_x * dt
+            ty = orig_ty + self.torch_vel_y * dt
+            torch_rect = pygame.Rect(int(tx - 8), int(ty - 16), 16, 32)
+            # Check collision with walls
+            collided = self.physics.blocked(torch_rect)
+            # Prevent torch from entering player's hitbox (rect)
+            player_rect = self.player.rect()
+            if torch_rect.collidepoint(player_rect.topleft):
+                collided = True
+                # Move torch back to previous position and bounce away
+                # Calculate direction away from player center
+                away_dx = tx - self.player.x
+                away_dy = ty - self.player.y
+                away_dist = math.hypot(away_dx, away_dy)
+                if away_dist > 0:
+                    # Push torch away by the minimum amount to be outside player hitbox
+                    push_strength = max(self.player.w, self.player.h) // 2 + 8
+                    tx = self.player.x + (away_dx / away_dist) * (push_strength + 2)
+                    ty = self.player.y + (away_dy / away_dist) * (push_strength + 2)
                 else:
-                    self.torch_ground_pos = (tx, ty)
-                    self.torch_vel_x = -self.torch_vel_x * 0.8
-                    self.torch_vel_y = -self.torch_vel_y * 0.8
+                    # If exactly overlapping, move torch directly up
+                    ty = self.player.y - (self.player.h // 2 + 8)
+            if not collided:
+                self.torch_ground_pos = (tx, ty)
+            else:
+                self.torch_ground_pos = (tx, ty)
+                self.torch_vel_x = -self.torch_vel_x * 0.8
+                self.torch_vel_y = -self.torch_vel_y * 0.8
+        self.profiler.mark("torch")
+
+    def snapshot_positions(self):
+        """Remember where moving things were before the last tick so render() can interpolate."""
+        self.prev_positions = {id(obj): (obj, obj.x, obj.y) for obj in self.interpolated_objects()}
+
+    def interpolated_objects(self):
+        """Everything whose x/y is blended between ticks when rendering."""
+        yield self.camera
+        yield self.player
+        # Only enemies near the view are drawn, so only those are moved. This runs
+        # lazily, after the loop in interpolated() has already moved the camera.
+        yield from ViewCuller(self.camera).query(self.world.enemy_grid)
+        yield from self.projectiles
+
+    @contextmanager
+    def interpolated(self, alpha):
+        """Temporarily move entities between their previous and current tick positions."""
+        current = []
+        prev_positions = self.prev_positions
+        for obj in self.interpolated_objects():
+            prev = prev_positions.get(id(obj))
+            if prev is None or prev[0] is not obj:
+                continue  # spawned since the last snapshot
+            x, y = obj.x, obj.y
+            current.append((obj, x, y))
+            obj.x = prev[1] + (x - prev[1]) * alpha
+            obj.y = prev[2] + (y - prev[2]) * alpha
+        try:
+            yield
+        finally:
+            for obj, x, y in current:
+                obj.x, obj.y = x, y
+
+    def render(self, alpha, dt):
+        """Draw one frame, interpolated alpha of the way into the current tick."""
+        with self.interpolated(alpha):
+            draw_game_frame(self, dt)
+        self.assets.first_frame()
 
     def player_near_torch(self):
         if self.torch_on_ground or self.torch_following:
@@ -0,0 +1,209 @@
+"""Frame-loop benchmarks: python -m benchmarks [--scenario NAME] [--phase NAME] [--out FILE]
+
+Times the per-frame hot paths against synthetic levels (see scenarios.py) with
+the SDL dummy drivers and prints one JSON document, so runs on two commits can
+be diffed. Allocation numbers come from tracemalloc and only cover Python-side
+allocations; pixel buffers allocated by SDL are not included.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Textures and sounds are loaded relative to the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # the banner would go to stdout, ahead of the JSON
+
+import random
+import pygame
+from config.config import SIM_DT
+from config.utils import draw_light_mask
+from config.render import draw_game_frame, draw_inventory_overlay
+from benchmarks.scenarios import SCENARIOS, install, scenario_by_name
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def phases(game):
+    """name -> (callable, default repeat) for every hot path we track."""
+    world = game.world
+    camera = game.camera
+    screen = game.screen
+
+    def world_draw():
+        world.draw(screen, camera.x, camera.y, camera.view_rect())
+
+    def game_frame():
+        draw_game_frame(game, SIM_DT)
+
+    def render():
+        # draw_game_frame plus interpolation, dropped items and health bars
+        game.render(0.5, SIM_DT)
+
+    def enemy_update():
+        game.update_enemies(SIM_DT)
+
+    def projectile_sweep():
+        # The swept hit test Game.step does for every live projectile, without moving them
+        pool = game.projectiles
+        for projectile in pool:
+            step = projectile.kind.speed * SIM_DT
+            pool.sweep(projectile, projectile.x, projectile.y,
+                       projectile.x + projectile.dx * step, projectile.y + projectile.dy * step, world, game.physics)
+
+    def light_mask_full():
+        draw_light_mask((screen.get_width() // 2, screen.get_height() // 2), 80)
+
+    def light_mask_cached():
+        game.get_light_mask(game.torch_glow_radius)
+
+    bench_lights = [((160 + 55 * i, 200 + 23 * (i % 30)), 80 if i % 3 else 180, i % 3 == 0) for i in range(32)]
+
+    def lighting():
+        # Darkness pass with 32 lights
+        game.lighting.render(screen, game.darkness_alpha, bench_lights)
+
+    def inventory_overlay():
+        draw_inventory_overlay(game, 0)
+
+    return {
+        "world_draw": (world_draw, 200),
+        "draw_game_frame": (game_frame, 20),
+        "render": (render, 20),
+        "enemy_update": (enemy_update, 200),
+        "projectile_sweep": (projectile_sweep, 2000),
+        "draw_light_mask": (light_mask_full, 20),
+        "get_light_mask": (light_mask_cached, 2000),
+        "lighting": (lighting, 100),
+        "draw_inventory_overlay": (inventory_overlay, 20),
+    }
+
+
+def time_phase(fn, repeat, warmup=3):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    ms = [s * 1000.0 for s in samples]
+    return {
+        "repeat": repeat,
+        "min_ms": round(ms[0], 4),
+        "median_ms": round(statistics.median(ms), 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 4),
+        "max_ms": round(ms[-1], 4),
+    }
+
+
+def measure_allocations(fn, calls=5):
+    """Python-side allocations per call: bytes still held afterwards, peak and block count."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        for _ in range(calls):
+            fn()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return {
+        "alloc_net_bytes": (current - base) // calls,
+        "alloc_peak_bytes": peak - base,
+        "alloc_blocks": blocks // calls,
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_scenario(game, scenario, seed, repeat_scale, only):
+    install(game, scenario, seed)
+    random.seed(seed)
+    result = scenario.describe()
+    result["enemies_loaded"] = len(game.world.enemies)
+    result["phases"] = {}
+    for name, (fn, repeat) in phases(game).items():
+        if only and name not in only:
+            continue
+        repeat = max(1, int(repeat * repeat_scale))
+        stats = time_phase(fn, repeat)
+        stats.update(measure_allocations(fn))
+        result["phases"][name] = stats
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Time the frame-loop hot paths headless.")
+    parser.add_argument("--scenario", action="append", help="scenario name (repeatable, default: all)")
+    parser.add_argument("--phase", action="append", help="only run this phase (repeatable)")
+    parser.add_argument("--repeat-scale", type=float, default=1.0, help="multiply every phase's repeat count")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="also write the JSON report to this file")
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS:
+            print(scenario.name, json.dumps(scenario.describe()))
+        return 0
+
+    scenarios = [scenario_by_name(name) for name in args.scenario] if args.scenario else SCENARIOS
+    random.seed(args.seed)
+    from Game import Game
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": numpy.__version__ if numpy is not None else None,
+            "video_driver": None,
+            "seed": args.seed,
+        },
+        "scenarios": {},
+    }
+    # stdout is only for the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game(headless=True)
+        report["meta"]["video_driver"] = pygame.display.get_driver()
+        for scenario in scenarios:
+            report["scenarios"][scenario.name] = run_scenario(game, scenario, args.seed, args.repeat_scale, args.phase)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
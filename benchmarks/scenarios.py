@@ -0,0 +1,110 @@
+import math
+import random
+import pygame
+import config.config as game_config
+from config.config import WIN_W, WIN_H, TILE_SIZE
+from config.projectiles import FIREBALL
+
+BENCH_LEVEL_KEY = "LEVEL_BENCH"
+
+
+class Scenario:
+    """A synthetic level: map size, how many slimes, drops and fireballs to put in it."""
+
+    def __init__(self, name, width, height, enemies, drops=0, fireballs=8, pillars=0.02):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.enemies = enemies
+        self.drops = drops
+        self.fireballs = fireballs
+        self.pillars = pillars  # fraction of interior tiles that are walls
+
+    def layout(self, rng: random.Random) -> list[str]:
+        """Walled map with scattered pillars, a door in the top wall and '0' slime spawns."""
+        w, h = self.width, self.height
+        rows = [["#"] * w]
+        for _ in range(1, h - 1):
+            row = ["#"] + ["."] * (w - 2) + ["#"]
+            rows.append(row)
+        rows.append(["#"] * w)
+        rows[0][w // 2] = "7"
+        floor = [(x, y) for y in range(2, h - 1) for x in range(1, w - 1)]
+        rng.shuffle(floor)
+        cx, cy = w // 2, h // 2
+        # Keep the player's spawn area around the centre clear
+        floor = [(x, y) for x, y in floor if abs(x - cx) > 2 or abs(y - cy) > 2]
+        pillar_count = int(len(floor) * self.pillars)
+        for x, y in floor[:pillar_count]:
+            rows[y][x] = "#"
+        spawns = floor[pillar_count:pillar_count + self.enemies]
+        for x, y in spawns:
+            rows[y][x] = "0"
+        return ["".join(row) for row in rows]
+
+    def describe(self) -> dict:
+        return {
+            "map": [self.width, self.height],
+            "enemies": self.enemies,
+            "drops": self.drops,
+            "fireballs": self.fireballs,
+        }
+
+
+SCENARIOS = [
+    Scenario("enemies_10", 40, 24, enemies=10),
+    Scenario("enemies_100", 80, 48, enemies=100),
+    Scenario("enemies_1000", 160, 96, enemies=1000),
+    Scenario("drops_500", 60, 40, enemies=10, drops=500),
+    Scenario("projectiles_500", 80, 48, enemies=100, fireballs=500),
+    Scenario("wide_5000", 400, 240, enemies=5000),  # big map, most enemies far from the player
+]
+
+
+def scenario_by_name(name: str) -> Scenario:
+    for scenario in SCENARIOS:
+        if scenario.name == name:
+            return scenario
+    raise KeyError(f"unknown scenario {name!r} (have {', '.join(s.name for s in SCENARIOS)})")
+
+
+def install(game, scenario: Scenario, seed: int = 0) -> None:
+    """Load the scenario into a headless Game through the normal load_level path."""
+    rng = random.Random(seed)
+    setattr(game_config, BENCH_LEVEL_KEY, scenario.layout(rng))
+    level_keys = sorted(k for k in dir(game_config) if k.startswith("LEVEL_"))
+    game.level_index = level_keys.index(BENCH_LEVEL_KEY)
+    game.load_level(game.level_index)
+    # Full-size back buffer so the draw phases do the real amount of work
+    game.screen = pygame.display.set_mode((WIN_W, WIN_H))
+
+    game.player.x = scenario.width // 2 * TILE_SIZE + TILE_SIZE / 2
+    game.player.y = scenario.height // 2 * TILE_SIZE + TILE_SIZE / 2
+    game.physics.move_player(game.player)
+    game.camera.x = game.player.x - WIN_W / 2
+    game.camera.y = game.player.y - WIN_H / 2
+    game.torch_ground_pos = (game.player.x + 60, game.player.y)
+
+    world_w = scenario.width * TILE_SIZE
+    world_h = scenario.height * TILE_SIZE
+    game.dropped_items = []
+    for _ in range(scenario.drops):
+        x = rng.uniform(TILE_SIZE, world_w - TILE_SIZE)
+        y = rng.uniform(TILE_SIZE, world_h - TILE_SIZE)
+        dropped = {
+            "item_data": {"name": "Bench Item", "level": 1},
+            "x": x,
+            "y": y,
+            "image": None,
+            "rect": pygame.Rect(int(x - 24), int(y - 24), 48, 48),
+        }
+        game.dropped_items.append(dropped)
+        game.world.add_drop(dropped)
+
+    # Fireballs fanned out around the player, inside the view
+    game.projectiles.clear()
+    for i in range(scenario.fireballs):
+        angle = 2 * math.pi * i / max(1, scenario.fireballs)
+        dx, dy = math.cos(angle), math.sin(angle)
+        game.projectiles.spawn(FIREBALL, game.player.x + dx * 200, game.player.y + dy * 200, dx, dy, 10)
+    game.snapshot_positions()
@@ -0,0 +1,54 @@
+"""Build the asset pack the game memory-maps at startup (config.config.ASSET_PACK).
+
+    python build_pack.py [--out assets.pack] [--no-sounds]
+
+Every image in config/assets.py MANIFEST is stored decoded, scaled and in the
+display pixel layout, and every sound as raw mixer samples, so a launch skips
+PNG/MP3 decoding entirely. Rebuild after changing textures; entries whose
+source files changed are ignored by the game until then.
+"""
+import argparse
+import os
+import sys
+import time
+
+# Textures and sounds are loaded relative to the repo root
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config.config import ASSET_PACK
+from config.assets import MANIFEST
+from config.asset_pack import build_pack
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-decode the game's images and sounds into one pack file.")
+    parser.add_argument("--out", default=ASSET_PACK, help=f"pack file to write (default {ASSET_PACK})")
+    parser.add_argument("--no-sounds", action="store_true", help="leave sounds out; the game decodes them from the MP3s")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    # convert_alpha() needs a display mode; the mixer settings must match Game's pygame.mixer.init()
+    pygame.display.set_mode((1, 1))
+    sounds = not args.no_sounds
+    if sounds:
+        pygame.mixer.init()
+
+    start = time.perf_counter()
+    index = build_pack(MANIFEST, args.out, sounds=sounds)
+    entries = index["assets"].values()
+    frames = sum(len(entry.get("frames", ())) for entry in entries)
+    samples = sum(1 for entry in entries if "sound" in entry)
+    size_mb = os.path.getsize(args.out) / (1024 * 1024)
+    print(
+        f"Wrote {args.out}: {frames} images, {samples} sounds, {size_mb:.1f} MB "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
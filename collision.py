@@ -12,8 +12,14 @@ class Hitbox:
         hitbox_surface.fill(self.color)
         surface.blit(hitbox_surface, (x, y))
 
+def _nearby(entity_hitboxes, rect):
+    # Hitboxes may be kept in a SpatialHash; then only the cells around rect are visited
+    if hasattr(entity_hitboxes, "query"):
+        return entity_hitboxes.query(rect)
+    return entity_hitboxes
+
 def check_entity_collision(proposed_rect, entity_hitboxes, ignore_rect=None):
-    for hitbox in entity_hitboxes:
+    for hitbox in _nearby(entity_hitboxes, proposed_rect):
         if ignore_rect is not None and hitbox.rect == ignore_rect:
             continue
         if proposed_rect.colliderect(hitbox.rect):
@@ -22,7 +28,7 @@ def check_entity_collision(proposed_rect, entity_hitboxes, ignore_rect=None):
 
 def resolve_enemy_collision(enemy, entity_hitboxes):
     enemy_rect = enemy.draw_enemy()
-    for hitbox in entity_hitboxes:
+    for hitbox in _nearby(entity_hitboxes, enemy_rect):
         if hitbox.rect == enemy_rect:
             continue
         if enemy_rect.colliderect(hitbox.rect):
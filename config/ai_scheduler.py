@@ -0,0 +1,199 @@
+import time
+import pygame
+from config.config import (
+    AI_LOD, AI_NEAR_RADIUS, AI_MID_RADIUS, AI_MID_INTERVAL, AI_BUDGET_UPDATES, AI_MAX_DT, AI_SECTOR_SIZE,
+)
+from config.spatial import SpatialHash
+
+# Level-of-detail tiers reported in AIScheduler.stats
+NEAR, MID, ASLEEP = "near", "mid", "asleep"
+
+
+class AIScheduler:
+    """Decides which enemies think on a tick, by distance to what the player can notice.
+
+    Points of interest are the player, the camera centre and the torch while it
+    is out. Enemies within AI_NEAR_RADIUS of one (or within their own
+    visibility_range) update every tick. Out to AI_MID_RADIUS they update every
+    AI_MID_INTERVAL ticks, staggered by id so the work spreads evenly, and are
+    handed all the time since their last update in one go. Anything further
+    sleeps: it is never even visited, because candidates come from a query of
+    sectors (a coarse SpatialHash of enemy positions that only woken enemies
+    ever move in) around the points, and it wakes into the mid tier once a
+    point comes within AI_MID_RADIUS - well before it could see anything.
+
+    Tiers are worked out every AI_MID_INTERVAL ticks, so a tick only touches
+    the near enemies and one slot of the mid-range ones. Near enemies always
+    run; mid-range ones fill the rest of the budget and the others wait for a
+    later tick, most overdue first. The budget is a number of updates
+    (budget_updates), not measured time, so which enemies run depends only on
+    the game state and seeded runs stay reproducible; None lifts it.
+
+    budget_ms optionally also caps the updates by measured time: the mean cost
+    of an update over the last ticks says how many fit. That makes the result
+    depend on the machine, so it is off by default and headless runs never set it.
+    """
+
+    def __init__(self, lod: bool = AI_LOD, budget_updates: int = AI_BUDGET_UPDATES, budget_ms: float = None):
+        self.lod = lod
+        self.budget_updates = budget_updates  # enemy updates per tick, or None for no limit
+        self.budget_ms = budget_ms  # measured AI time per tick, or None to only count updates
+        self.update_ms = None  # running mean time of one enemy update, from finish()
+        self.tick = 0
+        self.clock = 0.0  # simulated seconds, summed from the dt of every schedule()
+        self.sectors = SpatialHash(AI_SECTOR_SIZE)  # every enemy of the world, by position
+        self.near: list[tuple[int, object]] = []  # (entity id, enemy), from the last classify()
+        self.mid_slots: list[list] = [[] for _ in range(AI_MID_INTERVAL)]  # mid-range enemies by entity id % interval
+        self.late: list[tuple[int, object]] = []  # mid-range enemies the budget held back
+        self.last: dict[int, float] = {}  # entity id -> clock at its last update, for awake enemies
+        self.stats = {NEAR: 0, MID: 0, ASLEEP: 0, "updated": 0, "deferred": 0, "ms": 0.0}
+        self._world = None
+        self._spawned = 0  # world.enemies_spawned when sectors was last filled
+        self._due: list = []
+        self._start = 0.0
+
+    def reset(self) -> None:
+        """Forget the last level's enemies (entity ids start over with a new world)."""
+        self.sectors.clear()
+        self.near = []
+        self.mid_slots = [[] for _ in range(AI_MID_INTERVAL)]
+        self.late = []
+        self.last.clear()
+        self._world = None
+        self._spawned = 0
+
+    def points(self, game) -> list[tuple[float, float]]:
+        camera = game.camera
+        view = camera.view_rect()
+        points = [(game.player.x, game.player.y), (camera.x + view.w / 2, camera.y + view.h / 2)]
+        if game.torch_on_ground or game.torch_following:
+            points.append(game.torch_ground_pos)
+        return points
+
+    # --- Tiers ---
+    def gather(self, world, points) -> dict[int, object]:
+        """Live enemies within AI_MID_RADIUS (as a box) of any point, by entity id."""
+        sectors = self.sectors
+        enemies = world.enemies
+        # Killed enemies drop out below; any enemy added since the last fill means a refill
+        if world is not self._world or world.enemies_spawned != self._spawned:
+            self._world = world
+            self._spawned = world.enemies_spawned
+            sectors.clear()
+            for enemy in enemies:
+                sectors.insert(enemy, pygame.Rect(int(enemy.x), int(enemy.y), 1, 1))
+        reach = AI_MID_RADIUS
+        boxes = []
+        for x, y in points:
+            box = pygame.Rect(int(x - reach), int(y - reach), reach * 2, reach * 2)
+            # The camera trails the player, so their boxes nearly coincide: query the union once
+            for i, other in enumerate(boxes):
+                if other.colliderect(box):
+                    boxes[i] = other.union(box)
+                    break
+            else:
+                boxes.append(box)
+        table = world.enemy_table
+        nearby = {}
+        for box in boxes:
+            for enemy in sectors.query(box):
+                if enemy.entity_id in table:
+                    nearby[enemy.entity_id] = enemy
+                else:
+                    sectors.remove(enemy)  # killed
+        return nearby
+
+    def classify(self, world, points, woken_at: float) -> None:
+        """Sort the gathered enemies into near and mid-range slots; the rest are asleep.
+
+        An enemy that just woke counts as last updated at woken_at: the time it slept is not caught up.
+        """
+        mid_sq = AI_MID_RADIUS * AI_MID_RADIUS
+        interval = AI_MID_INTERVAL
+        near = []
+        mid_slots = [[] for _ in range(interval)]
+        mid = 0
+        last = {}
+        old_last = self.last
+        for entity_id, enemy in self.gather(world, points).items():
+            ex, ey = enemy.x, enemy.y
+            dist_sq = None
+            for x, y in points:
+                d = (ex - x) * (ex - x) + (ey - y) * (ey - y)
+                if dist_sq is None or d < dist_sq:
+                    dist_sq = d
+            near_radius = max(AI_NEAR_RADIUS, enemy.visibility_range)
+            if dist_sq <= near_radius * near_radius:
+                near.append((entity_id, enemy))
+            elif dist_sq <= mid_sq:
+                mid_slots[entity_id % interval].append((entity_id, enemy))
+                mid += 1
+            else:
+                continue  # in a box corner, outside the circle: still asleep
+            last[entity_id] = old_last.get(entity_id, woken_at)
+        self.near = near
+        self.mid_slots = mid_slots
+        self.late = []  # they are back in near or a slot, and keep their last update time
+        self.last = last
+        self.stats.update({NEAR: len(near), MID: mid, ASLEEP: len(world.enemies) - len(near) - mid})
+
+    # --- Scheduling ---
+    def schedule(self, world, points, dt: float) -> list[tuple[int, object, float]]:
+        """(index in world.enemies, enemy, dt to update it by) for every enemy that thinks this tick."""
+        self._start = time.perf_counter()
+        self.tick += 1
+        self.clock += dt
+        enemies = world.enemies
+        if not self.lod:
+            self.stats.update({NEAR: len(enemies), MID: 0, ASLEEP: 0, "deferred": 0})
+            return [(i, enemy, dt) for i, enemy in enumerate(enemies)]
+
+        if world is not self._world or self.tick % AI_MID_INTERVAL == 0:
+            self.classify(world, points, self.clock - dt)
+        mids = self.mid_slots[self.tick % AI_MID_INTERVAL]
+        if self.late:
+            held = {entity_id for entity_id, enemy in self.late}
+            mids = self.late + [entry for entry in mids if entry[0] not in held]
+
+        # --- Budget: every near enemy, then as many mid-range ones as fit, most overdue first ---
+        last = self.last
+        self.late = []
+        budget = self.budget_updates
+        if self.budget_ms is not None and self.update_ms:
+            fit = int(self.budget_ms / self.update_ms)
+            budget = fit if budget is None else min(budget, fit)
+        if budget is not None:
+            # At least one, so the mid tier never starves behind a crowd of near enemies
+            room = max(1, budget - len(self.near))
+            if len(mids) > room:
+                mids = sorted(mids, key=lambda entry: last[entry[0]])
+                self.late = mids[room:]
+                mids = mids[:room]
+
+        table = world.enemy_table
+        clock = self.clock
+        due = []
+        for tier in (self.near, mids):
+            for entity_id, enemy in tier:
+                index = table.index(entity_id)
+                if index is None:
+                    continue  # killed since it was classified
+                due.append((index, enemy, min(clock - last[entity_id], AI_MAX_DT)))
+                last[entity_id] = clock
+        self.stats["deferred"] = len(self.late)
+        self._due = due
+        return due
+
+    def finish(self, updated: int) -> None:
+        """Record this tick's AI time (since schedule()) and how many enemies it updated."""
+        ms = (time.perf_counter() - self._start) * 1000
+        self.stats["ms"] = ms
+        self.stats["updated"] = updated
+        if updated:
+            cost = ms / updated
+            self.update_ms = cost if self.update_ms is None else self.update_ms * 0.9 + cost * 0.1
+        # Only enemies that were updated can have moved to another sector
+        sectors = self.sectors
+        for index, enemy, enemy_dt in self._due:
+            sectors.move(enemy, pygame.Rect(int(enemy.x), int(enemy.y), 1, 1))
+        self._due = []
@@ -0,0 +1,143 @@
+import json
+import mmap
+import os
+import struct
+import pygame
+from config.log import get_logger
+
+log = get_logger("assets")
+
+# Pack layout: header, then 64-byte aligned pixel/sample blobs, then a JSON index.
+# Header: magic, index offset, index length (little-endian).
+PACK_MAGIC = b"BKPACK\x00\x01"
+_HEADER = struct.Struct("<8sQQ")
+_ALIGN = 64
+# Byte order of a convert_alpha() surface with (R, G, B, A) masks (0xff0000, 0xff00, 0xff, 0xff000000)
+PIXEL_FORMAT = "BGRA"
+
+
+def spec_key(spec) -> list:
+    """What an entry was built from; a pack entry whose key differs from the manifest is ignored."""
+    return [spec.kind, spec.paths, list(spec.size) if spec.size else None]
+
+
+def source_stamps(spec) -> list:
+    stamps = []
+    for path in spec.paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamps.append([st.st_mtime_ns, st.st_size])
+    return stamps
+
+
+def _pad(f) -> int:
+    offset = f.tell()
+    if offset % _ALIGN:
+        f.write(b"\0" * (_ALIGN - offset % _ALIGN))
+    return f.tell()
+
+
+def build_pack(manifest, path: str, sounds: bool = True) -> dict:
+    """Decode, scale and convert every asset in manifest and write them to one pack file.
+
+    Needs a display mode (for convert_alpha) and, for sounds, an initialized mixer
+    whose format is recorded so the game can tell whether the samples fit its own.
+    Returns the index that was written.
+    """
+    index = {
+        "pixel_format": PIXEL_FORMAT,
+        "masks": list(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()),
+        "mixer": list(pygame.mixer.get_init() or ()) if sounds else None,
+        "assets": {},
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, 0, 0))
+        for spec in manifest:
+            entry = {"key": spec_key(spec), "stamps": source_stamps(spec)}
+            if entry["stamps"] is None:
+                # Optional file that does not exist: record it so the game skips straight to the fallback
+                if spec.fallback is None:
+                    raise FileNotFoundError(f"{spec.name}: missing {spec.paths}")
+                entry["missing"] = True
+            elif spec.kind == "sound":
+                if not sounds:
+                    continue
+                raw = pygame.mixer.Sound(spec.paths[0]).get_raw()
+                entry["sound"] = [_pad(f), len(raw)]
+                f.write(raw)
+            else:
+                frames = []
+                for src in spec.paths:
+                    surf = pygame.image.load(src).convert_alpha()
+                    if spec.size is not None:
+                        surf = pygame.transform.scale(surf, spec.size)
+                    frames.append([_pad(f), surf.get_width(), surf.get_height()])
+                    f.write(pygame.image.tobytes(surf, PIXEL_FORMAT))
+                entry["frames"] = frames
+            index["assets"][spec.name] = entry
+        index_offset = f.tell()
+        data = json.dumps(index).encode("utf-8")
+        f.write(data)
+        f.seek(0)
+        f.write(_HEADER.pack(PACK_MAGIC, index_offset, len(data)))
+    os.replace(tmp_path, path)
+    return index
+
+
+class AssetPack:
+    """Read side of build_pack: surfaces that point straight into a memory-mapped pack.
+
+    Pixels are stored already scaled and in the display's convert_alpha() layout,
+    so an image is pygame.image.frombuffer over the mapping: no decoding and no
+    copy. The mapping is private copy-on-write, so a sprite drawn on in place
+    only copies the pages it touches.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, index_offset, index_length = _HEADER.unpack_from(self.map, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{path} is not an asset pack")
+        self.index = json.loads(self.map[index_offset:index_offset + index_length])
+        self.view = memoryview(self.map)
+        display_masks = list(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks())
+        self.native = self.index["pixel_format"] == PIXEL_FORMAT and self.index["masks"] == display_masks
+
+    @classmethod
+    def open(cls, path: str):
+        """AssetPack for path, or None if there is no (readable) pack there."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("Ignoring asset pack %s: %s", path, e)
+            return None
+
+    def entry(self, spec):
+        """The pack entry for spec, or None when it is missing or older than the source files."""
+        entry = self.index["assets"].get(spec.name)
+        if entry is None or entry["key"] != spec_key(spec):
+            return None
+        stamps = source_stamps(spec)
+        # Without the loose files (a pack-only install) the pack is all there is
+        if stamps is not None and stamps != entry["stamps"]:
+            return None
+        if "sound" in entry and self.index["mixer"] != list(pygame.mixer.get_init() or ()):
+            return None  # samples are in another mixer format
+        return entry
+
+    def surfaces(self, entry) -> list[pygame.Surface]:
+        frames = []
+        for offset, width, height in entry["frames"]:
+            frames.append(pygame.image.frombuffer(self.view[offset:offset + width * height * 4], (width, height), PIXEL_FORMAT))
+        return frames
+
+    def sound(self, entry) -> pygame.mixer.Sound:
+        offset, length = entry["sound"]
+        return pygame.mixer.Sound(buffer=self.view[offset:offset + length])
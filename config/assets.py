@@ -0,0 +1,269 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import pygame
+from config.config import ASSET_WORKERS, ASSET_PACK, TILE_SIZE
+from config.asset_pack import AssetPack
+from config.utils import SilentSound
+from config.log import get_logger
+
+log = get_logger("assets")
+
+
+class AssetSpec:
+    """A named asset: one file or a numbered sequence of frames, its kind and draw size."""
+
+    def __init__(self, name, paths, kind="image", size=None, priority=1, fallback=None):
+        self.name = name
+        self.sequence = not isinstance(paths, str)
+        self.paths = list(paths) if self.sequence else [paths]
+        self.kind = kind  # "image" (per-pixel alpha), "opaque" (no alpha) or "sound"
+        self.size = size
+        self.priority = priority  # 0 = needed for the first frame; higher numbers load later
+        self.fallback = fallback  # asset to use when a file is missing; None means required
+
+
+def frames(pattern: str, count: int = 8) -> list[str]:
+    return [pattern.format(i) for i in range(1, count + 1)]
+
+
+MANIFEST = [
+    # --- Priority 0: the player, the map and the HUD, drawn on every frame ---
+    AssetSpec("wall", "textures/map/wall.jpg", "opaque", (TILE_SIZE, TILE_SIZE), priority=0),
+    AssetSpec("ground", "textures/map/ground.png", "opaque", (TILE_SIZE, TILE_SIZE), priority=0),
+    AssetSpec("player_front", frames("textures/player_movement/front{}.png"), size=(40, 60), priority=0),
+    AssetSpec("player_back", frames("textures/player_movement/back{}.png"), size=(40, 60), priority=0),
+    AssetSpec("player_right", frames("textures/player_movement/right{}.png"), size=(40, 60), priority=0),
+    AssetSpec("player_left", frames("textures/player_movement/left{}.png"), size=(40, 60), priority=0),
+    AssetSpec("sword", "textures/sword/sword.png", size=(80, 80), priority=0),
+    AssetSpec("torch", "textures/torch/torch.png", size=(30, 60), priority=0),
+    # --- Priority 1: level sprites (raised to 0 by level_assets) and effects ---
+    AssetSpec("monster", "textures/NPC/slime/monster.png", size=(40, 60)),
+    AssetSpec("monster_alt", "textures/NPC/slime/monster_alt.png", size=(40, 60), fallback="monster"),
+    AssetSpec("monster_boss", "textures/NPC/slime/monster_boss.png", size=(40, 60), fallback="monster"),
+    AssetSpec("target", "textures/NPC/target/target.png", size=(40, 60)),
+    AssetSpec("target_alt", "textures/NPC/target/target_alt.png", size=(40, 60), fallback="target"),
+    AssetSpec("door_closed", "textures/door/door_closed.png", size=(48, 72)),
+    AssetSpec("door_open", "textures/door/door_open.png", size=(48, 72)),
+    AssetSpec("sword_slash", frames("textures/sword/sword_slash{}.png"), size=(60, 60)),
+    AssetSpec("fireball", "textures/effects/fireball/fireball.png", size=(40, 20)),
+    AssetSpec("explosion", frames("textures/effects/fireball_explosion/explosion{}.png"), size=(60, 60)),
+    AssetSpec("sword_sound", "textures/sword/sword_sound.mp3", "sound"),
+    AssetSpec("cast_sound", "textures/effects/fireball/cast.mp3", "sound"),
+    AssetSpec("explosion_sound", "textures/effects/fireball_explosion/explosion.mp3", "sound"),
+    AssetSpec("slime_damage_sound", "textures/NPC/slime/slime_damage.mp3", "sound"),
+    AssetSpec("slime_death_sound", "textures/NPC/slime/slime_death.mp3", "sound"),
+    AssetSpec("slime_moving_sound", "textures/NPC/slime/slime_moving.mp3", "sound"),
+    # --- Priority 2: only needed on some levels, or not drawn at all yet ---
+    AssetSpec("skeleton_walk", frames("textures/NPC/skeleton/skeleton_walk{}.png"), size=(40, 60), priority=2),
+    AssetSpec("skeleton_attack", frames("textures/NPC/skeleton/skeleton_attack{}.png"), size=(40, 60), priority=2),
+    AssetSpec("hero", "textures/player_movement/hero.png", size=(40, 60), priority=2),
+    # Item icons (config/item_db.py), drawn in the inventory and when an enemy drops an item
+    AssetSpec("icon_sword", "textures/sword/sword.png", priority=2),
+    AssetSpec("icon_staff", "textures/sword/sword_slash1.png", priority=2),
+    AssetSpec("icon_bow", "textures/player_movement/back1.png", priority=2),
+    AssetSpec("icon_helmet", "textures/player_movement/front1.png", priority=2),
+    AssetSpec("icon_armor", "textures/player_movement/right1.png", priority=2),
+    AssetSpec("icon_boots", "textures/player_movement/left1.png", priority=2),
+    AssetSpec("icon_ring", "textures/torch/torch.png", priority=2),
+]
+
+# Map characters -> assets a level containing them draws on its first frame
+LEVEL_ASSETS = {
+    '0': ("monster", "monster_alt", "monster_boss"),
+    '8': ("monster", "monster_alt", "monster_boss"),
+    '5': ("target", "target_alt"),
+    '7': ("door_closed", "door_open"),
+    'S': ("skeleton_walk", "skeleton_attack"),
+}
+
+
+def level_assets(level_layout) -> set[str]:
+    names = set()
+    for ch in set("".join(row for row in level_layout if isinstance(row, str))):
+        names.update(LEVEL_ASSETS.get(ch, ()))
+    return names
+
+
+class AssetManager:
+    """Loads a manifest in the background, most urgent assets first.
+
+    Files are decoded and scaled on a thread pool in priority order. The main
+    thread converts finished results to the display format in pump(), which the
+    game loop calls once per frame with a small time budget. get(name) returns
+    an asset at once when it is ready, otherwise it waits for that asset only,
+    so anything can be used before the whole manifest is in.
+    Assets found in the pack file (see build_pack.py) skip decoding, scaling and
+    usually the conversion as well.
+    """
+
+    def __init__(self, manifest=MANIFEST, workers: int = ASSET_WORKERS, headless: bool = False, started: float = None, pack: str = ASSET_PACK):
+        self.pack = AssetPack.open(pack)
+        self.from_pack = 0
+        self.specs = {spec.name: spec for spec in manifest}
+        self.priority = {spec.name: spec.priority for spec in manifest}
+        self.workers = workers
+        self.headless = headless
+        self.assets = {}
+        self.failed = set()  # optional assets whose file is missing (see AssetSpec.fallback)
+        self._futures = {}
+        self._hooks = {}
+        self._jobs = deque()
+        self._pool = None
+        self.started = time.perf_counter() if started is None else started
+        self.first_frame_ms = None
+        self.loaded_ms = None
+
+    def prioritize(self, names, priority: int = 0) -> None:
+        """Move names up to priority; only has an effect before start()."""
+        for name in names:
+            if name in self.priority:
+                self.priority[name] = min(self.priority[name], priority)
+
+    def start(self) -> None:
+        if self._pool is not None:
+            return
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        # The pool's queue is first in, first out, so submission order is load order
+        for name in sorted(self.specs, key=lambda n: self.priority[n]):
+            if name not in self.assets:
+                self._futures[name] = self._pool.submit(self._decode, self.specs[name])
+
+    # --- Worker threads ---
+    def _decode(self, spec: AssetSpec):
+        """Returns (sound or list of surfaces, whether the surfaces still need converting)."""
+        entry = self.pack.entry(spec) if self.pack is not None else None
+        if entry is not None and entry.get("missing"):
+            raise FileNotFoundError(f"{spec.paths[0]} (not in the asset pack)")
+        if spec.kind == "sound":
+            if self.headless:
+                return SilentSound(), False
+            if entry is not None:
+                self.from_pack += 1
+                return self.pack.sound(entry), False
+            return pygame.mixer.Sound(spec.paths[0]), False
+        if entry is not None:
+            self.from_pack += 1
+            return self.pack.surfaces(entry), spec.kind == "opaque" or not self.pack.native
+        surfaces = []
+        for path in spec.paths:
+            surf = pygame.image.load(path)
+            if spec.size is not None:
+                surf = pygame.transform.scale(surf, spec.size)
+            surfaces.append(surf)
+        return surfaces, True
+
+    # --- Main thread ---
+    def _collect(self, name: str, future) -> None:
+        spec = self.specs[name]
+        try:
+            result, convert = future.result()
+        except (pygame.error, OSError) as e:
+            if spec.fallback is None:
+                raise
+            log.debug("%s unavailable (%s), using %s", name, e, spec.fallback)
+            self.failed.add(name)
+            self._hooks.pop(name, None)
+            return
+        if spec.kind == "sound":
+            asset = result
+        else:
+            if convert:
+                result = [surf.convert() if spec.kind == "opaque" else surf.convert_alpha() for surf in result]
+            asset = result if spec.sequence else result[0]
+        self.assets[name] = asset
+        for hook in self._hooks.pop(name, ()):
+            hook(asset)
+
+    def get(self, name: str):
+        if name in self.assets:
+            return self.assets[name]
+        if name in self.failed:
+            return self.get(self.specs[name].fallback)
+        if name not in self.specs:
+            raise KeyError(f"unknown asset {name!r}")
+        self.start()
+        self._collect(name, self._futures.pop(name))
+        return self.get(name)
+
+    def on_ready(self, name: str, hook) -> None:
+        """Call hook(asset) once name is loaded (right away if it already is), e.g. to warm caches."""
+        if name in self.assets:
+            hook(self.assets[name])
+        else:
+            self._hooks.setdefault(name, []).append(hook)
+
+    def defer(self, job) -> None:
+        """Run job() from a later per-frame pump instead of before the first frame (e.g. cache warming)."""
+        self._jobs.append(job)
+
+    def pump(self, budget_ms: float = None) -> None:
+        """Convert finished assets, then run deferred jobs, stopping once budget_ms has been spent.
+
+        Deferred jobs only run from the budgeted per-frame call, at least one per call.
+        """
+        start = time.perf_counter()
+        deadline = None if budget_ms is None else start + budget_ms / 1000.0
+        for name, future in list(self._futures.items()):
+            if future.done():
+                del self._futures[name]
+                self._collect(name, future)
+                if deadline is not None and time.perf_counter() > deadline:
+                    return
+        if self._pool is not None and not self._futures and self.loaded_ms is None:
+            self.loaded_ms = (time.perf_counter() - self.started) * 1000.0
+            self._pool.shutdown(wait=False)
+            source = f", {self.from_pack} from {self.pack.path}" if self.pack is not None else ""
+            log.info("All %d loaded after %.0f ms (%d threads%s)", len(self.specs), self.loaded_ms, self.workers, source)
+        if deadline is not None:
+            while self._jobs:
+                self._jobs.popleft()()
+                if time.perf_counter() > deadline:
+                    return
+
+    def pending(self, priority: int = None) -> list[str]:
+        return [name for name in self._futures if priority is None or self.priority[name] <= priority]
+
+    def progress(self, priority: int = None) -> float:
+        """Fraction of files loaded, over assets up to priority (all when None)."""
+        total = done = 0
+        for name, spec in self.specs.items():
+            if priority is None or self.priority[name] <= priority:
+                total += len(spec.paths)
+                if name in self.assets or name in self.failed:
+                    done += len(spec.paths)
+        return done / total if total else 1.0
+
+    def wait(self, priority: int = None, on_progress=None) -> None:
+        """Block until every asset up to priority is loaded, calling on_progress(fraction) as they arrive."""
+        self.start()
+        while True:
+            self.pump()
+            if on_progress is not None:
+                on_progress(self.progress(priority))
+            pending = self.pending(priority)
+            if not pending:
+                return
+            wait([self._futures[name] for name in pending], timeout=0.05, return_when=FIRST_COMPLETED)
+
+    def first_frame(self) -> None:
+        """Record and report the time to the first rendered frame (only the first call counts)."""
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = (time.perf_counter() - self.started) * 1000.0
+        log.info(
+            "First frame after %.0f ms (%d/%d assets ready)",
+            self.first_frame_ms, len(self.assets) + len(self.failed), len(self.specs)
+        )
+
+
+class AssetAttribute:
+    """Class attribute that reads a named asset from the instance's AssetManager (obj.assets)."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.assets.get(self.name)
@@ -0,0 +1,109 @@
+import pygame
+from config.config import ATLAS_PAGE_SIZE
+
+# Draw layers, back to front. Within a layer sprites are drawn in order of their base y
+# (where they touch the ground), so whatever stands lower on screen is in front.
+LAYER_GROUND = 0  # dropped items
+LAYER_ACTORS = 1  # enemies, targets, the player, the torch
+LAYER_EFFECTS = 2  # projectiles and explosions
+LAYER_LABELS = 3  # level tags under enemies
+
+
+class DrawList:
+    """Sprites collected over a frame, sorted by (layer, y) and drawn with Surface.blits().
+
+    blit() has the Surface.blit signature, so anything that draws itself onto a
+    surface can draw into a DrawList instead; at(layer, y) sets where the
+    following blits go in the order. Blits with equal layer and y keep the
+    order they were added in (a sword stays on top of its player).
+    """
+
+    def __init__(self):
+        self.items = []
+        self.layer = LAYER_ACTORS
+        self.y = 0.0
+
+    def at(self, layer: int, y: float = 0.0) -> "DrawList":
+        self.layer = layer
+        self.y = y
+        return self
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0) -> None:
+        # The running index keeps the sort stable and stops it before it reaches the Surface
+        self.items.append((self.layer, self.y, len(self.items), source, dest, area, special_flags))
+
+    def flush(self, surf: pygame.Surface) -> int:
+        """Draw and clear the list; returns how many sprites were drawn."""
+        items = self.items
+        items.sort()
+        sequence = [
+            (source, dest) if area is None and not flags else (source, dest, area, flags)
+            for _, _, _, source, dest, area, flags in items
+        ]
+        if sequence:
+            surf.blits(sequence, doreturn=False)
+        self.items = []
+        return len(sequence)
+
+
+class TextureAtlas:
+    """Sprite frames copied onto a few large page surfaces.
+
+    Frames are placed with shelf packing: each page is cut into horizontal
+    shelves as tall as the first frame put on them, and a frame goes onto the
+    shelf that wastes the least height. add() returns a subsurface of the page,
+    which draws like the original frame.
+    """
+
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding: int = 1):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: list[pygame.Surface] = []
+        self._shelves: list[list[list[int]]] = []  # per page: [y, height, next_x] per shelf
+
+    def _new_page(self) -> None:
+        page = pygame.Surface(self.page_size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._shelves.append([])
+
+    def _place(self, page_index: int, w: int, h: int):
+        page_w, page_h = self.page_size
+        shelves = self._shelves[page_index]
+        best = None
+        for shelf in shelves:
+            if shelf[1] >= h and shelf[2] + w <= page_w and (best is None or shelf[1] < best[1]):
+                best = shelf
+        if best is None:
+            top = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            if top + h > page_h:
+                return None
+            best = [top, h, 0]
+            shelves.append(best)
+        x = best[2]
+        best[2] += w
+        return x, best[0]
+
+    def add(self, frame: pygame.Surface) -> pygame.Surface:
+        w, h = frame.get_size()
+        pad = self.padding
+        if w + pad > self.page_size[0] or h + pad > self.page_size[1] or not frame.get_flags() & pygame.SRCALPHA:
+            return frame  # too big for a page, or opaque: keep it as it is
+        for page_index in range(len(self.pages)):
+            spot = self._place(page_index, w + pad, h + pad)
+            if spot is not None:
+                break
+        else:
+            self._new_page()
+            page_index = len(self.pages) - 1
+            spot = self._place(page_index, w + pad, h + pad)
+        page = self.pages[page_index]
+        # The page is transparent there, so RGBA_MAX copies the pixels exactly (a normal blit would blend)
+        page.blit(frame, spot, special_flags=pygame.BLEND_RGBA_MAX)
+        return page.subsurface((spot[0], spot[1], w, h))
+
+    def clear(self) -> None:
+        self.pages.clear()
+        self._shelves.clear()
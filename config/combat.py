@@ -1,5 +1,8 @@
 import pygame
 from config.config import world_to_screen
+from config.text import get_font, render_text
+from config.item_db import get_icon
+from config.target import Target
 
 def show_damage_numbers(game, x, y, value, color=(255, 80, 80), duration=1.0):
     """Add a damage number to the game's list for display."""
@@ -13,8 +16,8 @@ def show_damage_numbers(game, x, y, value, color=(255, 80, 80), duration=1.0):
         "duration": duration
     })
 
-def draw_damage_numbers(game, screen, camera, dt):
-    font = pygame.font.SysFont("arial", 28, bold=True)
+def draw_damage_numbers(game, screen, camera, dt, culler=None):
+    font = get_font("arial", 28, bold=True)
     for dmg in game.damage_numbers[:]:
         # --- Only draw normal damage numbers, not "Level X required" messages ---
         if isinstance(dmg.get("value", ""), str) and str(dmg.get("value", "")).startswith("Level "):
@@ -25,8 +28,9 @@ def draw_damage_numbers(game, screen, camera, dt):
         if dmg["timer"] <= 0:
             game.damage_numbers.remove(dmg)
             continue
-        dmg_surf = font.render(str(dmg["value"]), True, dmg["color"])
-        dmg_surf.set_alpha(dmg["alpha"])
+        if culler is not None and not culler.point(dmg["x"], dmg["y"], 100):
+            continue  # still ages off-screen, just isn't drawn
+        dmg_surf = render_text(font, dmg["value"], dmg["color"], alpha=dmg["alpha"])
         px, py = world_to_screen(dmg["x"], dmg["y"], camera.x, camera.y)
         screen.blit(dmg_surf, (px - dmg_surf.get_width() // 2, py))
 
@@ -38,7 +42,7 @@ def show_health_bar(game, target, duration=2.0):
         max_hp = getattr(target, "hit_points", None)
     if max_hp is None:
         max_hp = getattr(target, "max_hit_points", 300)
-    game.target_health_bars[id(target)] = {
+    game.target_health_bars[target.entity_id] = {
         "timer": duration,
         "hp": target.hit_points,
         "max_hp": max_hp,
@@ -53,9 +57,11 @@ def update_health_bars(game, dt):
     for tid in [tid for tid, bar in game.target_health_bars.items() if bar["timer"] <= 0]:
         del game.target_health_bars[tid]
 
-def draw_health_bars(game, screen, camera):
-    """Draw all active health bars."""
+def draw_health_bars(game, screen, camera, culler=None):
+    """Draw all active health bars (those near the view when a culler is given)."""
     for bar in game.target_health_bars.values():
+        if culler is not None and not culler.point(bar["x"], bar["y"], 30):
+            continue
         px, py = world_to_screen(bar["x"], bar["y"], camera.x, camera.y)
         width = 48
         height = 8
@@ -64,3 +70,67 @@ def draw_health_bars(game, screen, camera):
         pygame.draw.rect(screen, (120, 255, 120), (px - width // 2 + 2, py + 2, int((width - 4) * hp_ratio), height - 4), border_radius=3)
         pygame.draw.rect(screen, (0, 0, 0), (px - width // 2, py, width, height), 2, border_radius=4)
 
+
+# --- Hit resolution ---
+def queue_hit(game, victim, damage):
+    """Queue damage to an enemy or target; resolve_hits() applies the tick's hits together."""
+    game.hit_queue.append((victim, damage))
+
+def resolve_hits(game):
+    """Apply every queued hit: damage, numbers and health bars, then targets knocked down and enemies killed.
+
+    Any attack (a sword swing, a projectile, an area effect) only queues hits,
+    so this is the one place damage lands. A victim already down ignores the
+    rest of the batch, and the hit and death sounds play once per batch
+    however many enemies were struck.
+    """
+    hits = game.hit_queue
+    if not hits:
+        return
+    killed = []
+    enemy_hit = False
+    for victim, damage in hits:
+        if isinstance(victim, Target):
+            # Knocked down, a target stands back up after respawn_timer
+            if victim.respawn_timer > 0:
+                continue
+            victim.hit_points -= damage
+            show_damage_numbers(game, victim.x, victim.y - 40, damage)
+            show_health_bar(game, victim)
+            if victim.hit_points <= 0:
+                victim.respawn_timer = 5.0
+                for rect in game.world.remove_target_solid(victim):
+                    game.physics.remove_solid(rect)
+                victim.hit_points = 300  # Reset HP for respawn
+            continue
+        if victim.hit_points <= 0:
+            continue  # killed earlier in this batch
+        victim.hit_points -= damage
+        show_damage_numbers(game, victim.x, victim.y - 40, damage)
+        show_health_bar(game, victim)
+        enemy_hit = True
+        if victim.hit_points <= 0:
+            killed.append(victim)
+    hits.clear()
+    if enemy_hit:
+        game.slime_damage_sound.play()
+    if not killed:
+        return
+    game.slime_death_sound.play()
+    defeated = game.defeated_enemies_per_level.setdefault(game.level_index, set())
+    for enemy in killed:
+        game.player.add_xp(getattr(enemy, "xp_reward", 5))
+        drop_items = enemy.get_drop() if hasattr(enemy, "get_drop") else None
+        for drop_item in drop_items or ():
+            dropped = {
+                "item_data": drop_item,
+                "x": enemy.x,
+                "y": enemy.y,
+                "image": get_icon(drop_item.get("image", None)),
+                "rect": pygame.Rect(int(enemy.x - 24), int(enemy.y - 24), 48, 48)
+            }
+            game.dropped_items.append(dropped)
+            game.world.add_drop(dropped)
+        game.despawn_enemy(enemy)
+        # Keeps it from respawning when the level is loaded again
+        defeated.add(enemy.spawn_pos)
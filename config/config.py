@@ -5,7 +5,44 @@ import pygame
 WIN_W, WIN_H = 1920, 1080
 PIXEL_SCALE = 1
 FPS = 120
+INVENTORY_FPS = 30  # frame rate while the game is paused on the inventory screen
+SIM_HZ = 60  # fixed simulation tick rate, independent of the render FPS
+SIM_DT = 1.0 / SIM_HZ
+MAX_SIM_STEPS = 5  # simulation ticks allowed per rendered frame before falling behind
+MAX_FRAME_SKIP = 3  # renders skipped in a row to let the simulation catch up
+MAX_FRAME_TIME = 0.25  # clamp for long frames (window drag, breakpoints) in seconds
+PROFILER_WINDOW = 240  # frames kept for the F3 profiler percentiles
+PROFILER_OUTPUT = None  # e.g. "profile.csv" or "profile.jsonl" to record every frame's phase timings
+TEXT_CACHE_SIZE = 512  # rendered strings kept by config.text.render_text
+VECTORIZED_ENEMIES = True  # run slime AI through config.enemy_batch when NumPy is installed
+AI_LOD = True  # update distant enemies less often (config.ai_scheduler); False updates every enemy every tick
+AI_NEAR_RADIUS = 1120  # px from the player, camera centre or torch within which enemies update every tick (covers the view)
+AI_MID_RADIUS = 1800  # px out to which enemies update every AI_MID_INTERVAL ticks; beyond it they sleep
+AI_MID_INTERVAL = 4  # ticks between updates of a mid-range enemy
+AI_BUDGET_UPDATES = 200  # enemy updates per tick; mid-range updates that don't fit wait for a later tick
+AI_BUDGET_MS = None  # opt-in cap on measured enemy AI time per tick, e.g. 4.0; never used by headless runs
+AI_MAX_DT = 0.25  # most time a skipped enemy catches up on in one update, in seconds
+AI_SECTOR_SIZE = 384  # px per cell of the scheduler's coarse enemy index
+LIGHT_FLICKER_VARIANTS = 6  # pre-drawn flicker sizes per flickering light radius
+LIGHT_FLICKER_AMPLITUDE = 0.05  # flicker radius change, as a fraction of the radius
+LIGHT_FLICKER_HZ = 10  # flicker variant changes per second
+ATLAS_PAGE_SIZE = (1024, 1024)  # texture atlas page the cached sprite frames are packed into
+DEBUG_DRAW = ()  # debug overlay categories on at startup, e.g. ("hitboxes", "ai_ranges"); F5-F9 toggle them
+CULL_MARGIN = 64  # px around the camera view still drawn (config.culling.ViewCuller)
+ROTATION_BUCKETS = 64  # directions pre-rotated for projectile sprites (config.sprites.rotated_frame)
+ASSET_WORKERS = 4  # threads decoding images and sounds (config.assets.AssetManager)
+ASSET_PACK = "assets.pack"  # pre-decoded assets written by build_pack.py; loose files are used without it
+ASSET_PUMP_BUDGET_MS = 2.0  # main-thread time per frame spent converting assets that finished loading
+LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING or ERROR (config.log)
+LOG_LEVELS = {}  # per-category overrides, e.g. {"input": "DEBUG", "collision": "DEBUG"}
+LOG_RATE = 5.0  # messages per second allowed per log category; extra ones are counted and dropped
+LOG_BURST = 20  # messages a category may log at once before LOG_RATE applies
+LOG_BUFFER_SIZE = 1024  # log records queued for the flush thread; the oldest are dropped when full
+LOG_FLUSH_INTERVAL = 0.25  # seconds between background log writes
+LOG_OUTPUT = None  # log file to append to; None writes to stderr
 TILE_SIZE = 48
+TILE_CHUNK_SIZE = 16  # tiles per side of a pre-baked world chunk
+TILE_CHUNK_CACHE = 40  # baked world chunks kept; the least recently drawn are dropped and re-baked when seen again
 
 MAP_CHARS = {
     '#': 1,   # wall
@@ -0,0 +1,31 @@
+import pygame
+from config.config import CULL_MARGIN
+
+
+class ViewCuller:
+    """The camera view grown by a margin, for skipping off-screen work in the draw passes.
+
+    Objects kept in a SpatialHash are found with query(), which only visits the
+    grid cells under the view, so whatever is off-screen is never touched. Loose
+    objects (fireballs, damage numbers, lights) are tested one by one with
+    point()/overlaps(). The margin covers sprites larger than their grid rect and
+    the gap between a grid rect (last simulation tick) and the interpolated
+    position an entity is drawn at.
+    """
+
+    def __init__(self, camera, margin: int = CULL_MARGIN):
+        self.view = camera.view_rect()
+        self.rect = self.view.inflate(margin * 2, margin * 2)
+
+    def query(self, grid, extra: int = 0) -> list:
+        """Objects in grid whose rect overlaps the culling rect grown by extra pixels."""
+        rect = self.rect.inflate(extra * 2, extra * 2) if extra else self.rect
+        return grid.colliding(rect)
+
+    def point(self, x: float, y: float, radius: float = 0) -> bool:
+        """True if something centred on world (x, y), reaching radius out, can be on screen."""
+        rect = self.rect
+        return rect.left - radius <= x <= rect.right + radius and rect.top - radius <= y <= rect.bottom + radius
+
+    def overlaps(self, rect: pygame.Rect) -> bool:
+        return self.rect.colliderect(rect)
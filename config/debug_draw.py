@@ -0,0 +1,162 @@
+import math
+import pygame
+from config.config import DEBUG_DRAW, world_to_screen
+from config.text import get_font, render_text
+
+# Categories, in the order they are drawn, and the key that toggles each
+CATEGORIES = ("hitboxes", "ai_ranges", "physics", "grid", "info")
+DEBUG_KEYS = {
+    pygame.K_F5: "hitboxes",  # player/enemy physics boxes, target, torch, projectile and sword boxes
+    pygame.K_F6: "ai_ranges",  # enemy attack-range rings and visibility circles
+    pygame.K_F7: "physics",  # pymunk wall shapes
+    pygame.K_F8: "grid",  # occupied enemy/drop grid cells
+    pygame.K_F9: "info",  # player position/velocity/stats and AI scheduler text
+}
+
+ATTACK_RANGE = 80  # the enemy attack-range ring drawn by ai_ranges
+VISIBILITY_REACH = 240  # enemy visibility_range: how far ai_ranges circles reach past an enemy
+
+
+def _screen_rect(bb, cam_x: float, cam_y: float) -> pygame.Rect:
+    """A pymunk bounding box as a screen-space rect (bb.bottom is its smallest y)."""
+    return pygame.Rect(int(bb.left - cam_x), int(bb.bottom - cam_y), int(bb.right - bb.left), int(bb.top - bb.bottom))
+
+
+class DebugDraw:
+    """Developer overlays, each category toggled on its own (F5-F9), all off by default.
+
+    draw() returns straight away while nothing is enabled, and a disabled
+    category is never visited. Rings and circles are drawn once into cached
+    surfaces and blitted from then on.
+    """
+
+    def __init__(self, enabled=DEBUG_DRAW):
+        self.enabled = set(enabled)
+        self._shapes: dict[tuple, pygame.Surface] = {}
+
+    def toggle(self, category: str) -> None:
+        self.enabled ^= {category}
+
+    # --- Cached geometry ---
+    def ring(self, radius: int, color, width: int = 1, dots: int = 0, dot_radius: int = 3) -> pygame.Surface:
+        """Circle outline (dots == 0) or ring of dots around the centre of a cached surface."""
+        key = (radius, tuple(color), width, dots, dot_radius)
+        surf = self._shapes.get(key)
+        if surf is None:
+            size = (radius + dot_radius + 1) * 2
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = size // 2
+            if dots:
+                for i in range(dots):
+                    rad = math.radians(i * 360 / dots)
+                    pygame.draw.circle(surf, color, (int(center + math.cos(rad) * radius), int(center + math.sin(rad) * radius)), dot_radius)
+            else:
+                pygame.draw.circle(surf, color, (center, center), radius, width)
+            self._shapes[key] = surf
+        return surf
+
+    def _blit_centered(self, screen, surf, x, y) -> None:
+        screen.blit(surf, (int(x) - surf.get_width() // 2, int(y) - surf.get_height() // 2))
+
+    # --- Drawing ---
+    def draw(self, game, culler) -> None:
+        if not self.enabled:
+            return
+        for category in CATEGORIES:
+            if category in self.enabled:
+                getattr(self, "draw_" + category)(game, culler)
+
+    def draw_hitboxes(self, game, culler) -> None:
+        screen = game.screen
+        cam_x, cam_y = game.camera.x, game.camera.y
+        physics = game.physics
+        player_box = _screen_rect(physics.player_shape.bb, cam_x, cam_y)
+        pygame.draw.rect(screen, (0, 0, 255), player_box)
+        pygame.draw.rect(screen, (255, 255, 255), player_box.inflate(-8, -8), 2)
+        for enemy in culler.query(game.world.enemy_grid):
+            shape = physics.shapes.get(enemy.entity_id)
+            if shape is not None:
+                box = _screen_rect(shape.bb, cam_x, cam_y)
+                pygame.draw.rect(screen, (0, 255, 0), box, 2)
+                pygame.draw.rect(screen, (255, 255, 255), box.inflate(-8, -8), 2)
+        if game.torch_on_ground or game.torch_following:
+            torch_px, torch_py = world_to_screen(
+                game.torch_ground_pos[0] + game.torch_wiggle_offset[0],
+                game.torch_ground_pos[1] + game.torch_wiggle_offset[1],
+                cam_x, cam_y
+            )
+            pygame.draw.rect(screen, (128, 0, 128), pygame.Rect(int(torch_px - 8), int(torch_py - 16), 16, 32), 2)
+        for target in culler.query(game.world.target_grid):
+            tx, ty = world_to_screen(target.x, target.y, cam_x, cam_y)
+            pygame.draw.rect(screen, (255, 255, 0), pygame.Rect(int(tx - target.w // 2), int(ty - target.h // 2), target.w, target.h), 2)
+        for projectile in game.projectiles:
+            if culler.point(projectile.x, projectile.y, 20):
+                pygame.draw.rect(screen, (255, 128, 0), projectile.rect().move(-cam_x, -cam_y), 2)
+        if game.player.sword_swinging:
+            mx, my = pygame.mouse.get_pos()
+            px, py = game.player.x, game.player.y
+            dx = mx + cam_x - px
+            dy = my + cam_y - py
+            mag = math.hypot(dx, dy)
+            if mag > 0:
+                dx /= mag
+                dy /= mag
+            else:
+                dx, dy = game.player.last_dir
+            sword_w, sword_h = 48, 48
+            offset = 32
+            sword_px, sword_py = world_to_screen(px + dx * offset - sword_w // 2, py + dy * offset - sword_h // 2, cam_x, cam_y)
+            pygame.draw.rect(screen, (255, 0, 0), pygame.Rect(int(sword_px), int(sword_py), sword_w, sword_h), 2)
+
+    def draw_ai_ranges(self, game, culler) -> None:
+        screen = game.screen
+        cam_x, cam_y = game.camera.x, game.camera.y
+        dots = self.ring(ATTACK_RANGE, (200, 200, 200), dots=20)
+        # Visibility circles reach far past the sprite, so look further out for them
+        for enemy in culler.query(game.world.enemy_grid, VISIBILITY_REACH):
+            ex, ey = world_to_screen(enemy.x, enemy.y, cam_x, cam_y)
+            if culler.point(enemy.x, enemy.y, ATTACK_RANGE + 3):
+                self._blit_centered(screen, dots, ex, ey)
+            visibility_range = int(getattr(enemy, "visibility_range", VISIBILITY_REACH))
+            if culler.point(enemy.x, enemy.y, visibility_range):
+                self._blit_centered(screen, self.ring(visibility_range, (255, 255, 0)), ex, ey)
+
+    def draw_physics(self, game, culler) -> None:
+        screen = game.screen
+        cam_x, cam_y = game.camera.x, game.camera.y
+        for wall_shape in culler.query(game.physics.wall_grid):
+            wall_rect = _screen_rect(wall_shape.bb, cam_x, cam_y)
+            pygame.draw.rect(screen, (100, 100, 100), wall_rect, 2)
+            pygame.draw.rect(screen, (0, 0, 0), wall_rect, 4)
+
+    def draw_grid(self, game, culler) -> None:
+        screen = game.screen
+        cam_x, cam_y = game.camera.x, game.camera.y
+        view = culler.view
+        for grid, color in ((game.world.enemy_grid, (255, 80, 80)), (game.world.drop_grid, (80, 160, 255))):
+            size = grid.cell_size
+            for cx in range(view.left // size, view.right // size + 1):
+                for cy in range(view.top // size, view.bottom // size + 1):
+                    bucket = grid.cells.get((cx, cy))
+                    if bucket:
+                        pygame.draw.rect(screen, color, (int(cx * size - cam_x), int(cy * size - cam_y), size, size), 1)
+
+    def draw_info(self, game, culler) -> None:
+        font = get_font("arial", 16)
+        lines = [
+            f"Pos: ({game.player.x:.1f}, {game.player.y:.1f})",
+            f"Vel: ({game.physics.player_body.velocity[0]:.1f}, {game.physics.player_body.velocity[1]:.1f})",
+            f"Contacts: {len(game.physics.contacts)}",
+            f"HP: {game.player.hp}",
+            f"Stamina: {game.player.stamina}",
+            f"Mana: {game.player.mana}",
+            f"Level: {game.level_index + 1}",
+            f"Enemies: {len(game.world.enemies)}",
+            "AI: {near} near, {mid} mid, {asleep} asleep".format(**game.ai.stats),
+            "AI: {updated} updated, {deferred} deferred, {ms:.2f} ms".format(**game.ai.stats)
+            + (f" (budget {game.ai.budget_updates} updates)" if game.ai.budget_updates is not None else ""),
+            f"Targets: {len(game.world.targets)}",
+            "Debug: " + ", ".join(c for c in CATEGORIES if c in self.enabled),
+        ]
+        for i, line in enumerate(lines):
+            game.screen.blit(render_text(font, line, (255, 255, 255)), (10, 170 + i * 20))
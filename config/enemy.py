@@ -1,9 +1,12 @@
 import pygame
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 import random
 from config.config import world_to_screen
 from config.item_db import ITEM_GROUPS
+from config.physics import Physics
+from config.sprites import sprite_frame, placeholder_frame, warm_sprite_frames
+from config.entities import NO_ENTITY
 
 
 def roll_drops(level, lowest_drop_level, weapon_drop_rate, armor_drop_rate, accessory_drop_rate):
@@ -71,11 +74,14 @@ class Enemy:
     armor_drop_rate: float = 0.99
     accessory_drop_rate: float = 0.99  # 2% default
     lowest_drop_level: int = 1  # New: minimum item level for drops
+    entity_id: int = field(default=NO_ENTITY, compare=False, repr=False)  # set by World.add_enemy
+    spawn_pos: tuple = field(default=None, compare=False, repr=False)  # where the level placed it; keys defeated_enemies_per_level
 
     def draw_enemy(self) -> pygame.Rect:
         return pygame.Rect(int(self.x - self.w/2), int(self.y - self.h/2), self.w, self.h)
 
-    def draw(self, surf: pygame.Surface, cam_x: float, cam_y: float):
+    def draw(self, surf, cam_x: float, cam_y: float):
+        # surf is a Surface or a batch.DrawList
         px, py = world_to_screen(self.x, self.y, cam_x, cam_y)
         image = self.img
         # Fix: Ensure image is a pygame.Surface and not a list or None
@@ -83,12 +89,10 @@ class Enemy:
             image = image[0]
         if isinstance(image, pygame.Surface):
             # Use self.w and self.h for correct scaling
-            draw_img = pygame.transform.scale(image, (self.w, self.h))
-            draw_img = pygame.transform.flip(draw_img, True, False) if self.facing_left else draw_img
+            draw_img = sprite_frame(image, (self.w, self.h), self.facing_left)
             surf.blit(draw_img, (px - self.w // 2, py - self.h // 2))
         else:
-            rect = pygame.Rect(px - self.w // 2, py - self.h // 2, self.w, self.h)
-            pygame.draw.rect(surf, (200, 70, 70), rect, border_radius=6)
+            surf.blit(placeholder_frame((self.w, self.h), (200, 70, 70)), (px - self.w // 2, py - self.h // 2))
 
     def can_attack_player(self, player_x, player_y) -> bool:
         dist = math.hypot(self.x - player_x, self.y - player_y)
@@ -100,6 +104,7 @@ class Enemy:
         return dist <= self.visibility_range
 
     def __post_init__(self):
+        self.spawn_pos = (self.x, self.y)
         # Scale stats and xp by level
         self.max_hp = self.vitality * 100 * self.level
         self.hit_points = self.max_hp
@@ -111,6 +116,12 @@ class Enemy:
         self.attack_damage = random.randint(min_dmg, max_dmg)
         if not hasattr(self, "xp_reward") or self.xp_reward == 5:
             self.xp_reward = self.level * 5
+        self.warm_frames()
+
+    def warm_frames(self):
+        """Scale and mirror this enemy's frames into the sprite cache at spawn time."""
+        frames = self.img if isinstance(self.img, list) else [self.img]
+        warm_sprite_frames(frames, (self.w, self.h))
 
     def get_drop(self):
         # Use shared drop logic for all monsters
@@ -122,10 +133,22 @@ class Enemy:
             self.accessory_drop_rate
         )
 
-    def update(self, dt: float, target_pos, solids: list[pygame.Rect], player_rect: pygame.Rect, other_enemies: list[pygame.Rect], player=None, fairy=None):
+    def update(self, dt: float, target_pos, physics: Physics, player=None, fairy=None):
         if self.cooldown > 0:
             self.cooldown -= dt
             return
+        dx, dy, step = self.plan_move(dt, player, fairy)
+        self.move_and_collide(dx, dy, step, physics)
+        # Attack timer update
+        if self.attack_timer > 0:
+            self.attack_timer -= dt
+        # Enemy attack logic
+        if player and self.can_attack_player(player.x, player.y):
+            self.strike(player)
+            self.attack_timer = self.attack_cooldown
+
+    def plan_move(self, dt: float, player=None, fairy=None) -> tuple[float, float, float]:
+        """Pick this tick's movement direction and step length (chase or idle wander)."""
         # --- AGGRO LOGIC ---
         chase_pos = (self.x, self.y)  # Idle by default
         player_in_range = False
@@ -193,57 +216,40 @@ class Enemy:
             else:
                 dx, dy = 0, 0
             step = self.speed * dt
+        return dx, dy, step
 
-        # Save original position
-        orig_x, orig_y = self.x, self.y
+    def move_and_collide(self, dx: float, dy: float, step: float, physics: Physics) -> None:
+        """Move one axis at a time, reverting an axis that runs into a wall, the player or another enemy."""
+        query = physics.enemy_query(self)
+        # An axis that doesn't move can't run into anything new, so it isn't queried
 
         # X axis
-        self.x += dx * step
-        r = self.draw_enemy()
-        collided = False
-        for s in solids:
-            if r.colliderect(s):
-                collided = True
-        if player_rect and r.colliderect(player_rect):
-            collided = True
-        for e_rect in other_enemies:
-            if r.colliderect(e_rect):
-                collided = True
-        if collided:
-            self.x = orig_x  # revert
+        if dx:
+            orig_x = self.x
+            self.x += dx * step
+            if physics.blocked(self.draw_enemy(), query):
+                self.x = orig_x  # revert
 
         # Y axis
-        self.y += dy * step
-        r = self.draw_enemy()
-        collided = False
-        for s in solids:
-            if r.colliderect(s):
-                collided = True
-        if player_rect and r.colliderect(player_rect):
-            collided = True
-        for e_rect in other_enemies:
-            if r.colliderect(e_rect):
-                collided = True
-        if collided:
-            self.y = orig_y  # revert
-
-        # Attack timer update
-        if self.attack_timer > 0:
-            self.attack_timer -= dt
-        # Enemy attack logic
-        if player and self.can_attack_player(player.x, player.y):
-            # --- Dodge chance based on player dexterity ---
-            dodge_chance = min(0.5, player.dexterity * 0.03)  # max 50% dodge
-            if random.random() > dodge_chance:
-                if hasattr(player, "hp"):
-                    # Calculate attack damage every attack
-                    min_dmg = self.strength * self.level * 10
-                    max_dmg = self.strength * self.level * 10 + 9
-                    attack_damage = random.randint(min_dmg, max_dmg)
-                    # --- Armor reduction ---
-                    armor = player.get_total_armor() if hasattr(player, "get_total_armor") else 0
-                    final_damage = max(0, attack_damage - armor)
-                    player.hp -= final_damage
-                    from config.combat import show_damage_numbers
-                    show_damage_numbers(player.game_ref, player.x, player.y - 40, final_damage, color=(255, 255, 255))
-            self.attack_timer = self.attack_cooldown
\ No newline at end of file
+        if dy:
+            orig_y = self.y
+            self.y += dy * step
+            if physics.blocked(self.draw_enemy(), query):
+                self.y = orig_y  # revert
+
+    def strike(self, player) -> None:
+        """Roll one melee hit against the player (dodge, damage, armor)."""
+        # --- Dodge chance based on player dexterity ---
+        dodge_chance = min(0.5, player.dexterity * 0.03)  # max 50% dodge
+        if random.random() > dodge_chance:
+            if hasattr(player, "hp"):
+                # Calculate attack damage every attack
+                min_dmg = self.strength * self.level * 10
+                max_dmg = self.strength * self.level * 10 + 9
+                attack_damage = random.randint(min_dmg, max_dmg)
+                # --- Armor reduction ---
+                armor = player.get_total_armor() if hasattr(player, "get_total_armor") else 0
+                final_damage = max(0, attack_damage - armor)
+                player.hp -= final_damage
+                from config.combat import show_damage_numbers
+                show_damage_numbers(player.game_ref, player.x, player.y - 40, final_damage, color=(255, 255, 255))
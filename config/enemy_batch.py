@@ -0,0 +1,173 @@
+import math
+import random
+from config.enemy import Enemy
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it every enemy runs Enemy.update
+    np = None
+
+# Per-enemy plan modes returned by EnemyBatch.plan
+PLAN_SCALAR = 0  # not batched (e.g. Skeleton): run the enemy's own update()
+PLAN_SKIP = 1    # on cooldown this tick: no movement, no attack
+PLAN_MOVE = 2    # move by (dx, dy) * step, then attack check in resolve_attacks()
+
+# Per-enemy arrays, all indexed like EnemyBatch.enemies
+_COLUMNS = (
+    "batched", "x", "y", "speed", "idle_speed", "visibility", "attack_range", "attack_cooldown",
+    "attack_timer", "cooldown", "idle_timer", "idle_dx", "idle_dy", "facing_left", "moving",
+)
+
+
+class EnemyBatch:
+    """Structure-of-arrays AI state for the plain slimes of one enemy list.
+
+    Positions, speeds, ranges, timers, idle direction and facing live in NumPy arrays
+    so aggro, chase vectors, idle wander and attack eligibility are a handful of
+    vectorized operations per tick. The Enemy dataclasses stay the objects the rest
+    of the game draws and damages: positions are read back from them after the
+    (per-enemy, rect based) collision step, facing is pushed to them every tick and
+    the timers are written back by flush() before the batch is discarded.
+    Skeletons keep their own update() and are reported as PLAN_SCALAR.
+    """
+
+    def __init__(self, enemies: list[Enemy]):
+        self.enemies = enemies
+        n = len(enemies)
+        self.n = n
+        self.batched = np.fromiter((type(e) is Enemy for e in enemies), bool, n)
+        self.x = np.fromiter((e.x for e in enemies), float, n)
+        self.y = np.fromiter((e.y for e in enemies), float, n)
+        self.speed = np.fromiter((e.speed for e in enemies), float, n)
+        self.idle_speed = np.fromiter((e.idle_speed for e in enemies), float, n)
+        self.visibility = np.fromiter((e.visibility_range for e in enemies), float, n)
+        self.attack_range = np.fromiter((e.attack_range for e in enemies), float, n)
+        self.attack_cooldown = np.fromiter((e.attack_cooldown for e in enemies), float, n)
+        self.attack_timer = np.fromiter((e.attack_timer for e in enemies), float, n)
+        self.cooldown = np.fromiter((e.cooldown for e in enemies), float, n)
+        self.idle_timer = np.fromiter((e.idle_timer for e in enemies), float, n)
+        self.idle_dx = np.fromiter((e.idle_dir[0] for e in enemies), float, n)
+        self.idle_dy = np.fromiter((e.idle_dir[1] for e in enemies), float, n)
+        self.facing_left = np.fromiter((e.facing_left for e in enemies), bool, n)
+        self.moving = np.zeros(n, bool)
+        # Seed from the stdlib RNG so random.seed() reproduces batched runs too
+        self.rng = np.random.default_rng(random.getrandbits(32))
+
+    def remove(self, index: int) -> None:
+        """Mirror a swap-remove of enemies[index]: the last enemy's row moves into its place."""
+        last = self.n - 1
+        for name in _COLUMNS:
+            column = getattr(self, name)
+            column[index] = column[last]
+            setattr(self, name, column[:last])
+        self.n = last
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def tick_lengths(self, schedule) -> "np.ndarray":
+        """Per-row dt for plan() and resolve_attacks() from an AIScheduler schedule; 0 for rows that sleep."""
+        dt = np.zeros(self.n)
+        for index, enemy, enemy_dt in schedule:
+            dt[index] = enemy_dt
+        return dt
+
+    def plan(self, dt, player) -> tuple[list, list, list, list]:
+        """Vectorized Enemy.plan_move for every batched enemy.
+
+        dt is the tick length, or one per row (tick_lengths()); rows with a dt
+        of 0 are left alone. Returns (modes, dx, dy, step) as plain lists
+        indexed like self.enemies.
+        """
+        x, y = self.x, self.y
+        if np.ndim(dt) == 0:
+            dt = np.full(self.n, dt)
+        awake = dt > 0
+        batched = self.batched & awake
+        cooling = batched & (self.cooldown > 0)
+        self.cooldown[cooling] -= dt[cooling]
+        active = batched & ~cooling
+
+        # --- Aggro: player first, then the torch (kept at attack_range distance) ---
+        chase_x = x.copy()
+        chase_y = y.copy()
+        px, py = player.x, player.y
+        sees_player = np.hypot(px - x, py - y) <= self.visibility
+        chase_x[sees_player] = px
+        chase_y[sees_player] = py
+        in_range = sees_player
+        torch_pos = getattr(getattr(player, "game_ref", None), "torch_ground_pos", None)
+        if torch_pos is not None:
+            tdx = torch_pos[0] - x
+            tdy = torch_pos[1] - y
+            torch_dist = np.hypot(tdx, tdy)
+            sees_torch = ~sees_player & (torch_dist <= self.visibility)
+            approach = sees_torch & (torch_dist > self.attack_range)
+            safe = np.where(approach, torch_dist, 1.0)
+            chase_x = np.where(approach, torch_pos[0] - tdx / safe * self.attack_range, chase_x)
+            chase_y = np.where(approach, torch_pos[1] - tdy / safe * self.attack_range, chase_y)
+            in_range = in_range | sees_torch
+
+        # --- Idle wander: new random heading every second ---
+        idle = active & ~in_range
+        self.idle_timer[idle] += dt[idle]
+        reroll = idle & ((self.idle_timer >= 1.0) | ((self.idle_dx == 0.0) & (self.idle_dy == 0.0)))
+        count = int(np.count_nonzero(reroll))
+        if count:
+            angle = self.rng.uniform(0.0, 2 * math.pi, count)
+            self.idle_dx[reroll] = np.cos(angle)
+            self.idle_dy[reroll] = np.sin(angle)
+            self.idle_timer[reroll] = 0.0
+
+        # --- Chase: unit vector towards chase position, facing follows dx ---
+        chase = active & in_range
+        cdx = chase_x - x
+        cdy = chase_y - y
+        turn_left = chase & (cdx < 0) & ~self.facing_left
+        turn_right = chase & (cdx > 0) & self.facing_left
+        self.facing_left[turn_left] = True
+        self.facing_left[turn_right] = False
+        cdist = np.hypot(cdx, cdy)
+        norm = chase & (cdist > 1)
+        safe = np.where(norm, cdist, 1.0)
+        dx = np.where(idle, self.idle_dx, np.where(norm, cdx / safe, 0.0))
+        dy = np.where(idle, self.idle_dy, np.where(norm, cdy / safe, 0.0))
+        step = np.where(idle, self.idle_speed * dt, self.speed * dt)
+        modes = np.where(self.batched, np.where(active, PLAN_MOVE, PLAN_SKIP), PLAN_SCALAR)
+        self.moving = active
+
+        enemies = self.enemies
+        for i in np.flatnonzero(turn_left | turn_right).tolist():
+            enemies[i].facing_left = bool(self.facing_left[i])
+        return modes.tolist(), dx.tolist(), dy.tolist(), step.tolist()
+
+    def resolve_attacks(self, dt, player) -> None:
+        """Tick attack timers and let every batched enemy in range strike the player (dt as for plan())."""
+        enemies = self.enemies
+        moving = self.moving
+        # Only rows that moved this tick can have a new position to read back
+        rows = np.flatnonzero(moving).tolist()
+        self.x[rows] = [enemies[i].x for i in rows]
+        self.y[rows] = [enemies[i].y for i in rows]
+        if np.ndim(dt) == 0:
+            dt = np.full(self.n, dt)
+        ticking = moving & (self.attack_timer > 0)
+        self.attack_timer[ticking] -= dt[ticking]
+        dist = np.hypot(self.x - player.x, self.y - player.y)
+        strikers = moving & (dist < self.attack_range) & (self.attack_timer <= 0)
+        for i in np.flatnonzero(strikers).tolist():
+            enemies[i].strike(player)
+            self.attack_timer[i] = self.attack_cooldown[i]
+
+    def flush(self) -> None:
+        """Write the array-held timers and idle heading back onto the Enemy objects."""
+        # Enemies spawned since the batch was built are past row n and keep their own state
+        for i, enemy in enumerate(self.enemies[:self.n]):
+            if not self.batched[i]:
+                continue
+            enemy.attack_timer = float(self.attack_timer[i])
+            enemy.cooldown = float(self.cooldown[i])
+            enemy.idle_timer = float(self.idle_timer[i])
+            enemy.idle_dir = (float(self.idle_dx[i]), float(self.idle_dy[i]))
+            enemy.facing_left = bool(self.facing_left[i])
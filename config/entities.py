@@ -0,0 +1,133 @@
+INDEX_BITS = 20
+INDEX_MASK = (1 << INDEX_BITS) - 1
+NO_ENTITY = -1
+
+
+def entity_index(entity_id: int) -> int:
+    return entity_id & INDEX_MASK
+
+
+def entity_generation(entity_id: int) -> int:
+    return entity_id >> INDEX_BITS
+
+
+class ComponentTable:
+    """One kind of component stored densely, addressed by entity id (a sparse set).
+
+    items is a plain list, so whole-table passes iterate it directly; get(),
+    add() and remove() are O(1). remove() moves the last component into the
+    gap (swap-remove), so items keeps no holes but its order is not stable.
+    Components must be instances of kind.
+    """
+
+    def __init__(self, name: str, kind: type = object):
+        self.name = name
+        self.kind = kind
+        self.items: list = []
+        self.entities: list[int] = []  # entity id of items[i]
+        self._dense: dict[int, int] = {}  # entity index -> position in items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, entity_id: int) -> bool:
+        i = self._dense.get(entity_id & INDEX_MASK)
+        return i is not None and self.entities[i] == entity_id
+
+    def add(self, entity_id: int, component) -> None:
+        if not isinstance(component, self.kind):
+            raise TypeError(f"{self.name} components must be {self.kind.__name__}, not {type(component).__name__}")
+        index = entity_id & INDEX_MASK
+        if index in self._dense:
+            raise ValueError(f"entity {entity_id} already has a {self.name} component")
+        self._dense[index] = len(self.items)
+        self.items.append(component)
+        self.entities.append(entity_id)
+
+    def get(self, entity_id: int, default=None):
+        i = self._dense.get(entity_id & INDEX_MASK)
+        if i is None or self.entities[i] != entity_id:
+            return default
+        return self.items[i]
+
+    def index(self, entity_id: int):
+        """Position of entity_id's component in items, or None if it has none."""
+        i = self._dense.get(entity_id & INDEX_MASK)
+        if i is None or self.entities[i] != entity_id:
+            return None
+        return i
+
+    def remove(self, entity_id: int):
+        """Drop entity_id's component; returns the position it had in items, or None if it had none."""
+        i = self._dense.get(entity_id & INDEX_MASK)
+        if i is None or self.entities[i] != entity_id:
+            return None
+        del self._dense[entity_id & INDEX_MASK]
+        last = len(self.items) - 1
+        if i != last:
+            self.items[i] = self.items[last]
+            moved = self.entities[i] = self.entities[last]
+            self._dense[moved & INDEX_MASK] = i
+        self.items.pop()
+        self.entities.pop()
+        return i
+
+
+class EntityRegistry:
+    """Hands out entity ids and keeps the component tables that belong to them.
+
+    An id packs a slot index (low INDEX_BITS bits) with the slot's generation.
+    destroy() bumps the generation before the slot is reused, so an id kept
+    after its entity died (in a hit set, a health bar) never matches the new
+    occupant: alive() is False and table lookups miss.
+    """
+
+    def __init__(self):
+        self.generations: list[int] = []
+        self.free: list[int] = []
+        self.tables: dict[str, ComponentTable] = {}
+
+    def __len__(self) -> int:
+        return len(self.generations) - len(self.free)
+
+    def table(self, name: str, kind: type = object) -> ComponentTable:
+        """The component table called name, created on first use."""
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = ComponentTable(name, kind)
+        return table
+
+    def alive(self, entity_id: int) -> bool:
+        index = entity_id & INDEX_MASK
+        return 0 <= entity_id and index < len(self.generations) and self.generations[index] == entity_id >> INDEX_BITS
+
+    def spawn(self, **components) -> int:
+        """New entity with the given components (table name -> component); returns its id."""
+        if self.free:
+            index = self.free.pop()
+        else:
+            index = len(self.generations)
+            if index > INDEX_MASK:
+                raise OverflowError("entity registry is full")
+            self.generations.append(0)
+        entity_id = (self.generations[index] << INDEX_BITS) | index
+        for name, component in components.items():
+            self.tables[name].add(entity_id, component)
+        return entity_id
+
+    def destroy(self, entity_id: int) -> dict[str, int]:
+        """Remove entity_id from every table; returns table name -> position its component had."""
+        if not self.alive(entity_id):
+            return {}
+        removed = {}
+        for name, table in self.tables.items():
+            i = table.remove(entity_id)
+            if i is not None:
+                removed[name] = i
+        index = entity_id & INDEX_MASK
+        self.generations[index] += 1
+        self.free.append(index)
+        return removed
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+import pygame
+from config.text import get_font, render_text
+
+
+class Widget(ABC):
+    """HUD element kept as a rendered surface.
+
+    state(game) returns whatever the picture depends on (rounded values, the
+    label string); render(state) is only called when that changes, so an idle
+    widget costs one blit per frame.
+    """
+
+    def __init__(self, pos):
+        self.pos = pos
+        self.state_key = None
+        self.surface = None
+        self.offset = (0, 0)  # where the surface goes relative to pos
+        self.renders = 0
+
+    @abstractmethod
+    def state(self, game):
+        ...
+
+    @abstractmethod
+    def render(self, state) -> pygame.Surface:
+        ...
+
+    def invalidate(self) -> None:
+        self.state_key = None
+
+    def refresh(self, game) -> pygame.Surface:
+        """The widget's surface, re-rendered first if its state changed."""
+        state = self.state(game)
+        if state != self.state_key or self.surface is None:
+            self.surface = self.render(state)
+            self.state_key = state
+            self.renders += 1
+        return self.surface
+
+    def draw(self, screen: pygame.Surface, game) -> None:
+        self.refresh(game)
+        screen.blit(self.surface, (self.pos[0] + self.offset[0], self.pos[1] + self.offset[1]))
+
+
+class Bar(Widget):
+    """Rounded bar filled to ratio(game), with label(game) written over its left end."""
+
+    def __init__(self, pos, size, color, border: int, ratio, label, back=(40, 40, 40), text_color=(255, 255, 255)):
+        super().__init__(pos)
+        self.size = size
+        self.color = color
+        self.border = border
+        self.ratio = ratio
+        self.label = label
+        self.back = back
+        self.text_color = text_color
+
+    def state(self, game):
+        ratio = min(1.0, max(0.0, self.ratio(game)))
+        return int(self.size[0] * ratio), self.label(game)
+
+    def render(self, state) -> pygame.Surface:
+        fill, label = state
+        w, h = self.size
+        text = render_text(get_font("arial", 28, bold=True), label, self.text_color)
+        # The label is taller than the thinner bars, so the surface grows around the bar
+        top = max(0, (text.get_height() - h + 1) // 2)
+        surf = pygame.Surface((max(w, 12 + text.get_width()), h + top * 2), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        surf.fill((0, 0, 0, 0))
+        pygame.draw.rect(surf, self.back, (0, top, w, h), border_radius=10)
+        pygame.draw.rect(surf, self.color, (0, top, fill, h), border_radius=10)
+        pygame.draw.rect(surf, (0, 0, 0), (0, top, w, h), self.border, border_radius=10)
+        surf.blit(text, (12, top + h // 2 - text.get_height() // 2))
+        self.offset = (0, -top)
+        return surf
+
+
+class Hud:
+    def __init__(self, widgets):
+        self.widgets = list(widgets)
+
+    def invalidate(self) -> None:
+        for widget in self.widgets:
+            widget.invalidate()
+
+    def draw(self, screen: pygame.Surface, game) -> None:
+        for widget in self.widgets:
+            widget.draw(screen, game)
+
+
+def player_hud(x: int = 40, y: int = 20, width: int = 400) -> Hud:
+    """HP, stamina, mana and XP/level bars stacked in the top-left corner."""
+    widgets = []
+    for color, height, border, ratio, label in (
+        ((255, 80, 80), 32, 4,
+         lambda g: g.player.hp / g.player.max_hp,
+         lambda g: f"HP: {int(g.player.hp)} / {g.player.max_hp}"),
+        ((80, 200, 80), 24, 3,
+         lambda g: g.player.stamina / (g.player.vitality * 20),
+         lambda g: f"Stamina: {int(g.player.stamina)} / {g.player.vitality * 20}"),
+        ((80, 80, 200), 24, 3,
+         lambda g: g.player.mana / g.player.max_mana,
+         lambda g: f"Mana: {int(g.player.mana)} / {g.player.max_mana}"),
+        ((255, 215, 0), 18, 2,
+         lambda g: g.player.xp / g.player.max_xp,
+         lambda g: f"XP: {int(g.player.xp)} / {g.player.max_xp}   Level: {g.player.level}"),
+    ):
+        widgets.append(Bar((x, y), (width, height), color, border, ratio, label))
+        y += height + 12
+    return Hud(widgets)
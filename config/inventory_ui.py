@@ -0,0 +1,432 @@
+import pygame
+from config.hud import Widget
+from config.text import get_font, render_text
+from config.sprites import sprite_frame
+
+TAB_NAMES = ("Inventory", "Stats", "Skills")
+TITLES = ("INVENTORY", "PLAYER STATS", "SKILLS")
+SKILLS = (
+    "Fireball   [Select]",
+    # TODO: List more skills and selection logic
+)
+HINT = "Press I or Tab to close | ←/→ or 1/2/3 to switch tabs"
+
+SLOT_SIZE = 64  # equipment slots
+SLOT_GAP = 24
+INV_COLS, INV_ROWS = 5, 8
+INV_SLOT_SIZE = 56
+INV_GAP = 12
+STAT_NAMES = ("Strength", "Dexterity", "Vitality", "Intelligence")
+STAT_BUTTON_SIZE = 32
+
+
+def drop_zone_rect(screen: pygame.Surface) -> pygame.Rect:
+    """Where a dragged item is dropped to throw it away (lower third + 80px)."""
+    w, h = 420, 180
+    return pygame.Rect(screen.get_width() // 2 - w // 2, int(screen.get_height() * 2 / 3 - h // 2 + 80), w, h)
+
+
+def stat_button_rect(screen_w: int, index: int) -> pygame.Rect:
+    """The [+] button of STAT_NAMES[index] on the stats tab."""
+    return pygame.Rect(screen_w // 2 + 180, 220 + 11 * 40 + index * 56, STAT_BUTTON_SIZE, STAT_BUTTON_SIZE)
+
+
+def _panel(rect: pygame.Rect) -> pygame.Surface:
+    surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    surf.fill((0, 0, 0, 0))
+    return surf
+
+
+def _item_icon(item, size: int, sword_img):
+    """item's icon scaled to size (cached by sprite_frame), or None for the placeholder circle."""
+    image = getattr(item, "image", None)
+    if not image and getattr(item, "name", None) == "Sword":
+        image = sword_img
+    return sprite_frame(image, (size, size)) if image else None
+
+
+def _draw_slot_item(surf, item, center, slot_size: int, sword_img) -> None:
+    icon = _item_icon(item, slot_size - 12, sword_img)
+    if icon is not None:
+        surf.blit(icon, (center[0] - icon.get_width() // 2, center[1] - icon.get_height() // 2))
+    else:
+        pygame.draw.circle(surf, (200, 200, 80), center, slot_size // 3)
+
+
+# --- Panels ---
+# Each panel is a hud.Widget: its surface is only redrawn when its state (the
+# items in its slots, the player's stats) differs from the last frame's.
+
+class EquipmentPanel(Widget):
+    def __init__(self, slot_rects: dict):
+        self.slot_rects = slot_rects
+        area = pygame.Rect(next(iter(slot_rects.values()))).unionall(list(slot_rects.values()))
+        # Room for the labels under the slots, which are wider than a slot
+        self.area = pygame.Rect(area.x - 60, area.y, area.width + 120, area.height + 40)
+        super().__init__(self.area.topleft)
+
+    def state(self, game):
+        return tuple(game.player.equipment.get(name) for name in self.slot_rects), game.sword_img
+
+    def render(self, state) -> pygame.Surface:
+        items, sword_img = state
+        surf = _panel(self.area)
+        slot_font = get_font("arial", 22, bold=True)
+        ox, oy = self.area.topleft
+        for (name, rect), item in zip(self.slot_rects.items(), items):
+            rect = rect.move(-ox, -oy)
+            pygame.draw.rect(surf, (80, 80, 80), rect, border_radius=10)
+            pygame.draw.rect(surf, (160, 160, 160), rect, 3, border_radius=10)
+            label = render_text(slot_font, name, (220, 220, 220))
+            surf.blit(label, (rect.centerx - label.get_width() // 2, rect.bottom + 4))
+            if item is not None:
+                _draw_slot_item(surf, item, rect.center, SLOT_SIZE, sword_img)
+        return surf
+
+
+class InventoryPanel(Widget):
+    def __init__(self, slot_rects: list):
+        self.slot_rects = slot_rects
+        self.area = slot_rects[0].unionall(slot_rects)
+        super().__init__(self.area.topleft)
+
+    def state(self, game):
+        # The slot an item is being dragged from is drawn empty
+        dragged = game.dragged_item_idx if game.dragged_item is not None else None
+        return tuple(game.player.inventory[:len(self.slot_rects)]), dragged, game.sword_img
+
+    def render(self, state) -> pygame.Surface:
+        items, dragged, sword_img = state
+        surf = _panel(self.area)
+        ox, oy = self.area.topleft
+        for idx, (rect, item) in enumerate(zip(self.slot_rects, items)):
+            rect = rect.move(-ox, -oy)
+            pygame.draw.rect(surf, (60, 60, 60), rect, border_radius=8)
+            pygame.draw.rect(surf, (120, 120, 120), rect, 2, border_radius=8)
+            if item is not None and idx != dragged:
+                _draw_slot_item(surf, item, rect.center, INV_SLOT_SIZE, sword_img)
+        return surf
+
+
+class StatsPanel(Widget):
+    def __init__(self, screen_w: int):
+        self.screen_w = screen_w
+        self.area = pygame.Rect(screen_w // 2 - 400, 200, 800, 11 * 40 + 4 * 56 + 40)
+        super().__init__(self.area.topleft)
+
+    def state(self, game):
+        p = game.player
+        weapon = p.equipment.get("Main Hand")
+        weapon_attack = None
+        if weapon is not None and hasattr(weapon, "get_attack_damage") and weapon.attack_min is not None:
+            weapon_attack = (weapon.attack_min, weapon.attack_max)
+        return (
+            p.level, int(p.xp), p.max_xp, int(p.hp), p.max_hp, int(p.mana), p.max_mana,
+            int(p.stamina), p.vitality, p.strength, p.dexterity, p.intelligence, p.stat_points, weapon_attack,
+        )
+
+    def render(self, state) -> pygame.Surface:
+        (level, xp, max_xp, hp, max_hp, mana, max_mana, stamina, vitality,
+         strength, dexterity, intelligence, stat_points, weapon_attack) = state
+        surf = _panel(self.area)
+        ox, oy = self.area.topleft
+        cx = self.screen_w // 2 - ox
+
+        def centered(text_surf, y):
+            surf.blit(text_surf, (cx - text_surf.get_width() // 2, y - oy))
+
+        stats_font = get_font("arial", 28)
+        stats = [
+            f"Level: {level}",
+            f"XP: {xp} / {max_xp}",
+            f"HP: {hp} / {max_hp}",
+            f"Mana: {mana} / {max_mana}",
+            f"Stamina: {stamina} / {vitality * 20}",
+        ]
+        for i, line in enumerate(stats):
+            centered(render_text(stats_font, line, (220, 220, 220)), 220 + i * 40)
+        # Regeneration calculations (rounded)
+        hp_regen = int(round(10 * vitality * (level * 0.2)))
+        mana_regen = int(round(10 * intelligence * (level * 0.2)))
+        bold_font = get_font("arial", 24, bold=True)
+        centered(render_text(bold_font, f"HP Regeneration: {hp_regen} / sec", (120, 255, 120)), 220 + 6 * 40)
+        centered(render_text(bold_font, f"Mana Regeneration: {mana_regen} / sec", (120, 180, 255)), 220 + 7 * 40)
+
+        # Base damage (player's base melee damage range), and with the weapon equipped
+        min_base = 1 + (strength - 1) * 5
+        max_base = 5 + (strength - 1) * 5
+        if weapon_attack is not None:
+            min_final, max_final = weapon_attack[0] * min_base, weapon_attack[1] * max_base
+        else:
+            min_final, max_final = min_base, max_base
+        centered(render_text(bold_font, f"Base Damage: {min_base} - {max_base}", (255, 180, 80)), 220 + 8 * 40)
+        centered(render_text(bold_font, f"Final Damage: {min_final} - {max_final}", (80, 180, 255)), 220 + 9 * 40)
+        centered(render_text(bold_font, f"Unassigned Stat Points: {stat_points}", (255, 215, 0)), 220 + 10 * 40)
+
+        # Stat assign buttons (centered and spaced)
+        btn_font = get_font("arial", 28, bold=True)
+        plus_surf = render_text(btn_font, "+", (0, 0, 0))
+        color = (80, 200, 80) if stat_points > 0 else (120, 120, 120)
+        stat_x = self.screen_w // 2 - 120 - ox
+        for i, (name, value) in enumerate(zip(STAT_NAMES, (strength, dexterity, vitality, intelligence))):
+            btn_rect = stat_button_rect(self.screen_w, i).move(-ox, -oy)
+            surf.blit(render_text(stats_font, f"{name}: {value}", (220, 220, 220)), (stat_x, btn_rect.y))
+            pygame.draw.rect(surf, color, btn_rect, border_radius=8)
+            surf.blit(plus_surf, (btn_rect.centerx - plus_surf.get_width() // 2, btn_rect.centery - plus_surf.get_height() // 2))
+        return surf
+
+
+class ItemTooltip(Widget):
+    """Stats box for the hovered item; move it with pos before draw()."""
+
+    WIDTH = 340
+    LINE_HEIGHT = 32
+
+    def __init__(self):
+        super().__init__((0, 0))
+        self.item = None
+
+    def state(self, game):
+        return self.item
+
+    def render(self, item) -> pygame.Surface:
+        lines = [
+            f"Name: {getattr(item, 'name', '')}",
+            f"Type: {getattr(item, 'item_type', '')}",
+            f"Level: {getattr(item, 'level', 1)}"
+        ]
+        # Weapon stats
+        if getattr(item, "attack_min", None) is not None and hasattr(item, "attack_max"):
+            lines.append(f"Attack: {item.attack_min} - {item.attack_max}")
+        if getattr(item, "attack_speed", None) is not None:
+            lines.append(f"Attack Speed: {item.attack_speed}")
+        # Magic damage
+        magic_min, magic_max = getattr(item, "magic_min", None), getattr(item, "magic_max", None)
+        if magic_min is not None and magic_max is not None and (magic_min > 0 or magic_max > 0):
+            lines.append(f"Magic Damage: {magic_min} - {magic_max}")
+        if getattr(item, "armor", None) is not None and item.armor > 0:
+            lines.append(f"Armor: {item.armor}")
+        if getattr(item, "speed", None) is not None and item.speed > 0:
+            lines.append(f"Speed: {item.speed}")
+        if getattr(item, "bonus", None):
+            lines.append(f"Bonus: {item.bonus}")
+
+        rect = pygame.Rect(0, 0, self.WIDTH, 32 + len(lines) * self.LINE_HEIGHT + 16)
+        surf = _panel(rect)
+        pygame.draw.rect(surf, (30, 30, 30), rect, border_radius=14)
+        pygame.draw.rect(surf, (160, 160, 160), rect, 3, border_radius=14)
+        stat_font = get_font("arial", 24, bold=True)
+        for i, line in enumerate(lines):
+            surf.blit(render_text(stat_font, line, (220, 220, 220)), (18, 18 + i * self.LINE_HEIGHT))
+        return surf
+
+    def place(self, mouse, screen_size) -> None:
+        """Put the box below-right of the mouse, kept on screen."""
+        w, h = self.surface.get_size()
+        x, y = mouse[0] + 24, mouse[1] + 24
+        if x + w > screen_size[0]:
+            x = screen_size[0] - w - 16
+        if y + h > screen_size[1]:
+            y = screen_size[1] - h - 16
+        self.pos = (x, y)
+
+
+def _drop_zone_surface(size) -> pygame.Surface:
+    w, h = size
+    surf = _panel(pygame.Rect(0, 0, w + 2, h + 2))
+    pygame.draw.rect(surf, (180, 180, 180), (0, 0, w, h), border_radius=24)
+    dash_color = (120, 120, 120)
+    dash_len = 18
+    gap_len = 10
+    for x in range(0, w, dash_len + gap_len):
+        pygame.draw.line(surf, dash_color, (x, 0), (min(x + dash_len, w), 0), 3)
+        pygame.draw.line(surf, dash_color, (x, h), (min(x + dash_len, w), h), 3)
+    for y in range(0, h, dash_len + gap_len):
+        pygame.draw.line(surf, dash_color, (0, y), (0, min(y + dash_len, h)), 3)
+        pygame.draw.line(surf, dash_color, (w, y), (w, min(y + dash_len, h)), 3)
+    drop_text = render_text(get_font("arial", 36, bold=True), "Drop Item Here", (60, 60, 60))
+    surf.blit(drop_text, (w // 2 - drop_text.get_width() // 2, h // 2 - drop_text.get_height() // 2))
+    return surf
+
+
+class InventoryOverlay:
+    """The inventory/stats/skills screen shown while the game is paused.
+
+    The game frame behind it is snapshotted (and darkened) once when the
+    overlay opens, and each tab's static parts (tabs, title, hints) are baked
+    onto a copy of it. Slots, stats and the tooltip are cached panels that
+    re-render only when what they show changes, and draw() skips the frame
+    entirely when neither they nor the mouse changed. close() drops the
+    snapshot, so the next open captures the scene again.
+    """
+
+    def __init__(self):
+        self.size = None
+        self.snapshot = None
+        self._backgrounds = {}  # tab -> snapshot with that tab's static text
+        self._frame_key = None
+
+    def close(self) -> None:
+        self.snapshot = None
+        self._backgrounds.clear()
+        self._frame_key = None
+
+    def _layout(self, screen: pygame.Surface) -> None:
+        self.size = screen.get_size()
+        w = screen.get_width()
+        tab_w, tab_h, tab_y = 220, 48, 40
+        tab_x_start = w // 2 - tab_w * len(TAB_NAMES) // 2
+        self.tab_rects = [pygame.Rect(tab_x_start + i * tab_w, tab_y, tab_w, tab_h) for i in range(len(TAB_NAMES))]
+
+        left_x = w // 4
+        right_x = 3 * w // 4
+        center_y = 220
+        step = SLOT_SIZE + SLOT_GAP
+        centers = {
+            "Helmet": (left_x, center_y),
+            "Armor": (left_x, center_y + step),
+            "Main Hand": (left_x - step, center_y + 2 * step),
+            "Off Hand": (left_x + step, center_y + 2 * step),
+            "Boots": (left_x, center_y + 3 * step),
+        }
+        acc_x_start = left_x - 2 * step + SLOT_SIZE // 2
+        for i in range(4):
+            centers[f"Accessory {i + 1}"] = (acc_x_start + i * step, center_y + 4 * step)
+        self.equip_rects = {
+            name: pygame.Rect(sx - SLOT_SIZE // 2, sy - SLOT_SIZE // 2, SLOT_SIZE, SLOT_SIZE)
+            for name, (sx, sy) in centers.items()
+        }
+        grid_start_x = right_x - ((INV_COLS * INV_SLOT_SIZE + (INV_COLS - 1) * INV_GAP) // 2)
+        self.inv_rects = [
+            pygame.Rect(grid_start_x + col * (INV_SLOT_SIZE + INV_GAP), center_y + row * (INV_SLOT_SIZE + INV_GAP), INV_SLOT_SIZE, INV_SLOT_SIZE)
+            for row in range(INV_ROWS) for col in range(INV_COLS)
+        ]
+        self.inv_hint_pos = (right_x, center_y + INV_ROWS * (INV_SLOT_SIZE + INV_GAP) + 32)
+        self.drop_zone = drop_zone_rect(screen)
+
+        self.equipment = EquipmentPanel(self.equip_rects)
+        self.inventory = InventoryPanel(self.inv_rects)
+        self.stats = StatsPanel(w)
+        self.tooltip = ItemTooltip()
+        self.drop_zone_surf = _drop_zone_surface(self.drop_zone.size)
+        self._backgrounds.clear()
+
+    def tab_at(self, pos):
+        """Index of the tab under pos, or None."""
+        if self.size is None:
+            return None
+        for i, rect in enumerate(self.tab_rects):
+            if rect.collidepoint(pos):
+                return i
+        return None
+
+    def _background(self, screen: pygame.Surface, tab_index: int) -> pygame.Surface:
+        background = self._backgrounds.get(tab_index)
+        if background is not None:
+            return background
+        if self.snapshot is None:
+            # The last game frame is still on the screen: darken it once and keep it
+            self.snapshot = screen.copy()
+            shade = pygame.Surface(self.size, pygame.SRCALPHA)
+            shade.fill((0, 0, 0, 180))
+            self.snapshot.blit(shade, (0, 0))
+        background = self.snapshot.copy()
+        w = self.size[0]
+
+        tab_font = get_font("arial", 32, bold=True)
+        for i, (name, rect) in enumerate(zip(TAB_NAMES, self.tab_rects)):
+            color = (255, 215, 0) if i == tab_index else (120, 120, 120)
+            pygame.draw.rect(background, color, rect, border_radius=12)
+            tab_text = render_text(tab_font, name, (0, 0, 0))
+            background.blit(tab_text, (rect.centerx - tab_text.get_width() // 2, rect.centery - tab_text.get_height() // 2))
+        if 0 <= tab_index < len(TITLES):
+            title = render_text(get_font("arial", 48, bold=True), TITLES[tab_index], (255, 255, 255))
+            background.blit(title, (w // 2 - title.get_width() // 2, 120))
+        if tab_index == 0:
+            inv_text = render_text(get_font("arial", 28), "Click equipment/inventory slots to move items.", (220, 220, 220))
+            background.blit(inv_text, (self.inv_hint_pos[0] - inv_text.get_width() // 2, self.inv_hint_pos[1]))
+        elif tab_index == 2:
+            skills_font = get_font("arial", 28)
+            for i, line in enumerate(SKILLS):
+                skill_surf = render_text(skills_font, line, (220, 220, 220))
+                background.blit(skill_surf, (w // 2 - skill_surf.get_width() // 2, 220 + i * 40))
+        hint = render_text(get_font("arial", 24), HINT, (180, 180, 180))
+        background.blit(hint, (w // 2 - hint.get_width() // 2, self.size[1] - 80))
+        self._backgrounds[tab_index] = background
+        return background
+
+    def _hovered_item(self, game, mouse):
+        for name, rect in self.equip_rects.items():
+            if rect.collidepoint(mouse):
+                return game.player.equipment.get(name)
+        for idx, rect in enumerate(self.inv_rects):
+            if rect.collidepoint(mouse):
+                if game.dragged_item is not None and game.dragged_item_idx == idx:
+                    return None
+                return game.player.inventory[idx]
+        return None
+
+    def _level_messages(self, game):
+        """The fading "Level N required" messages, as (text, color, alpha, slot rect)."""
+        messages = []
+        for dmg in game.damage_numbers:
+            value = dmg.get("value", "")
+            if not (isinstance(value, str) and value.startswith("Level ")):
+                continue
+            for rect in list(self.equip_rects.values()) + self.inv_rects:
+                if abs(dmg["x"] - rect.centerx) < 24 and abs(dmg["y"] - (rect.top - 24)) < 24:
+                    messages.append((value, tuple(dmg["color"]), dmg["alpha"], rect))
+                    break
+        return messages
+
+    def draw(self, game, tab_index: int = 0) -> bool:
+        """Draw the overlay onto game.screen; False (and nothing drawn) when it looks as it did last call."""
+        screen = game.screen
+        if self.size != screen.get_size():
+            self._layout(screen)
+            self.close()
+        # Game reads these to hit-test clicks and drops
+        game._equip_slot_rects = self.equip_rects
+        game._inv_slot_rects = self.inv_rects
+
+        mouse = pygame.mouse.get_pos()
+        panels = ()
+        messages = ()
+        self.tooltip.item = None
+        if tab_index == 0:
+            panels = (self.equipment, self.inventory)
+            self.tooltip.item = self._hovered_item(game, mouse)
+            messages = self._level_messages(game)
+        elif tab_index == 1:
+            panels = (self.stats,)
+        dragging = game.dragged_item is not None and game.dragged_item_rect is not None
+        states = tuple(panel.state(game) for panel in panels)
+        frame_key = (tab_index, states, self.tooltip.item, messages, mouse if dragging or self.tooltip.item else None)
+        if frame_key == self._frame_key:
+            return False
+        self._frame_key = frame_key
+
+        screen.blit(self._background(screen, tab_index), (0, 0))
+        for panel in panels:
+            panel.draw(screen, game)
+        if messages:
+            font = get_font("arial", 22, bold=True)
+            for value, color, alpha, rect in messages:
+                msg_surf = render_text(font, value, color, alpha=alpha)
+                screen.blit(msg_surf, (rect.centerx - msg_surf.get_width() // 2, rect.top - 48))
+        if self.tooltip.item is not None:
+            self.tooltip.refresh(game)  # the box size depends on the item, so render before placing it
+            self.tooltip.place(mouse, self.size)
+            screen.blit(self.tooltip.surface, self.tooltip.pos)
+        if dragging:
+            # Dragged item under the mouse, over the drop zone
+            screen.blit(self.drop_zone_surf, self.drop_zone.topleft)
+            slot_size = game.dragged_item_rect.width
+            icon = _item_icon(game.dragged_item, slot_size - 12, None)
+            if icon is not None:
+                screen.blit(icon, (mouse[0] - icon.get_width() // 2, mouse[1] - icon.get_height() // 2))
+            else:
+                pygame.draw.circle(screen, (200, 200, 80), mouse, slot_size // 3)
+        return True
@@ -1,19 +1,35 @@
 import pygame
 
-def get_icon(path):
-    # Only load icon if display is initialized
-    if pygame.display.get_init():
-        return pygame.image.load(path).convert_alpha()
-    return None
-
-# Load icons (replace with correct paths if needed)
-ICON_SWORD = get_icon("textures/sword/sword.png")
-ICON_STAFF = get_icon("textures/sword/sword_slash1.png")
-ICON_BOW = get_icon("textures/player_movement/back1.png")
-ICON_HELMET = get_icon("textures/player_movement/front1.png")
-ICON_ARMOR = get_icon("textures/player_movement/right1.png")
-ICON_BOOTS = get_icon("textures/player_movement/left1.png")
-ICON_RING = get_icon("textures/torch/torch.png")
+# Icons are assets (config/assets.py MANIFEST, "icon_*"), loaded by the game's AssetManager
+_assets = None
+
+
+def use_icon_assets(assets) -> None:
+    """Load item icons through assets (Game calls this with its AssetManager)."""
+    global _assets
+    _assets = assets
+
+
+def get_icon(name):
+    """Icon surface for an item's icon asset name, or None before the game's assets exist.
+
+    Item dicts only carry the asset name, so importing this module loads nothing
+    (it used to load every icon at import time and got None before set_mode).
+    """
+    if name is None or isinstance(name, pygame.Surface):
+        return name
+    if _assets is None:
+        return None
+    return _assets.get(name)
+
+# Icon asset names
+ICON_SWORD = "icon_sword"
+ICON_STAFF = "icon_staff"
+ICON_BOW = "icon_bow"
+ICON_HELMET = "icon_helmet"
+ICON_ARMOR = "icon_armor"
+ICON_BOOTS = "icon_boots"
+ICON_RING = "icon_ring"
 
 # Melee weapon
 ITEM_SWORD = {
@@ -0,0 +1,97 @@
+import pygame
+from config.config import LIGHT_FLICKER_VARIANTS, LIGHT_FLICKER_AMPLITUDE, LIGHT_FLICKER_HZ
+
+
+def radial_mask(radius: int) -> pygame.Surface:
+    """Radial gradient, alpha 255 at the centre fading to 0 at radius (subtracted from the darkness)."""
+    mask = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    for r in range(radius, 0, -1):
+        alpha = int(255 * (1 - r / radius))
+        pygame.draw.circle(mask, (0, 0, 0, alpha), (radius, radius), r)
+    return mask
+
+
+class LightMaskAtlas:
+    """Every light mask the game uses, drawn once.
+
+    Variant 0 is the plain gradient for a radius; variants 1..LIGHT_FLICKER_VARIANTS
+    are the same gradient a few percent smaller or larger, cycled to make a light flicker.
+    """
+
+    def __init__(self, variants: int = LIGHT_FLICKER_VARIANTS, amplitude: float = LIGHT_FLICKER_AMPLITUDE):
+        self.variants = variants
+        self.amplitude = amplitude
+        self.masks: dict[tuple[int, int], pygame.Surface] = {}
+
+    def mask(self, radius: int, variant: int = 0) -> pygame.Surface:
+        key = (radius, variant)
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = self.masks[key] = radial_mask(self._variant_radius(radius, variant))
+        return mask
+
+    def _variant_radius(self, radius: int, variant: int) -> int:
+        if variant == 0 or self.variants < 2:
+            return radius
+        # Spread the variants evenly over radius * (1 +/- amplitude)
+        offset = -1.0 + 2.0 * (variant - 1) / (self.variants - 1)
+        return max(1, round(radius * (1.0 + self.amplitude * offset)))
+
+    def warm(self, radii, flicker: bool = False) -> None:
+        """Draw the masks for radii up front (at load time rather than mid-game)."""
+        for radius in radii:
+            self.mask(radius)
+            if flicker:
+                for variant in range(1, self.variants + 1):
+                    self.mask(radius, variant)
+
+
+# Order the flicker variants are played in, so the glow wavers instead of pulsing
+_FLICKER_SEQUENCE = (3, 5, 2, 6, 4, 1, 5, 3, 6, 2, 4, 1)
+
+
+class Lighting:
+    """Darkness overlay with light masks subtracted from it.
+
+    The darkness buffer lives as long as the game. Each frame only the areas the
+    previous frame's lights cleared are refilled, unless the darkness level
+    changed, so a frame costs one blit per light plus the final full-screen blit.
+    """
+
+    def __init__(self, atlas: LightMaskAtlas = None):
+        self.atlas = atlas if atlas is not None else LightMaskAtlas()
+        self.darkness: pygame.Surface = None
+        self._alpha = None
+        self._dirty: list[pygame.Rect] = []
+
+    def _buffer_for(self, size) -> pygame.Surface:
+        if self.darkness is None or self.darkness.get_size() != size:
+            self.darkness = pygame.Surface(size, pygame.SRCALPHA)
+            self._alpha = None
+        return self.darkness
+
+    def flicker_variant(self, seed: int = 0) -> int:
+        if self.atlas.variants < 2:
+            return 0
+        step = pygame.time.get_ticks() * LIGHT_FLICKER_HZ // 1000 + seed
+        return (_FLICKER_SEQUENCE[step % len(_FLICKER_SEQUENCE)] - 1) % self.atlas.variants + 1
+
+    def render(self, surf: pygame.Surface, darkness_alpha: int, lights) -> None:
+        """Darken surf, leaving a glow around every (center, radius, flicker) light."""
+        darkness = self._buffer_for(surf.get_size())
+        color = (0, 0, 0, darkness_alpha)
+        if darkness_alpha != self._alpha:
+            darkness.fill(color)
+            self._alpha = darkness_alpha
+        else:
+            for rect in self._dirty:
+                darkness.fill(color, rect)
+        dirty = []
+        for i, (center, radius, flicker) in enumerate(lights):
+            mask = self.atlas.mask(radius, self.flicker_variant(i) if flicker else 0)
+            half = mask.get_width() // 2
+            rect = darkness.blit(mask, (center[0] - half, center[1] - half), special_flags=pygame.BLEND_RGBA_SUB)
+            if rect.width and rect.height:
+                dirty.append(rect)
+        self._dirty = dirty
+        surf.blit(darkness, (0, 0))
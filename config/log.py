@@ -0,0 +1,171 @@
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+from functools import partial
+from config.config import LOG_LEVEL, LOG_LEVELS, LOG_RATE, LOG_BURST, LOG_BUFFER_SIZE, LOG_FLUSH_INTERVAL, LOG_OUTPUT
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+_LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+
+def _noop(*args):
+    pass
+
+
+def _level(value) -> int:
+    return _LEVELS_BY_NAME[value.upper()] if isinstance(value, str) else int(value)
+
+
+class LogSink:
+    """Ring buffer of log records, written out by a background thread.
+
+    Loggers only append a tuple to a bounded deque (a single atomic append, no
+    lock and no I/O); formatting and writing happen on the flush thread every
+    LOG_FLUSH_INTERVAL seconds. When the buffer is full the oldest records are
+    dropped, and the next flush reports how many were lost.
+    """
+
+    def __init__(self, size: int = LOG_BUFFER_SIZE, interval: float = LOG_FLUSH_INTERVAL, output: str = LOG_OUTPUT):
+        self.records = deque(maxlen=size)
+        self.interval = interval
+        self.output = output
+        self.dropped = 0
+        self._file = None
+        self._lock = threading.Lock()  # flush() may run on the flush thread and at exit at once
+        self._wake = threading.Event()
+        self._thread = None
+
+    def append(self, record) -> None:
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        self.records.append(record)
+        if self._thread is None:
+            self._start()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="log-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._wake.wait(self.interval):
+            self.flush()
+
+    def _stream(self):
+        if self.output is None:
+            return sys.stderr
+        if self._file is None:
+            self._file = open(self.output, "a", encoding="utf-8")
+        return self._file
+
+    def flush(self) -> None:
+        with self._lock:
+            lines = []
+            while True:
+                try:
+                    record = self.records.popleft()
+                except IndexError:
+                    break
+                lines.append(format_record(record))
+            if self.dropped:
+                lines.append(format_record((time.time(), WARNING, "log", "%d records dropped (buffer full)", (self.dropped,), 0)))
+                self.dropped = 0
+            if not lines:
+                return
+            stream = self._stream()
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+
+    def close(self) -> None:
+        self._wake.set()
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def format_record(record) -> str:
+    stamp, level, category, msg, args, suppressed = record
+    if args:
+        try:
+            msg = msg % args
+        except (TypeError, ValueError) as e:
+            msg = f"{msg!r} % {args!r} ({e})"
+    clock = time.strftime("%H:%M:%S", time.localtime(stamp)) + f".{int(stamp * 1000) % 1000:03d}"
+    line = f"{clock} {LEVEL_NAMES.get(level, level)} {category}: {msg}"
+    if suppressed:
+        line += f" ({suppressed} similar suppressed)"
+    return line
+
+
+class Logger:
+    """Leveled, rate-limited logger for one category.
+
+    Messages use %-style arguments that are only formatted on the flush thread.
+    Methods below the category's level are bound to a no-op, like the disabled
+    FrameProfiler, and debug_enabled lets a call site skip building arguments
+    altogether. Each category has a token bucket (rate per second, burst); a
+    message with no token is counted and reported with the next one let through.
+    """
+
+    def __init__(self, category: str, sink: LogSink, level: int = INFO, rate: float = LOG_RATE, burst: int = LOG_BURST):
+        self.category = category
+        self.sink = sink
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.refilled = time.monotonic()
+        self.suppressed = 0
+        self.set_level(level)
+
+    def set_level(self, level) -> None:
+        self.level = _level(level)
+        for value, name in LEVEL_NAMES.items():
+            setattr(self, name.lower(), partial(self.log, value) if value >= self.level else _noop)
+        self.debug_enabled = self.level <= DEBUG
+
+    def log(self, level: int, msg: str, *args) -> None:
+        if level < self.level:
+            return
+        if self.rate:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+            self.refilled = now
+            if self.tokens < 1.0:
+                self.suppressed += 1
+                return
+            self.tokens -= 1.0
+        self.sink.append((time.time(), level, self.category, msg, args, self.suppressed))
+        self.suppressed = 0
+
+
+# --- Module-level registry ---
+_sink = LogSink()
+_loggers: dict[str, Logger] = {}
+
+
+def get_logger(category: str) -> Logger:
+    """The shared logger for category; its level comes from LOG_LEVELS, else LOG_LEVEL."""
+    logger = _loggers.get(category)
+    if logger is None:
+        logger = _loggers[category] = Logger(category, _sink, LOG_LEVELS.get(category, LOG_LEVEL))
+    return logger
+
+
+def set_level(level, category: str = None) -> None:
+    """Change the level of one category, or of every logger (and future ones) when category is None."""
+    global LOG_LEVEL
+    if category is not None:
+        get_logger(category).set_level(level)
+        return
+    LOG_LEVEL = level
+    for logger in _loggers.values():
+        if logger.category not in LOG_LEVELS:
+            logger.set_level(level)
+
+
+def flush() -> None:
+    _sink.flush()
@@ -0,0 +1,140 @@
+import pygame
+import pymunk
+from config.config import TILE_SIZE
+from config.entities import NO_ENTITY
+from config.log import get_logger
+from config.spatial import SpatialHash
+
+log = get_logger("collision")
+
+# Collision types, as passed to space.on_collision
+PLAYER, ENEMY, WALL = 1, 2, 10
+
+# Category bits. QUERY is only ever set on movement queries, so walls (whose
+# mask is just QUERY) and enemy pairs never reach the narrow phase in step()
+CAT_PLAYER, CAT_ENEMY, CAT_WALL, CAT_QUERY = 1, 2, 4, 8
+WALLS = pymunk.ShapeFilter(categories=CAT_QUERY, mask=CAT_WALL)
+
+_EDGE = 0.5  # query boxes are shrunk by this much: rects that only share an edge don't collide
+
+
+def _query_bb(rect: pygame.Rect) -> pymunk.BB:
+    return pymunk.BB(rect.left + _EDGE, rect.top + _EDGE, rect.right - _EDGE, rect.bottom - _EDGE)
+
+
+class Physics:
+    """The current level's pymunk space and everything in it.
+
+    Game builds a fresh one in every load_level, so no wall, enemy body or
+    handler outlives its level. Solids (walls, doors, standing targets) are
+    static boxes; the player and enemies are kinematic boxes the size of their
+    hitboxes, moved by the game and re-indexed in the space's spatial hash.
+    Movement asks blocked(), a bb_query against that hash, and player-enemy
+    contacts are reported by a collision handler while step() runs.
+    """
+
+    def __init__(self, world, player):
+        self.space = pymunk.Space()
+        self.space.gravity = (0, 0)
+        # Roughly ten hash cells per shape, as Chipmunk suggests
+        self.space.use_spatial_hash(TILE_SIZE, max(1000, 10 * (len(world.solids) + len(world.enemies) + 1)))
+        # Enemy physics live in the world's entity registry, next to the enemies
+        self.bodies = world.entities.table("body", pymunk.Body)
+        self.shapes = world.entities.table("shape", pymunk.Shape)
+        self.contacts: set[int] = set()  # entity ids of the enemies touching the player
+        self._enemy_queries: dict[int, pymunk.ShapeFilter] = {}
+        self.space.on_collision(PLAYER, ENEMY, begin=self._contact_begin, separate=self._contact_end)
+
+        self._solids: dict[tuple, pymunk.Shape] = {}
+        # Wall shapes by rect, for the debug outlines, which only draw the ones in view
+        self.wall_grid = SpatialHash()
+        for rect in world.solids:
+            self.add_solid(rect)
+
+        self.player_body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
+        self.player_shape = pymunk.Poly.create_box(self.player_body, (player.w, player.h))
+        self.player_shape.sensor = True  # contacts are reported, never pushed apart
+        self.player_shape.collision_type = PLAYER
+        self.player_shape.filter = pymunk.ShapeFilter(categories=CAT_PLAYER, mask=CAT_ENEMY | CAT_QUERY)
+        self.player_shape.entity_id = NO_ENTITY
+        self.player_body.position = (player.x, player.y)
+        self.space.add(self.player_body, self.player_shape)
+
+        for enemy in world.enemies:
+            self.add_enemy(enemy)
+
+    # --- Bodies ---
+    def add_solid(self, rect: pygame.Rect) -> None:
+        body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        body.position = rect.center
+        shape = pymunk.Poly.create_box(body, rect.size)
+        shape.collision_type = WALL
+        shape.filter = pymunk.ShapeFilter(categories=CAT_WALL, mask=CAT_QUERY)
+        shape.entity_id = NO_ENTITY
+        self.space.add(body, shape)
+        self._solids[tuple(rect)] = shape
+        self.wall_grid.insert(shape, rect)
+
+    def remove_solid(self, rect: pygame.Rect) -> None:
+        shape = self._solids.pop(tuple(rect), None)
+        if shape is not None:
+            self.space.remove(shape.body, shape)
+            self.wall_grid.remove(shape)
+
+    def add_enemy(self, enemy) -> None:
+        body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
+        body.position = (enemy.x, enemy.y)
+        shape = pymunk.Poly.create_box(body, (enemy.w, enemy.h))
+        shape.collision_type = ENEMY
+        # Each enemy is its own group, so its queries skip its own box inside Chipmunk
+        shape.filter = pymunk.ShapeFilter(group=enemy.entity_id + 1, categories=CAT_ENEMY, mask=CAT_PLAYER | CAT_QUERY)
+        shape.entity_id = enemy.entity_id
+        self.space.add(body, shape)
+        self.bodies.add(enemy.entity_id, body)
+        self.shapes.add(enemy.entity_id, shape)
+        self._enemy_queries[enemy.entity_id] = pymunk.ShapeFilter(
+            group=enemy.entity_id + 1, categories=CAT_QUERY, mask=CAT_WALL | CAT_PLAYER | CAT_ENEMY)
+
+    def remove_enemy(self, enemy) -> None:
+        """Take enemy's body out of the space; its components go when the entity is destroyed."""
+        shape = self.shapes.get(enemy.entity_id)
+        if shape is not None:
+            self.space.remove(shape.body, shape)
+        self._enemy_queries.pop(enemy.entity_id, None)
+        self.contacts.discard(enemy.entity_id)
+
+    def move_player(self, player) -> None:
+        self.player_body.position = (player.x, player.y)
+        self.space.reindex_shapes_for_body(self.player_body)
+
+    def move_enemy(self, enemy) -> None:
+        body = self.bodies.get(enemy.entity_id)
+        if body is not None:
+            body.position = (enemy.x, enemy.y)
+            self.space.reindex_shapes_for_body(body)
+
+    # --- Queries ---
+    def blocked(self, rect: pygame.Rect, query: pymunk.ShapeFilter = WALLS) -> bool:
+        """True if rect overlaps a shape the query filter lets through (by default, a solid)."""
+        return bool(self.space.bb_query(_query_bb(rect), query))
+
+    def first_solid(self, start, end, radius: float = 0.0) -> float:
+        """Fraction of the way from start to end where a circle of radius first touches a solid, or -1.0."""
+        info = self.space.segment_query_first(start, end, radius, WALLS)
+        return info.alpha if info is not None else -1.0
+
+    def enemy_query(self, enemy) -> pymunk.ShapeFilter:
+        """Filter for what blocks enemy: solids, the player and every other enemy."""
+        return self._enemy_queries[enemy.entity_id]
+
+    # --- Simulation ---
+    def step(self, dt: float) -> None:
+        self.space.step(dt)
+
+    def _contact_begin(self, arbiter, space, data) -> None:
+        entity_id = arbiter.shapes[1].entity_id
+        self.contacts.add(entity_id)
+        log.debug("Player collided with enemy %d", entity_id)
+
+    def _contact_end(self, arbiter, space, data) -> None:
+        self.contacts.discard(arbiter.shapes[1].entity_id)
@@ -3,6 +3,8 @@ import pygame
 from dataclasses import dataclass
 from config.mili import start_sword_swing, update_sword, draw_with_sword  # Import sword logic
 from config.config import world_to_screen
+from config.physics import Physics
+from config.item_db import get_icon
 
 
 class Item:
@@ -38,6 +40,20 @@ class Item:
         self.magic_min = magic_min
         self.magic_max = magic_max
 
+    @property
+    def image(self):
+        # Item dicts carry an icon asset name; look the surface up the first time it is drawn
+        if isinstance(self._image, str):
+            icon = get_icon(self._image)
+            if icon is not None:
+                self._image = icon
+            return icon
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        self._image = image
+
     def get_slot(self):
         # Returns the equipment slot name this item should go to
         return self.equip_slot
@@ -203,8 +219,9 @@ class Player:
         move_mult = self.sprint_mult if sprinting else 1.0
         return dx, dy, move_mult
 
-    def move_and_collide(self, dt: float, solids: list[pygame.Rect]) -> None:
-        keys = pygame.key.get_pressed()
+    def move_and_collide(self, dt: float, physics: Physics, keys=None) -> None:
+        if keys is None:
+            keys = pygame.key.get_pressed()
         dx, dy, mult = self.input_dir(keys)
         mag = math.hypot(dx, dy)
         if mag > 0:
@@ -219,16 +236,12 @@ class Player:
         prev_x, prev_y = self.x, self.y
         # X axis
         self.x += dx * step
-        r = self.rect()
-        for s in solids:
-            if r.colliderect(s):
-                self.x = prev_x  # revert only if collision
+        if physics.blocked(self.rect()):
+            self.x = prev_x  # revert only if collision
         # Y axis
         self.y += dy * step
-        r = self.rect()
-        for s in solids:
-            if r.colliderect(s):
-                self.y = prev_y  # revert only if collision
+        if physics.blocked(self.rect()):
+            self.y = prev_y  # revert only if collision
 
     def update_animation(self, dt: float):
         if self.moving:
@@ -0,0 +1,145 @@
+import csv
+import json
+import time
+from collections import deque
+import pygame
+from config.config import PROFILER_WINDOW, PROFILER_OUTPUT
+from config.text import get_font
+
+# Phases in frame order; CSV columns and overlay rows follow this order
+PHASES = (
+    "input", "sword", "fireball", "player", "enemies", "torch",
+    "world_draw", "ui", "entities", "debug", "lighting", "profiler", "flip", "other",
+)
+
+
+def _noop(*args):
+    pass
+
+
+class FrameProfiler:
+    """Times named phases of each frame.
+
+    Call begin_frame() when a frame starts, mark(name) at the end of each phase
+    (the time since the previous mark is added to name) and end_frame() when the
+    frame is done. Time not covered by a mark is reported as "other".
+    While disabled the three methods are bound to a no-op, so the calls can stay
+    in the game loop. F3 toggles the overlay; PROFILER_OUTPUT streams one record
+    per frame to a .csv or .jsonl file.
+    """
+
+    def __init__(self, window: int = PROFILER_WINDOW, output: str = PROFILER_OUTPUT):
+        self.window = window
+        self.output = output
+        self.samples: dict[str, deque] = {}  # phase -> last `window` timings in ms
+        self.frame: dict[str, float] = {}  # phase -> seconds in the current frame
+        self.frame_index = 0
+        self.overlay = False
+        self._start = None
+        self._last = 0.0
+        self._file = None
+        self._writer = None
+        self._overlay_surf = None
+        self._overlay_time = 0.0
+        self._font = None
+        self.set_enabled(output is not None)
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        if enabled:
+            self.begin_frame = self._begin_frame
+            self.mark = self._mark
+            self.end_frame = self._end_frame
+        else:
+            self.begin_frame = self.mark = self.end_frame = _noop
+            self._start = None
+
+    def toggle_overlay(self) -> None:
+        self.overlay = not self.overlay
+        self.set_enabled(self.overlay or self.output is not None)
+
+    def _begin_frame(self) -> None:
+        if self._start is not None:
+            self._end_frame()
+        self._start = self._last = time.perf_counter()
+        self.frame = {}
+
+    def _mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.frame[name] = self.frame.get(name, 0.0) + now - self._last
+        self._last = now
+
+    def _end_frame(self) -> None:
+        if self._start is None:
+            return
+        now = time.perf_counter()
+        frame = self.frame
+        if now > self._last:
+            frame["other"] = frame.get("other", 0.0) + now - self._last
+        frame_ms = {name: seconds * 1000.0 for name, seconds in frame.items()}
+        frame_ms["total"] = (now - self._start) * 1000.0
+        for name, ms in frame_ms.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+        if self.output is not None:
+            self._write(frame_ms)
+        self.frame_index += 1
+        self._start = None
+
+    def percentile(self, name: str, q: float) -> float:
+        samples = self.samples.get(name)
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    # --- File output ---
+    def _write(self, frame_ms: dict) -> None:
+        if self._file is None:
+            self._file = open(self.output, "w", newline="")
+            if not self.output.endswith(".jsonl"):
+                self._writer = csv.DictWriter(self._file, ["frame", "total", *PHASES], extrasaction="ignore")
+                self._writer.writeheader()
+        record = {"frame": self.frame_index, **{k: round(v, 4) for k, v in frame_ms.items()}}
+        if self._writer is not None:
+            self._writer.writerow(record)
+        else:
+            self._file.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    # --- F3 overlay ---
+    def draw_overlay(self, surf: pygame.Surface) -> None:
+        if not self.overlay:
+            return
+        now = time.perf_counter()
+        # Re-render the table four times a second; blitting the cached one is cheap
+        if self._overlay_surf is None or now - self._overlay_time > 0.25:
+            self._overlay_surf = self._render_overlay()
+            self._overlay_time = now
+        surf.blit(self._overlay_surf, (surf.get_width() - self._overlay_surf.get_width() - 10, 10))
+
+    def _render_overlay(self) -> pygame.Surface:
+        if self._font is None:
+            self._font = get_font("consolas", 15)
+        names = [name for name in ("total", *PHASES) if name in self.samples]
+        names += [name for name in self.samples if name not in names]
+        lines = [f"{'phase':<11}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for name in names:
+            lines.append(
+                f"{name:<11}{self.percentile(name, 0.5):>8.2f}{self.percentile(name, 0.95):>8.2f}{self.percentile(name, 0.99):>8.2f}"
+            )
+        line_h = self._font.get_linesize()
+        width = max(self._font.size(line)[0] for line in lines) + 16
+        panel = pygame.Surface((width, line_h * len(lines) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            color = (255, 255, 160) if i == 0 else (220, 220, 220)
+            panel.blit(self._font.render(line, True, color), (8, 6 + i * line_h))
+        return panel
@@ -0,0 +1,238 @@
+import math
+import pygame
+from dataclasses import dataclass
+from config.config import TILE_SIZE, world_to_screen
+from config.sprites import sprite_frame, rotated_frame
+
+EXPLOSION_FRAME_TIME = 0.05  # seconds per explosion frame
+
+
+@dataclass(frozen=True)
+class ProjectileKind:
+    """How one type of projectile looks and flies; shared by every projectile of that type."""
+    name: str
+    speed: float  # px/s
+    width: int
+    height: int
+    image: str = None  # asset name of the sprite, drawn rotated to the flight direction
+    color: tuple = (255, 120, 40)  # of the shape drawn when there is no image
+    explodes: bool = False  # plays the explosion animation where it hits
+    hits_walls: bool = False  # stops at solids (otherwise flies until it hits something or leaves the map)
+    max_range: float = 0.0  # px travelled before it drops; 0 for no limit
+    glow: int = 0  # light radius in flight; 0 for none
+
+
+FIREBALL = ProjectileKind("fireball", 300.0, 46, 31, image="fireball", explodes=True, glow=80)
+ARROW = ProjectileKind("arrow", 650.0, 34, 6, color=(150, 110, 60), hits_walls=True, max_range=900.0)
+
+
+_shapes: dict[ProjectileKind, pygame.Surface] = {}
+
+
+def kind_shape(kind: ProjectileKind) -> pygame.Surface:
+    """Stand-in sprite for a kind without an image: an ellipse if it explodes, else a shaft with a head.
+
+    It is a surface of its own, not an atlas frame, because rotated_frame() blits its source into the atlas.
+    """
+    surf = _shapes.get(kind)
+    if surf is None:
+        w, h = kind.width, kind.height
+        surf = _shapes[kind] = pygame.Surface((w, h), pygame.SRCALPHA)
+        if kind.explodes:
+            pygame.draw.ellipse(surf, kind.color, surf.get_rect())
+        else:
+            head = min(w // 3, h * 2)
+            pygame.draw.rect(surf, kind.color, (0, h // 3, w - head, max(1, h // 3)))
+            pygame.draw.polygon(surf, (200, 200, 210), ((w - head, 0), (w - 1, h // 2), (w - head, h - 1)))
+    return surf
+
+
+class Projectile:
+    """One projectile, in flight or exploding. A plain record: ProjectilePool reuses it once it is spent."""
+
+    __slots__ = ("kind", "x", "y", "dx", "dy", "damage", "travelled",
+                 "exploding", "explosion_frame", "explosion_timer", "frame", "frame_source")
+
+    def reset(self, kind: ProjectileKind, x: float, y: float, dx: float, dy: float, damage: int) -> None:
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.damage = damage
+        self.travelled = 0.0
+        self.exploding = False
+        self.explosion_frame = 0
+        self.explosion_timer = 0.0
+        # Rotated sprite, looked up once: a projectile never changes direction
+        self.frame = None
+        self.frame_source = None
+
+    def rect(self) -> pygame.Rect:
+        kind = self.kind
+        return pygame.Rect(int(self.x - kind.width // 2), int(self.y - kind.height // 2), kind.width, kind.height)
+
+    def draw(self, surf, cam_x: float, cam_y: float, img=None, explosion_imgs=None):
+        px, py = world_to_screen(self.x, self.y, cam_x, cam_y)
+        kind = self.kind
+        # Glows are lights in the lighting pass (render.scene_lights)
+        if self.exploding and explosion_imgs:
+            frame = min(self.explosion_frame, len(explosion_imgs) - 1)
+            exp_img = sprite_frame(explosion_imgs[frame], explosion_imgs[frame].get_size())
+            surf.blit(exp_img, (px - exp_img.get_width() // 2, py - exp_img.get_height() // 2))
+            return
+        if img is None:
+            img = kind_shape(kind)
+        if self.frame_source is not img:
+            angle = -math.degrees(math.atan2(self.dy, self.dx))
+            self.frame = rotated_frame(img, (kind.width, kind.height), angle)
+            self.frame_source = img
+        frame = self.frame
+        surf.blit(frame, (px - frame.get_width() // 2, py - frame.get_height() // 2))
+
+
+def segment_enters_box(x0: float, y0: float, x1: float, y1: float, left: float, top: float, right: float, bottom: float) -> float:
+    """Fraction (0-1) of the way from (x0, y0) to (x1, y1) where the segment enters the box, or -1.0 if it misses.
+
+    Slab test: a segment that starts inside the box enters it at 0.
+    """
+    t_in, t_out = 0.0, 1.0
+    dx = x1 - x0
+    if dx:
+        a = (left - x0) / dx
+        b = (right - x0) / dx
+        if a > b:
+            a, b = b, a
+        if a > t_in:
+            t_in = a
+        if b < t_out:
+            t_out = b
+        if t_in > t_out:
+            return -1.0
+    elif x0 < left or x0 > right:
+        return -1.0
+    dy = y1 - y0
+    if dy:
+        a = (top - y0) / dy
+        b = (bottom - y0) / dy
+        if a > b:
+            a, b = b, a
+        if a > t_in:
+            t_in = a
+        if b < t_out:
+            t_out = b
+        if t_in > t_out:
+            return -1.0
+    elif y0 < top or y0 > bottom:
+        return -1.0
+    return t_in
+
+
+class ProjectilePool:
+    """Every live projectile, plus spent records waiting to be reused.
+
+    Each tick a projectile sweeps the segment it travels against the enemy and
+    target boxes near it (the world's grids are the broadphase), so a fast one
+    can't step over a thin target between two ticks. The box is grown by half
+    the projectile's size, which makes a segment test equal to a moving-box
+    test. Projectiles that finish are compacted out of active in place and go
+    back on the free list; spawning takes from it before allocating.
+    """
+
+    def __init__(self):
+        self.active: list[Projectile] = []
+        self.free: list[Projectile] = []
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def spawn(self, kind: ProjectileKind, x: float, y: float, dx: float, dy: float, damage: int) -> Projectile:
+        projectile = self.free.pop() if self.free else Projectile()
+        projectile.reset(kind, x, y, dx, dy, damage)
+        self.active.append(projectile)
+        return projectile
+
+    def clear(self) -> None:
+        self.free.extend(self.active)
+        self.active.clear()
+
+    def update(self, dt: float, world, physics, explosion_frames: int) -> list:
+        """Advance every projectile by dt; returns (projectile, what it hit) for each one that ended.
+
+        What it hit is an enemy or a target, or None for a wall, the end of its range or the map edge.
+        """
+        ended = []
+        active = self.active
+        free = self.free
+        map_w = world.w * TILE_SIZE
+        map_h = world.h * TILE_SIZE
+        keep = 0
+        for projectile in active:
+            if projectile.exploding:
+                projectile.explosion_timer += dt
+                if projectile.explosion_timer >= EXPLOSION_FRAME_TIME:
+                    projectile.explosion_timer = 0.0
+                    projectile.explosion_frame += 1
+                    if projectile.explosion_frame >= explosion_frames:
+                        free.append(projectile)
+                        continue
+                active[keep] = projectile
+                keep += 1
+                continue
+            kind = projectile.kind
+            step = kind.speed * dt
+            x0, y0 = projectile.x, projectile.y
+            x1 = x0 + projectile.dx * step
+            y1 = y0 + projectile.dy * step
+            hit, t = self.sweep(projectile, x0, y0, x1, y1, world, physics)
+            if hit is None and t > 1.0:
+                projectile.x, projectile.y = x1, y1
+                projectile.travelled += step
+                if not (0 <= x1 < map_w and 0 <= y1 < map_h) or (kind.max_range and projectile.travelled > kind.max_range):
+                    t = 1.0
+            else:
+                # Stop where it went in, so the explosion plays on the hit
+                projectile.x = x0 + (x1 - x0) * t
+                projectile.y = y0 + (y1 - y0) * t
+            if t <= 1.0:
+                ended.append((projectile, hit))
+                if kind.explodes:
+                    projectile.exploding = True
+                else:
+                    free.append(projectile)
+                    continue
+            active[keep] = projectile
+            keep += 1
+        del active[keep:]
+        return ended
+
+    def sweep(self, projectile: Projectile, x0: float, y0: float, x1: float, y1: float, world, physics):
+        """First thing the move (x0, y0) -> (x1, y1) runs into: (enemy/target/None for a wall, fraction), or (None, 2.0)."""
+        kind = projectile.kind
+        half_w = kind.width / 2
+        half_h = kind.height / 2
+        swept = pygame.Rect(int(min(x0, x1) - half_w), int(min(y0, y1) - half_h),
+                            int(abs(x1 - x0) + kind.width) + 1, int(abs(y1 - y0) + kind.height) + 1)
+        best, best_t = None, 2.0
+        grid = world.enemy_grid
+        for enemy in grid.query(swept):
+            r = grid.rect_of(enemy)
+            t = segment_enters_box(x0, y0, x1, y1, r.left - half_w, r.top - half_h, r.right + half_w, r.bottom + half_h)
+            if 0.0 <= t < best_t:
+                best, best_t = enemy, t
+        grid = world.target_grid
+        for target in grid.query(swept):
+            if target.respawn_timer > 0:
+                continue
+            r = grid.rect_of(target)
+            t = segment_enters_box(x0, y0, x1, y1, r.left - half_w, r.top - half_h, r.right + half_w, r.bottom + half_h)
+            if 0.0 <= t < best_t:
+                best, best_t = target, t
+        if kind.hits_walls:
+            t = physics.first_solid((x0, y0), (x1, y1), min(half_w, half_h))
+            if 0.0 <= t < best_t:
+                best, best_t = None, t
+        return best, best_t
@@ -1,541 +1,172 @@
-import pygame
-from config.config import COL_BG, world_to_screen, WIN_W, WIN_H
-from config.combat import draw_damage_numbers, draw_health_bars, update_health_bars
 import math
+import pygame
+from config.config import COL_BG, world_to_screen
+from config.combat import draw_damage_numbers, draw_health_bars
+from config.text import get_font, render_text
+from config.sprites import sprite_frame, placeholder_frame
+from config.batch import DrawList, LAYER_GROUND, LAYER_ACTORS, LAYER_EFFECTS, LAYER_LABELS
+from config.culling import ViewCuller
+from config.hud import player_hud
+from config.projectiles import FIREBALL
+
+FIREBALL_GLOW_RADIUS = FIREBALL.glow
+EXPLOSION_GLOW_RADIUS = 180
+
+# Reused every frame by draw_game_frame
+_draw_list = DrawList()
+_hud = player_hud()
+
+SHINE_RADIUS = 28
+SHINE_LEVELS = 8  # pre-drawn brightness steps of the pulsing glow on dropped items
+
+
+def shine_frame(px: int, py: int) -> pygame.Surface:
+    """Glow disc for a dropped item at screen (px, py), pulsing over time; drawn with BLEND_RGB_ADD."""
+    pulse = 0.5 + 0.25 * math.sin(pygame.time.get_ticks() / 300.0 + px + py)
+    level = round(pulse * SHINE_LEVELS) / SHINE_LEVELS
+    color = (int(255 * level), int(255 * level), int(160 * level))
+    return placeholder_frame((SHINE_RADIUS * 2, SHINE_RADIUS * 2), color, ellipse=True)
+
+
+def scene_lights(game, culler=None):
+    """(screen center, radius, flicker) for the torch and every glowing projectile whose light reaches the view."""
+    if culler is None:
+        culler = ViewCuller(game.camera, 0)
+    lights = []
+    if game.torch_on_ground or game.torch_following:
+        torch_px, torch_py = world_to_screen(
+            game.torch_ground_pos[0] - 15 + game.torch_wiggle_offset[0],
+            game.torch_ground_pos[1] - 30 + game.torch_wiggle_offset[1],
+            game.camera.x, game.camera.y
+        )
+        lights.append(((torch_px + 15, torch_py + 30), game.torch_glow_radius, True))
+    for projectile in game.projectiles:
+        radius = EXPLOSION_GLOW_RADIUS if projectile.exploding else projectile.kind.glow
+        if not radius or not culler.point(projectile.x, projectile.y, radius):
+            continue
+        fx, fy = world_to_screen(projectile.x, projectile.y, game.camera.x, game.camera.y)
+        lights.append(((int(fx), int(fy)), radius, projectile.exploding))
+    return lights
+
 
 def draw_game_frame(game, dt):
+    profiler = game.profiler
     # Fill background and draw world
     game.screen.fill(COL_BG)
-    view = game.camera.view_rect()
-    game.world.draw(game.screen, game.camera.x, game.camera.y, view)
-
-    # --- Draw player HP bar (big, top left) ---
-    big_hp_bar_width = 400
-    big_hp_bar_height = 32
-    hp_ratio = max(0, game.player.hp / game.player.max_hp)
-    bar_x = 40
-    bar_y = 20
-    font = pygame.font.SysFont("arial", 28, bold=True)
-    pygame.draw.rect(game.screen, (40, 40, 40), (bar_x, bar_y, big_hp_bar_width, big_hp_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (255, 80, 80), (bar_x, bar_y, int(big_hp_bar_width * hp_ratio), big_hp_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (0, 0, 0), (bar_x, bar_y, big_hp_bar_width, big_hp_bar_height), 4, border_radius=10)
-    hp_text = f"HP: {int(game.player.hp)} / {game.player.max_hp}"
-    text_surf = font.render(hp_text, True, (255, 255, 255))
-    game.screen.blit(text_surf, (bar_x + 12, bar_y + big_hp_bar_height // 2 - text_surf.get_height() // 2))
-
-    # --- Draw stamina bar ---
-    stamina_bar_width = big_hp_bar_width
-    stamina_bar_height = 24
-    stamina_ratio = max(0, game.player.stamina / (game.player.vitality * 20))
-    stamina_y = bar_y + big_hp_bar_height + 12
-    pygame.draw.rect(game.screen, (40, 40, 40), (bar_x, stamina_y, stamina_bar_width, stamina_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (80, 200, 80), (bar_x, stamina_y, int(stamina_bar_width * stamina_ratio), stamina_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (0, 0, 0), (bar_x, stamina_y, stamina_bar_width, stamina_bar_height), 3, border_radius=10)
-    stamina_text = f"Stamina: {int(game.player.stamina)} / {game.player.vitality * 20}"
-    stamina_surf = font.render(stamina_text, True, (255, 255, 255))
-    game.screen.blit(stamina_surf, (bar_x + 12, stamina_y + stamina_bar_height // 2 - stamina_surf.get_height() // 2))
-
-    # --- Draw mana bar ---
-    mana_bar_width = big_hp_bar_width
-    mana_bar_height = 24
-    mana_ratio = max(0, game.player.mana / game.player.max_mana)
-    mana_y = stamina_y + stamina_bar_height + 12
-    pygame.draw.rect(game.screen, (40, 40, 40), (bar_x, mana_y, mana_bar_width, mana_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (80, 80, 200), (bar_x, mana_y, int(mana_bar_width * mana_ratio), mana_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (0, 0, 0), (bar_x, mana_y, mana_bar_width, mana_bar_height), 3, border_radius=10)
-    mana_text = f"Mana: {int(game.player.mana)} / {game.player.max_mana}"
-    mana_surf = font.render(mana_text, True, (255, 255, 255))
-    game.screen.blit(mana_surf, (bar_x + 12, mana_y + mana_bar_height // 2 - mana_surf.get_height() // 2))
+    # Every world-space pass below only visits what is inside the (grown) view
+    culler = ViewCuller(game.camera)
+    game.world.draw(game.screen, game.camera.x, game.camera.y, culler.view)
+    profiler.mark("world_draw")
 
-    # --- Draw XP bar (below mana bar) ---
-    xp_bar_width = big_hp_bar_width
-    xp_bar_height = 18
-    xp_y = mana_y + mana_bar_height + 12
-    xp_ratio = min(1.0, max(0, game.player.xp / game.player.max_xp))
-    pygame.draw.rect(game.screen, (40, 40, 40), (bar_x, xp_y, xp_bar_width, xp_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (255, 215, 0), (bar_x, xp_y, int(xp_bar_width * xp_ratio), xp_bar_height), border_radius=10)
-    pygame.draw.rect(game.screen, (0, 0, 0), (bar_x, xp_y, xp_bar_width, xp_bar_height), 2, border_radius=10)
-    xp_text = f"XP: {int(game.player.xp)} / {game.player.max_xp}   Level: {game.player.level}"
-    xp_surf = font.render(xp_text, True, (255, 255, 255))
-    game.screen.blit(xp_surf, (bar_x + 12, xp_y + xp_bar_height // 2 - xp_surf.get_height() // 2))
+    # --- HUD bars (top left), re-rendered only when their values change ---
+    _hud.draw(game.screen, game)
 
-    # --- Player debug info ---
-    debug_font = pygame.font.SysFont("arial", 16)
-    debug_info = [
-        f"Pos: ({game.player.x:.1f}, {game.player.y:.1f})",
-        f"Vel: ({game.player_body.velocity[0]:.1f}, {game.player_body.velocity[1]:.1f})",
-        f"HP: {game.player.hp}",
-        f"Stamina: {game.player.stamina}",
-        f"Mana: {game.player.mana}",
-        f"Level: {game.level_index + 1}",
-        f"Enemies: {len(game.world.enemies)}",
-        f"Targets: {len(game.world.targets)}",
-    ]
-    for i, line in enumerate(debug_info):
-        text_surf = debug_font.render(line, True, (255, 255, 255))
-        game.screen.blit(text_surf, (10, 10 + i * 20))
+    profiler.mark("ui")
 
     # --- Draw entities ---
-    for i, enemy in enumerate(game.world.enemies):
-        if i < len(game.enemy_bodies):
-            ex, ey = world_to_screen(game.enemy_bodies[i].position[0], game.enemy_bodies[i].position[1], game.camera.x, game.camera.y)
-        else:
-            ex, ey = world_to_screen(enemy.x, enemy.y, game.camera.x, game.camera.y)
-        enemy.draw(game.screen, game.camera.x, game.camera.y)
+    # Entities are drawn from their (interpolated) x/y, not the physics bodies,
+    # which only hold the last simulation tick. They draw into the frame's draw
+    # list, which puts them in (layer, base y) order and blits them in one call.
+    cam_x, cam_y = game.camera.x, game.camera.y
+    draw_list = _draw_list
+    level_font = get_font("arial", 18, bold=True)
+    visible_enemies = culler.query(game.world.enemy_grid)
+    for enemy in visible_enemies:
+        ex, ey = world_to_screen(enemy.x, enemy.y, cam_x, cam_y)
+        half_h = getattr(enemy, "h", 36) // 2
+        enemy.draw(draw_list.at(LAYER_ACTORS, enemy.y + half_h), cam_x, cam_y)
         # Draw monster level below hitbox
-        level_font = pygame.font.SysFont("arial", 18, bold=True)
-        level_text = f"Lv {getattr(enemy, 'level', 1)}"
-        text_surf = level_font.render(level_text, True, (255, 215, 0))
-        text_x = int(ex - text_surf.get_width() // 2)
-        text_y = int(ey + getattr(enemy, "h", 36) // 2 + 8)
-        game.screen.blit(text_surf, (text_x, text_y))
-    for target in game.world.targets:
-        target.draw(game.screen, game.camera.x, game.camera.y)
-    player_px, player_py = world_to_screen(game.player_body.position[0] - 40, game.player_body.position[1] - 60, game.camera.x, game.camera.y)
+        text_surf = render_text(level_font, f"Lv {getattr(enemy, 'level', 1)}", (255, 215, 0))
+        draw_list.at(LAYER_LABELS, enemy.y)
+        draw_list.blit(text_surf, (int(ex - text_surf.get_width() // 2), int(ey + half_h + 8)))
+    for target in culler.query(game.world.target_grid):
+        target.draw(draw_list.at(LAYER_ACTORS, target.y + target.h // 2), cam_x, cam_y)
+    player_px, player_py = world_to_screen(game.player.x - 40, game.player.y - 60, cam_x, cam_y)
     anim_dir = game.player.anim_dir
     frame = game.player.anim_index
-    player_img = game.player_anim_frames[anim_dir][frame]
-    game.player.draw_with_sword(game.screen, player_px, player_py, player_img, game.sword_img, game.sword_slash_imgs)
+    player_img = sprite_frame(game.player_anim_frames[anim_dir][frame], (40, 60))
+    game.player.draw_with_sword(draw_list.at(LAYER_ACTORS, game.player.y), player_px, player_py, player_img, game.sword_img, game.sword_slash_imgs)
     if game.torch_on_ground or game.torch_following:
-        torch_px, torch_py = world_to_screen(
-            game.torch_ground_pos[0] - 15 + game.torch_wiggle_offset[0],
-            game.torch_ground_pos[1] - 30 + game.torch_wiggle_offset[1],
-            game.camera.x, game.camera.y
-        )
-        game.screen.blit(game.torch_img, (torch_px, torch_py))
-    for fireball in game.fireballs:
-        fx, fy = world_to_screen(fireball.x, fireball.y, game.camera.x, game.camera.y)
-        fireball.draw(game.screen, game.camera.x, game.camera.y, game.fireball_img, game.explosion_imgs)
-
-    # --- Draw colored hitboxes ---
-    player_px, player_py = world_to_screen(game.player_body.position[0], game.player_body.position[1], game.camera.x, game.camera.y)
-    pygame.draw.circle(game.screen, (0, 0, 255), (int(player_px), int(player_py)), int(game.player_shape.radius))
-    pygame.draw.circle(game.screen, (255, 255, 255), (int(player_px), int(player_py)), int(game.player_shape.radius) - 4, 2)
-    for i, enemy_body in enumerate(game.enemy_bodies):
-        if i < len(game.enemy_shapes):
-            ex, ey = world_to_screen(enemy_body.position[0], enemy_body.position[1], game.camera.x, game.camera.y)
-            radius = int(game.enemy_shapes[i].radius)
-        else:
-            ex, ey = 0, 0
-            radius = 20
-        pygame.draw.circle(game.screen, (0, 255, 0), (int(ex), int(ey)), radius, 2)
-        pygame.draw.circle(game.screen, (255, 255, 255), (int(ex), int(ey)), radius - 4, 2)
-        attack_range = 80
-        for angle in range(0, 360, 18):
-            rad = math.radians(angle)
-            dot_x = int(ex + math.cos(rad) * attack_range)
-            dot_y = int(ey + math.sin(rad) * attack_range)
-            pygame.draw.circle(game.screen, (200, 200, 200), (dot_x, dot_y), 3)
-        if i < len(game.world.enemies):
-            visibility_range = getattr(game.world.enemies[i], "visibility_range", 240)
-            pygame.draw.circle(game.screen, (255, 255, 0), (int(ex), int(ey)), int(visibility_range), 1)
-    if game.torch_on_ground or game.torch_following:
-        torch_px, torch_py = world_to_screen(
-            game.torch_ground_pos[0] + game.torch_wiggle_offset[0],
-            game.torch_ground_pos[1] + game.torch_wiggle_offset[1],
-            game.camera.x, game.camera.y
-        )
-        torch_rect = pygame.Rect(int(torch_px - 8), int(torch_py - 16), 16, 32)
-        pygame.draw.rect(game.screen, (128, 0, 128), torch_rect, 2)
-    for wall_shape in game.wall_shapes:
-        wall_bb = wall_shape.bb
-        wall_rect = pygame.Rect(
-            int(wall_bb.left - game.camera.x),
-            int(wall_bb.top - game.camera.y),
-            int(wall_bb.right - wall_bb.left),
-            int(wall_bb.bottom - wall_bb.top)
-        )
-        pygame.draw.rect(game.screen, (100, 100, 100), wall_rect, 2)
-        pygame.draw.rect(game.screen, (0, 0, 0), wall_rect, 4)
-    for target in game.world.targets:
-        tx, ty = world_to_screen(target.x, target.y, game.camera.x, game.camera.y)
-        target_rect = pygame.Rect(
-            int(tx - target.w // 2),
-            int(ty - target.h // 2),
-            target.w, target.h
-        )
-        pygame.draw.rect(game.screen, (255, 255, 0), target_rect, 2)
-    for fireball in game.fireballs:
-        fx, fy = world_to_screen(fireball.x, fireball.y, game.camera.x, game.camera.y)
-        fireball_rect = pygame.Rect(int(fx - 20), int(fy - 10), 40, 20)
-        pygame.draw.rect(game.screen, (255, 128, 0), fireball_rect, 2)
-    if game.player.sword_swinging:
-        mx, my = pygame.mouse.get_pos()
-        world_mx = mx + game.camera.x
-        world_my = my + game.camera.y
-        px, py = game.player.x, game.player.y
-        dx = world_mx - px
-        dy = world_my - py
-        mag = math.hypot(dx, dy)
-        if mag > 0:
-            dx /= mag
-            dy /= mag
-        else:
-            dx, dy = game.player.last_dir
-        sword_w, sword_h = 48, 48
-        offset = 32
-        hitbox_x = px + dx * offset - sword_w // 2
-        hitbox_y = py + dy * offset - sword_h // 2
-        sword_px, sword_py = world_to_screen(hitbox_x, hitbox_y, game.camera.x, game.camera.y)
-        sword_hitbox = pygame.Rect(int(sword_px), int(sword_py), sword_w, sword_h)
-        pygame.draw.rect(game.screen, (255, 0, 0), sword_hitbox, 2)
-
-    # --- Draw dropped items on ground ---
-    for dropped in getattr(game, "dropped_items", []):
-        px, py = world_to_screen(dropped["x"], dropped["y"], game.camera.x, game.camera.y)
+        torch_x = game.torch_ground_pos[0] - 15 + game.torch_wiggle_offset[0]
+        torch_y = game.torch_ground_pos[1] - 30 + game.torch_wiggle_offset[1]
+        torch_img = sprite_frame(game.torch_img, game.torch_img.get_size())
+        draw_list.at(LAYER_ACTORS, torch_y + torch_img.get_height())
+        draw_list.blit(torch_img, world_to_screen(torch_x, torch_y, cam_x, cam_y))
+    for projectile in game.projectiles:
+        if culler.point(projectile.x, projectile.y, 40):
+            kind = projectile.kind
+            img = game.assets.get(kind.image) if kind.image else None
+            projectile.draw(draw_list.at(LAYER_EFFECTS, projectile.y), cam_x, cam_y, img, game.explosion_imgs)
+    player_rect = game.player.rect()
+    pickups = []  # screen positions of the drops the player stands on
+    for dropped in culler.query(game.world.drop_grid):
+        px, py = world_to_screen(dropped["x"], dropped["y"], cam_x, cam_y)
         if dropped["image"]:
-            img = pygame.transform.scale(dropped["image"], (40, 40))
-            game.screen.blit(img, (px - 20, py - 20))
+            img = sprite_frame(dropped["image"], (40, 40))
         else:
-            pygame.draw.circle(game.screen, (255, 215, 0), (px, py), 20)
+            img = placeholder_frame((40, 40), (255, 215, 0), ellipse=True)
+        draw_list.at(LAYER_GROUND, dropped["y"])
+        draw_list.blit(img, (px - 20, py - 20))
+        draw_list.blit(shine_frame(px, py), (px - SHINE_RADIUS, py - SHINE_RADIUS), special_flags=pygame.BLEND_RGB_ADD)
+        if player_rect.colliderect(dropped["rect"]):
+            pickups.append((px, py))
+    draw_list.flush(game.screen)
+
+    profiler.mark("entities")
+
+    # --- Debug overlays (F5-F9, see config/debug_draw.py) ---
+    game.debug_draw.draw(game, culler)
+    profiler.mark("debug")
 
     # --- Overlays/effects ---
-    # Only draw damage numbers that are NOT "Level X required" messages
-    from config.combat import draw_damage_numbers
-    font = pygame.font.SysFont("arial", 22, bold=True)
-    for dmg in game.damage_numbers[:]:
-        if isinstance(dmg.get("value", ""), str) and dmg.get("value", "").startswith("Level "):
-            continue  # Skip "Level X required" messages here
-        # ...existing code for drawing normal damage numbers...
-    draw_damage_numbers(game, game.screen, game.camera, dt)
-    draw_health_bars(game, game.screen, game.camera)
-    update_health_bars(game, dt)
+    draw_damage_numbers(game, game.screen, game.camera, dt, culler)
+    draw_health_bars(game, game.screen, game.camera, culler)
+    profiler.mark("ui")
 
     # --- LIGHTING OVERLAY ---
-    darkness = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-    darkness.fill((0, 0, 0, game.darkness_alpha))
-    if game.torch_on_ground or game.torch_following:
-        torch_px, torch_py = world_to_screen(
-            game.torch_ground_pos[0] - 15 + game.torch_wiggle_offset[0],
-            game.torch_ground_pos[1] - 30 + game.torch_wiggle_offset[1],
-            game.camera.x, game.camera.y
-        )
-        torch_center = (torch_px + 15, torch_py + 30)
-    else:
-        torch_center = None
-    if torch_center:
-        mask = game.get_light_mask(game.torch_glow_radius)
-        x = torch_center[0] - game.torch_glow_radius
-        y = torch_center[1] - game.torch_glow_radius
-        darkness.blit(mask, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-    fireball_glow_radius = 80
-    explosion_glow_radius = 180
-    for fireball in game.fireballs:
-        fx, fy = world_to_screen(fireball.x, fireball.y, game.camera.x, game.camera.y)
-        fireball_center = (int(fx), int(fy))
-        if fireball.exploding:
-            mask = game.get_light_mask(explosion_glow_radius)
-            x = fireball_center[0] - explosion_glow_radius
-            y = fireball_center[1] - explosion_glow_radius
-            darkness.blit(mask, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-        else:
-            mask = game.get_light_mask(fireball_glow_radius)
-            x = fireball_center[0] - fireball_glow_radius
-            y = fireball_center[1] - fireball_glow_radius
-            darkness.blit(mask, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-    game.screen.blit(darkness, (0, 0))
+    game.lighting.render(game.screen, game.darkness_alpha, scene_lights(game, culler))
+    profiler.mark("lighting")
+
+    # --- Pickup hints, on top of the darkness so they stay readable ---
+    if pickups:
+        draw_pickup_hints(game, pickups)
+        profiler.mark("ui")
+    profiler.draw_overlay(game.screen)
+    profiler.mark("profiler")
+    pygame.display.flip()
+    profiler.mark("flip")
+
+def draw_pickup_hints(game, pickups):
+    """"Press E to pick up" above each drop at screen (px, py), with any "Level X required" message over it."""
+    font = get_font("arial", 22, bold=True)
+    hint_surf = render_text(font, "Press E to pick up", (255, 255, 160))
+    for px, py in pickups:
+        game.screen.blit(hint_surf, (px - hint_surf.get_width() // 2, py - 44))
+        for dmg in game.damage_numbers:
+            value = dmg.get("value", "")
+            if isinstance(value, str) and value.startswith("Level ") and abs(dmg["x"] - px) < 40 and abs(dmg["y"] - (py - 44)) < 40:
+                msg_surf = render_text(font, value, dmg["color"], alpha=dmg["alpha"])
+                game.screen.blit(msg_surf, (px - msg_surf.get_width() // 2, py - 72))
+
+
+def draw_loading_screen(screen, progress, caption="Loading"):
+    """Startup splash: caption and a progress bar for progress in 0..1."""
+    # Runs before the game loop, so keep the window responsive here
+    pygame.event.pump()
+    screen.fill(COL_BG)
+    w, h = screen.get_width(), screen.get_height()
+    bar_w, bar_h = min(480, w - 80), 18
+    bar_x, bar_y = (w - bar_w) // 2, h // 2
+    title = render_text(get_font("arial", 32, bold=True), caption, (230, 230, 230))
+    screen.blit(title, (w // 2 - title.get_width() // 2, bar_y - title.get_height() - 16))
+    pygame.draw.rect(screen, (40, 40, 40), (bar_x, bar_y, bar_w, bar_h), border_radius=6)
+    pygame.draw.rect(screen, (210, 170, 60), (bar_x, bar_y, int(bar_w * progress), bar_h), border_radius=6)
+    pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_w, bar_h), 2, border_radius=6)
+    pct = render_text(get_font("arial", 18), f"{int(progress * 100)}%", (200, 200, 200))
+    screen.blit(pct, (w // 2 - pct.get_width() // 2, bar_y + bar_h + 10))
     pygame.display.flip()
 
-def draw_inventory_overlay(game, tab_index=0):
-    overlay = pygame.Surface((game.screen.get_width(), game.screen.get_height()), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    game.screen.blit(overlay, (0, 0))
-    font = pygame.font.SysFont("arial", 48, bold=True)
-
-    # --- Tabs ---
-    tab_names = ["Inventory", "Stats", "Skills"]
-    tab_font = pygame.font.SysFont("arial", 32, bold=True)
-    tab_w = 220
-    tab_h = 48
-    tab_y = 40
-    tab_x_start = game.screen.get_width() // 2 - tab_w * len(tab_names) // 2
-    tab_rects = []
-    for i, name in enumerate(tab_names):
-        tab_x = tab_x_start + i * tab_w
-        color = (255, 215, 0) if i == tab_index else (120, 120, 120)
-        rect = pygame.Rect(tab_x, tab_y, tab_w, tab_h)
-        tab_rects.append(rect)
-        pygame.draw.rect(game.screen, color, rect, border_radius=12)
-        tab_text = tab_font.render(name, True, (0, 0, 0))
-        game.screen.blit(tab_text, (tab_x + tab_w // 2 - tab_text.get_width() // 2, tab_y + tab_h // 2 - tab_text.get_height() // 2))
-
-    # --- Tab click detection ---
-    mx, my = pygame.mouse.get_pos()
-    mouse_pressed = pygame.mouse.get_pressed()
-    if mouse_pressed[0]:  # Left mouse button
-        for i, rect in enumerate(tab_rects):
-            if rect.collidepoint(mx, my):
-                game.inventory_tab = i
-
-    # --- Tab content ---
-    if tab_index == 0:
-        # Inventory tab
-        title = font.render("INVENTORY", True, (255, 255, 255))
-        game.screen.blit(title, (game.screen.get_width() // 2 - title.get_width() // 2, 120))
-        inv_font = pygame.font.SysFont("arial", 28)
-        slot_font = pygame.font.SysFont("arial", 22, bold=True)
-
-        # Divide screen
-        left_x = game.screen.get_width() // 4
-        right_x = 3 * game.screen.get_width() // 4
-        center_y = 220
-
-        # --- Equipment HUD (left side) ---
-        slot_size = 64
-        slot_gap = 24
-        equip_slots = {
-            "Helmet": (left_x, center_y),
-            "Armor": (left_x, center_y + slot_size + slot_gap),
-            "Main Hand": (left_x - slot_size - slot_gap, center_y + 2 * (slot_size + slot_gap)),
-            "Off Hand": (left_x + slot_size + slot_gap, center_y + 2 * (slot_size + slot_gap)),
-            "Boots": (left_x, center_y + 3 * (slot_size + slot_gap)),
-        }
-        acc_y = center_y + 4 * (slot_size + slot_gap)
-        acc_x_start = left_x - 2 * (slot_size + slot_gap) + slot_size // 2
-        accessory_slots = []
-        for i in range(4):
-            accessory_slots.append((acc_x_start + i * (slot_size + slot_gap), acc_y))
-
-        # Draw equipment slots and items
-        slot_rects = {}
-        hovered_item = None
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-
-        # Draw equipment slots and items
-        slot_rects = {}
-        for name, (sx, sy) in equip_slots.items():
-            rect = pygame.Rect(sx - slot_size // 2, sy - slot_size // 2, slot_size, slot_size)
-            slot_rects[name] = rect
-            pygame.draw.rect(game.screen, (80, 80, 80), rect, border_radius=10)
-            pygame.draw.rect(game.screen, (160, 160, 160), rect, 3, border_radius=10)
-            label = slot_font.render(name, True, (220, 220, 220))
-            game.screen.blit(label, (sx - label.get_width() // 2, sy + slot_size // 2 + 4))
-            item = game.player.equipment.get(name)
-            if item is not None:
-                if hasattr(item, "image") and item.image:
-                    item_img = pygame.transform.scale(item.image, (slot_size - 12, slot_size - 12))
-                    game.screen.blit(item_img, (sx - (slot_size - 12) // 2, sy - (slot_size - 12) // 2))
-                elif item.name == "Sword" and hasattr(game, "sword_img") and game.sword_img:
-                    sword_img = pygame.transform.scale(game.sword_img, (slot_size - 12, slot_size - 12))
-                    game.screen.blit(sword_img, (sx - (slot_size - 12) // 2, sy - (slot_size - 12) // 2))
-                else:
-                    pygame.draw.circle(game.screen, (200, 200, 80), (sx, sy), slot_size // 3)
-                if rect.collidepoint(mouse_x, mouse_y):
-                    hovered_item = item
-
-        for i, (sx, sy) in enumerate(accessory_slots):
-            name = f"Accessory {i+1}"
-            rect = pygame.Rect(sx - slot_size // 2, sy - slot_size // 2, slot_size, slot_size)
-            slot_rects[name] = rect
-            pygame.draw.rect(game.screen, (80, 80, 80), rect, border_radius=10)
-            pygame.draw.rect(game.screen, (160, 160, 160), rect, 3, border_radius=10)
-            label = slot_font.render(name, True, (220, 220, 220))
-            game.screen.blit(label, (sx - label.get_width() // 2, sy + slot_size // 2 + 4))
-            item = game.player.equipment.get(name)
-            if item is not None:
-                if hasattr(item, "image") and item.image:
-                    item_img = pygame.transform.scale(item.image, (slot_size - 12, slot_size - 12))
-                    game.screen.blit(item_img, (sx - (slot_size - 12) // 2, sy - (slot_size - 12) // 2))
-                else:
-                    pygame.draw.circle(game.screen, (200, 200, 80), (sx, sy), slot_size // 3)
-                if rect.collidepoint(mouse_x, mouse_y):
-                    hovered_item = item
-
-        # --- Draw inventory grid (right side) ---
-        inv_cols, inv_rows = 5, 8
-        inv_slot_size = 56
-        inv_gap = 12
-        grid_start_x = right_x - ((inv_cols * inv_slot_size + (inv_cols - 1) * inv_gap) // 2)
-        grid_start_y = center_y
-        inv_rects = []
-        for row in range(inv_rows):
-            for col in range(inv_cols):
-                idx = row * inv_cols + col
-                sx = grid_start_x + col * (inv_slot_size + inv_gap)
-                sy = grid_start_y + row * (inv_slot_size + inv_gap)
-                rect = pygame.Rect(sx, sy, inv_slot_size, inv_slot_size)
-                inv_rects.append(rect)
-                pygame.draw.rect(game.screen, (60, 60, 60), rect, border_radius=8)
-                pygame.draw.rect(game.screen, (120, 120, 120), rect, 2, border_radius=8)
-                item = game.player.inventory[idx]
-                if item is not None:
-                    if game.dragged_item is not None and game.dragged_item_idx == idx:
-                        continue  # Don't draw item in slot if dragging
-                    if hasattr(item, "image") and item.image:
-                        item_img = pygame.transform.scale(item.image, (inv_slot_size - 12, inv_slot_size - 12))
-                        game.screen.blit(item_img, (sx + (inv_slot_size - item_img.get_width()) // 2, sy + (inv_slot_size - item_img.get_height()) // 2))
-                    elif hasattr(item, "name") and item.name == "Sword" and hasattr(game, "sword_img") and game.sword_img:
-                        sword_img = pygame.transform.scale(game.sword_img, (inv_slot_size - 12, inv_slot_size - 12))
-                        game.screen.blit(sword_img, (sx + (inv_slot_size - sword_img.get_width()) // 2, sy + (inv_slot_size - sword_img.get_height()) // 2))
-                    else:
-                        pygame.draw.circle(game.screen, (200, 200, 80), (sx + inv_slot_size // 2, sy + inv_slot_size // 2), inv_slot_size // 3)
-                    if rect.collidepoint(mouse_x, mouse_y):
-                        hovered_item = item
-
-        # --- Drag and drop logic (simple click to move) ---
-        game._equip_slot_rects = slot_rects
-        game._inv_slot_rects = inv_rects
-
-        # --- Draw "Level required" fade messages above equipment slots ---
-        font = pygame.font.SysFont("arial", 22, bold=True)
-        for dmg in game.damage_numbers[:]:
-            if isinstance(dmg.get("value", ""), str) and dmg.get("value", "").startswith("Level "):
-                # Check equipment slots
-                for rect in game._equip_slot_rects.values():
-                    if abs(dmg["x"] - rect.centerx) < 24 and abs(dmg["y"] - (rect.top - 24)) < 24:
-                        msg_surf = font.render(str(dmg["value"]), True, dmg["color"])
-                        msg_surf.set_alpha(dmg["alpha"])
-                        game.screen.blit(msg_surf, (rect.centerx - msg_surf.get_width() // 2, rect.top - 48))
-                        break
-                # Check inventory slots (keep previous logic)
-                for rect in game._inv_slot_rects:
-                    if abs(dmg["x"] - rect.centerx) < 24 and abs(dmg["y"] - (rect.top - 24)) < 24:
-                        msg_surf = font.render(str(dmg["value"]), True, dmg["color"])
-                        msg_surf.set_alpha(dmg["alpha"])
-                        game.screen.blit(msg_surf, (rect.centerx - msg_surf.get_width() // 2, rect.top - 48))
-                        break
-
-        inv_text = inv_font.render("Click equipment/inventory slots to move items.", True, (220, 220, 220))
-        game.screen.blit(inv_text, (right_x - inv_text.get_width() // 2, grid_start_y + inv_rows * (inv_slot_size + inv_gap) + 32))
-
-        # --- Item stats hub ---
-        if hovered_item is not None:
-            stat_font = pygame.font.SysFont("arial", 24, bold=True)
-            lines = [
-                f"Name: {getattr(hovered_item, 'name', '')}",
-                f"Type: {getattr(hovered_item, 'item_type', '')}",
-                f"Level: {getattr(hovered_item, 'level', 1)}"
-            ]
-            # Weapon stats
-            if hasattr(hovered_item, "attack_min") and hasattr(hovered_item, "attack_max") and hovered_item.attack_min is not None:
-                lines.append(f"Attack: {hovered_item.attack_min} - {hovered_item.attack_max}")
-            if hasattr(hovered_item, "attack_speed") and hovered_item.attack_speed is not None:
-                lines.append(f"Attack Speed: {hovered_item.attack_speed}")
-            # Magic damage
-            if hasattr(hovered_item, "magic_min") and hasattr(hovered_item, "magic_max") and hovered_item.magic_min is not None and hovered_item.magic_max is not None:
-                if hovered_item.magic_min > 0 or hovered_item.magic_max > 0:
-                    lines.append(f"Magic Damage: {hovered_item.magic_min} - {hovered_item.magic_max}")
-            # Armor
-            if hasattr(hovered_item, "armor") and hovered_item.armor is not None and hovered_item.armor > 0:
-                lines.append(f"Armor: {hovered_item.armor}")
-            # Speed
-            if hasattr(hovered_item, "speed") and hovered_item.speed is not None and hovered_item.speed > 0:
-                lines.append(f"Speed: {hovered_item.speed}")
-            # Bonus
-            if hasattr(hovered_item, "bonus") and hovered_item.bonus:
-                lines.append(f"Bonus: {hovered_item.bonus}")
-
-            # --- Dynamic hub size ---
-            hub_w = 340
-            line_height = 32
-            hub_h = 32 + len(lines) * line_height + 16  # top/bottom padding
-            hub_x = mouse_x + 24
-            hub_y = mouse_y + 24
-            # Prevent hub from going off screen
-            if hub_x + hub_w > game.screen.get_width():
-                hub_x = game.screen.get_width() - hub_w - 16
-            if hub_y + hub_h > game.screen.get_height():
-                hub_y = game.screen.get_height() - hub_h - 16
-            hub_rect = pygame.Rect(hub_x, hub_y, hub_w, hub_h)
-            pygame.draw.rect(game.screen, (30, 30, 30), hub_rect, border_radius=14)
-            pygame.draw.rect(game.screen, (160, 160, 160), hub_rect, 3, border_radius=14)
-            for i, line in enumerate(lines):
-                stat_surf = stat_font.render(line, True, (220, 220, 220))
-                game.screen.blit(stat_surf, (hub_x + 18, hub_y + 18 + i * line_height))
-    elif tab_index == 1:
-        # Stats tab
-        title = font.render("PLAYER STATS", True, (255, 255, 255))
-        game.screen.blit(title, (game.screen.get_width() // 2 - title.get_width() // 2, 120))
-        stats_font = pygame.font.SysFont("arial", 28)
-        stats = [
-            f"Level: {game.player.level}",
-            f"XP: {int(game.player.xp)} / {game.player.max_xp}",
-            f"HP: {int(game.player.hp)} / {game.player.max_hp}",
-            f"Mana: {int(game.player.mana)} / {game.player.max_mana}",
-            f"Stamina: {int(game.player.stamina)} / {game.player.vitality * 20}",
-        ]
-        for i, line in enumerate(stats):
-            stat_surf = stats_font.render(line, True, (220, 220, 220))
-            game.screen.blit(stat_surf, (game.screen.get_width() // 2 - stat_surf.get_width() // 2, 220 + i * 40))
-        # Regeneration calculations (rounded)
-        hp_regen = int(round(10 * game.player.vitality * (game.player.level * 0.2)))
-        mana_regen = int(round(10 * game.player.intelligence * (game.player.level * 0.2)))
-        regen_font = pygame.font.SysFont("arial", 24, bold=True)
-        hp_regen_text = f"HP Regeneration: {hp_regen} / sec"
-        mana_regen_text = f"Mana Regeneration: {mana_regen} / sec"
-        hp_regen_surf = regen_font.render(hp_regen_text, True, (120, 255, 120))
-        mana_regen_surf = regen_font.render(mana_regen_text, True, (120, 180, 255))
-        game.screen.blit(hp_regen_surf, (game.screen.get_width() // 2 - hp_regen_surf.get_width() // 2, 220 + 6 * 40))
-        game.screen.blit(mana_regen_surf, (game.screen.get_width() // 2 - mana_regen_surf.get_width() // 2, 220 + 7 * 40))
-
-        # --- Damage calculations ---
-        # Base damage (player's base melee damage range)
-        min_base = 1 + (game.player.strength - 1) * 5
-        max_base = 5 + (game.player.strength - 1) * 5
-        base_damage_text = f"Base Damage: {min_base} - {max_base}"
-
-        # Final damage (with weapon equipped)
-        weapon = game.player.equipment.get("Main Hand")
-        if weapon is not None and hasattr(weapon, "get_attack_damage") and weapon.attack_min is not None:
-            min_final = weapon.attack_min * min_base
-            max_final = weapon.attack_max * max_base
-            final_damage_text = f"Final Damage: {min_final} - {max_final}"
-        else:
-            final_damage_text = f"Final Damage: {min_base} - {max_base}"
-
-        dmg_font = pygame.font.SysFont("arial", 24, bold=True)
-        base_surf = dmg_font.render(base_damage_text, True, (255, 180, 80))
-        final_surf = dmg_font.render(final_damage_text, True, (80, 180, 255))
-        game.screen.blit(base_surf, (game.screen.get_width() // 2 - base_surf.get_width() // 2, 220 + 8 * 40))
-        game.screen.blit(final_surf, (game.screen.get_width() // 2 - final_surf.get_width() // 2, 220 + 9 * 40))
-
-        # Stat points (now below damage)
-        points_font = pygame.font.SysFont("arial", 24, bold=True)
-        points_text = f"Unassigned Stat Points: {game.player.stat_points}"
-        points_surf = points_font.render(points_text, True, (255, 215, 0))
-        game.screen.blit(points_surf, (game.screen.get_width() // 2 - points_surf.get_width() // 2, 220 + 10 * 40))
-        # Stat assign buttons (centered and spaced)
-        stat_names = ["Strength", "Dexterity", "Vitality", "Intelligence"]
-        stat_values = [game.player.strength, game.player.dexterity, game.player.vitality, game.player.intelligence]
-        btn_font = pygame.font.SysFont("arial", 28, bold=True)
-        btn_w, btn_h = 32, 32
-        btn_x = game.screen.get_width() // 2 + 180
-        btn_y_start = 220 + 11 * 40
-        stat_x = game.screen.get_width() // 2 - 120
-        for i, (name, value) in enumerate(zip(stat_names, stat_values)):
-            stat_line = f"{name}: {value}"
-            stat_surf = stats_font.render(stat_line, True, (220, 220, 220))
-            y_pos = btn_y_start + i * 56
-            game.screen.blit(stat_surf, (stat_x, y_pos))
-            # Draw [+] button
-            btn_rect = pygame.Rect(btn_x, y_pos, btn_w, btn_h)
-            color = (80, 200, 80) if game.player.stat_points > 0 else (120, 120, 120)
-            pygame.draw.rect(game.screen, color, btn_rect, border_radius=8)
-            plus_surf = btn_font.render("+", True, (0, 0, 0))
-            game.screen.blit(plus_surf, (btn_rect.x + btn_w // 2 - plus_surf.get_width() // 2, btn_rect.y + btn_h // 2 - plus_surf.get_height() // 2))
-    elif tab_index == 2:
-        # Skills tab
-        title = font.render("SKILLS", True, (255, 255, 255))
-        game.screen.blit(title, (game.screen.get_width() // 2 - title.get_width() // 2, 120))
-        skills_font = pygame.font.SysFont("arial", 28)
-        skills = [
-            "Fireball   [Select]",
-            # TODO: List more skills and selection logic
-        ]
-        for i, line in enumerate(skills):
-            skill_surf = skills_font.render(line, True, (220, 220, 220))
-            game.screen.blit(skill_surf, (game.screen.get_width() // 2 - skill_surf.get_width() // 2, 220 + i * 40))
 
-    # --- Instructions ---
-    hint_font = pygame.font.SysFont("arial", 24)
-    hint = hint_font.render("Press I or Tab to close | ←/→ or 1/2/3 to switch tabs", True, (180, 180, 180))
-    game.screen.blit(hint, (game.screen.get_width() // 2 - hint.get_width() // 2, game.screen.get_height() - 80))
-    pygame.display.flip()
-    hint = hint_font.render("Press I or Tab to close | ←/→ or 1/2/3 to switch tabs", True, (180, 180, 180))
-    game.screen.blit(hint, (game.screen.get_width() // 2 - hint.get_width() // 2, game.screen.get_height() - 80))
-    pygame.display.flip()
-    game.screen.blit(hint, (game.screen.get_width() // 2 - hint.get_width() // 2, game.screen.get_height() - 80))
-    pygame.display.flip()
-    hint = hint_font.render("Press I or Tab to close | ←/→ or 1/2/3 to switch tabs", True, (180, 180, 180))
-    game.screen.blit(hint, (game.screen.get_width() // 2 - hint.get_width() // 2, game.screen.get_height() - 80))
-    pygame.display.flip()
+def draw_inventory_overlay(game, tab_index=0) -> bool:
+    """Draw the paused inventory/stats/skills screen; returns False when nothing changed (no flip needed)."""
+    return game.inventory_ui.draw(game, tab_index)
@@ -1,6 +1,7 @@
 import pygame
 from dataclasses import dataclass, field
 from config.enemy import Enemy
+from config.sprites import sprite_frame, placeholder_frame, warm_sprite_frames
 import random  # Import random for dodge chance
 
 @dataclass
@@ -46,6 +47,11 @@ class Skeleton(Enemy):
         self.accessory_drop_rate = 0.01
         self.lowest_drop_level = 2  # Or set dynamically based on skeleton type/level
 
+    def warm_frames(self):
+        # Called from Enemy.__post_init__, after the 40% resize above
+        warm_sprite_frames(self.walk_frames, (self.w, self.h))
+        warm_sprite_frames(self.attack_frames, (self.w, self.h))
+
     def start_attack(self):
         self.attacking = True
         self.attack_anim_index = 0
@@ -61,7 +67,7 @@ class Skeleton(Enemy):
                     self.attack_anim_index = 0
                     self.attacking = False
 
-    def update(self, dt, target_pos, solids, player_rect, other_enemies, player=None, fairy=None):
+    def update(self, dt, target_pos, physics, player=None, fairy=None):
         # --- Skeleton movement pause logic ---
         player_close = False
         if player:
@@ -164,18 +170,18 @@ class Skeleton(Enemy):
                     chase_pos = (fx - dx / dist * keep_distance, fy - dy / dist * keep_distance)
                 else:
                     chase_pos = (self.x, self.y)
-            super().update(dt, chase_pos, solids, player_rect, other_enemies, player=player, fairy=fairy)
+            super().update(dt, chase_pos, physics, player=player, fairy=fairy)
             return
 
         # If torch is visible, follow it but keep distance or stop if in attack range
         if torch_in_range:
-            Enemy.update(self, dt, chase_pos, solids, player_rect, other_enemies, player=player, fairy=fairy)
+            Enemy.update(self, dt, chase_pos, physics, player=player, fairy=fairy)
             return
 
         # If not close or pause expired, do normal update
-        super().update(dt, target_pos, solids, player_rect, other_enemies, player=player, fairy=fairy)
+        super().update(dt, target_pos, physics, player=player, fairy=fairy)
 
-    def draw(self, surf: pygame.Surface, cam_x: float, cam_y: float):
+    def draw(self, surf, cam_x: float, cam_y: float):
         px, py = self.x - cam_x, self.y - cam_y
         image = None
         if self.attacking and self.attack_frames:
@@ -187,19 +193,7 @@ class Skeleton(Enemy):
         else:
             image = self.img
         if isinstance(image, pygame.Surface):
-            draw_img = pygame.transform.scale(image, (self.w, self.h))
-            draw_img = pygame.transform.flip(draw_img, True, False) if self.facing_left else draw_img
-            surf.blit(draw_img, (int(px - self.w // 2), int(py - self.h // 2)))
-        else:
-            rect = pygame.Rect(int(px - self.w // 2), int(py - self.h // 2), self.w, self.h)
-            pygame.draw.rect(surf, (200, 200, 200), rect, border_radius=6)
-            pygame.draw.rect(surf, (200, 200, 200), rect, border_radius=6)
-            image = self.img
-        if isinstance(image, pygame.Surface):
-            draw_img = pygame.transform.scale(image, (self.w, self.h))
-            draw_img = pygame.transform.flip(draw_img, True, False) if self.facing_left else draw_img
+            draw_img = sprite_frame(image, (self.w, self.h), self.facing_left)
             surf.blit(draw_img, (int(px - self.w // 2), int(py - self.h // 2)))
         else:
-            rect = pygame.Rect(int(px - self.w // 2), int(py - self.h // 2), self.w, self.h)
-            pygame.draw.rect(surf, (200, 200, 200), rect, border_radius=6)
-            pygame.draw.rect(surf, (200, 200, 200), rect, border_radius=6)
+            surf.blit(placeholder_frame((self.w, self.h), (200, 200, 200)), (int(px - self.w // 2), int(py - self.h // 2)))
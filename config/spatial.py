@@ -0,0 +1,120 @@
+import pygame
+from config.config import TILE_SIZE
+
+
+class SpatialHash:
+    """Uniform grid of TILE_SIZE cells for finding objects near a rect without scanning them all.
+
+    Objects are tracked by identity, so pygame.Rects (solids), dataclasses (enemies,
+    targets) and plain dicts (dropped items) can all be stored side by side.
+    """
+
+    def __init__(self, cell_size: int = TILE_SIZE):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list] = {}
+        # id(obj) -> [obj, rect, (x0, y0, x1, y1) cell span]
+        self._entries: dict[int, list] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return (entry[0] for entry in self._entries.values())
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._entries
+
+    def _span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _link(self, obj, span) -> None:
+        x0, y0, x1, y1 = span
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    def _unlink(self, obj, span) -> None:
+        x0, y0, x1, y1 = span
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                # Remove by identity; Rects and dataclasses compare by value
+                for i, other in enumerate(bucket):
+                    if other is obj:
+                        bucket[i] = bucket[-1]
+                        bucket.pop()
+                        break
+                if not bucket:
+                    del self.cells[(cx, cy)]
+
+    def insert(self, obj, rect: pygame.Rect) -> None:
+        if id(obj) in self._entries:
+            self.remove(obj)
+        span = self._span(rect)
+        self._entries[id(obj)] = [obj, rect, span]
+        self._link(obj, span)
+
+    def remove(self, obj) -> None:
+        entry = self._entries.pop(id(obj), None)
+        if entry is not None:
+            self._unlink(obj, entry[2])
+
+    def move(self, obj, rect: pygame.Rect) -> None:
+        """Update an object's rect, re-bucketing only when it crosses into other cells."""
+        entry = self._entries.get(id(obj))
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        entry[1] = rect
+        span = self._span(rect)
+        if span != entry[2]:
+            self._unlink(obj, entry[2])
+            entry[2] = span
+            self._link(obj, span)
+
+    def rect_of(self, obj) -> pygame.Rect:
+        entry = self._entries.get(id(obj))
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._entries.clear()
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Return every object stored in the cells overlapping rect (candidates, not exact hits)."""
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return list(cells.get((x0, y0), ()))
+        found = []
+        seen = set()
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    key = id(obj)
+                    if key not in seen:
+                        seen.add(key)
+                        found.append(obj)
+        return found
+
+    def colliding(self, rect: pygame.Rect, ignore=None) -> list:
+        """Return the objects whose stored rect actually overlaps rect."""
+        entries = self._entries
+        return [
+            obj for obj in self.query(rect)
+            if obj is not ignore and rect.colliderect(entries[id(obj)][1])
+        ]
+
+    def any_colliding(self, rect: pygame.Rect, ignore=None) -> bool:
+        """Return True as soon as one stored rect (other than ignore's) overlaps rect."""
+        entries = self._entries
+        for obj in self.query(rect):
+            if obj is not ignore and rect.colliderect(entries[id(obj)][1]):
+                return True
+        return False
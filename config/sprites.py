@@ -0,0 +1,74 @@
+import pygame
+from config.config import ROTATION_BUCKETS
+from config.batch import TextureAtlas
+
+# (id(source), width, height, flip_x) or (id(source), width, height, "rot", bucket, buckets)
+# -> (source, frame). The source is kept so its id cannot be reused by another surface.
+_frames: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}
+# Every cached frame lives on an atlas page; the frames handed out are subsurfaces of it
+_atlas = TextureAtlas()
+
+
+def sprite_frame(source: pygame.Surface, size, flip_x: bool = False) -> pygame.Surface:
+    """source scaled to size and optionally mirrored, transformed only the first time."""
+    width, height = size
+    key = (id(source), width, height, flip_x)
+    entry = _frames.get(key)
+    if entry is None or entry[0] is not source:
+        frame = source if source.get_size() == (width, height) else pygame.transform.scale(source, (width, height))
+        if flip_x:
+            frame = pygame.transform.flip(frame, True, False)
+        entry = _frames[key] = (source, _atlas.add(frame))
+    return entry[1]
+
+
+def rotation_bucket(angle: float, buckets: int = ROTATION_BUCKETS) -> int:
+    """Nearest of `buckets` evenly spaced directions for an angle in degrees."""
+    return round(angle * buckets / 360.0) % buckets
+
+
+def rotated_frame(source: pygame.Surface, size, angle: float, buckets: int = ROTATION_BUCKETS) -> pygame.Surface:
+    """source scaled to size and rotated by angle (degrees, counter-clockwise), snapped to a bucket."""
+    bucket = rotation_bucket(angle, buckets)
+    width, height = size
+    key = (id(source), width, height, "rot", bucket, buckets)
+    entry = _frames.get(key)
+    if entry is None or entry[0] is not source:
+        frame = pygame.transform.rotate(sprite_frame(source, size), bucket * 360.0 / buckets)
+        entry = _frames[key] = (source, _atlas.add(frame))
+    return entry[1]
+
+
+def warm_rotated_frames(source: pygame.Surface, size, buckets: int = ROTATION_BUCKETS) -> None:
+    """Fill the cache with every rotation of source, e.g. when a projectile sprite is loaded."""
+    for bucket in range(buckets):
+        rotated_frame(source, size, bucket * 360.0 / buckets, buckets)
+
+
+def warm_sprite_frames(sources, size, flips=(False, True)) -> None:
+    """Fill the cache for every source frame at load/spawn time."""
+    for source in sources:
+        if isinstance(source, pygame.Surface):
+            for flip_x in flips:
+                sprite_frame(source, size, flip_x)
+
+
+def placeholder_frame(size, color, ellipse: bool = False) -> pygame.Surface:
+    """Filled rounded rect (or ellipse) of size, for entities drawn without an image."""
+    width, height = size
+    key = ("placeholder", width, height, tuple(color), ellipse)
+    entry = _frames.get(key)
+    if entry is None:
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
+        if ellipse:
+            pygame.draw.ellipse(frame, color, frame.get_rect())
+        else:
+            pygame.draw.rect(frame, color, frame.get_rect(), border_radius=6)
+        entry = _frames[key] = (None, _atlas.add(frame))
+    return entry[1]
+
+
+def clear_sprite_frames() -> None:
+    """Drop every cached frame and atlas page (Game.load_level, so a level's frames don't outlive it)."""
+    _frames.clear()
+    _atlas.clear()
@@ -1,6 +1,8 @@
 import pygame
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from config.config import world_to_screen
+from config.sprites import sprite_frame
+from config.entities import NO_ENTITY
 
 
 @dataclass
@@ -12,12 +14,13 @@ class Target:
     img: pygame.Surface = None
     respawn_timer: float = 0.0
     hit_points: int = 300  # Add hit points, default 3
+    entity_id: int = field(default=NO_ENTITY, compare=False, repr=False)  # set by World
 
     def rect(self) -> pygame.Rect:
         return pygame.Rect(int(self.x - self.w/2), int(self.y - self.h/2), self.w, self.h)
 
-    def draw(self, surf: pygame.Surface, cam_x: float, cam_y: float):
+    def draw(self, surf, cam_x: float, cam_y: float):
         from config.config import world_to_screen
         if self.respawn_timer <= 0 and self.img:
             px, py = world_to_screen(self.x, self.y, cam_x, cam_y)
-            surf.blit(self.img, (px - self.w // 2, py - self.h // 2))
\ No newline at end of file
+            surf.blit(sprite_frame(self.img, self.img.get_size()), (px - self.w // 2, py - self.h // 2))
\ No newline at end of file
@@ -0,0 +1,39 @@
+from config.entities import EntityRegistry, entity_generation, entity_index
+
+
+def test_reused_slot_gets_a_new_generation():
+    registry = EntityRegistry()
+    registry.table("enemy")
+    old = registry.spawn(enemy="slime")
+    registry.destroy(old)
+    new = registry.spawn(enemy="skeleton")
+    assert entity_index(new) == entity_index(old)
+    assert entity_generation(new) == entity_generation(old) + 1
+    assert not registry.alive(old)
+    assert registry.alive(new)
+
+
+def test_stale_id_misses_the_new_occupant():
+    registry = EntityRegistry()
+    enemies = registry.table("enemy")
+    old = registry.spawn(enemy="slime")
+    registry.destroy(old)
+    new = registry.spawn(enemy="skeleton")
+    assert old not in enemies
+    assert enemies.get(old) is None
+    assert enemies.index(old) is None
+    assert enemies.get(new) == "skeleton"
+    # Destroying a stale id leaves the new entity alone
+    assert registry.destroy(old) == {}
+    assert registry.alive(new)
+    assert len(registry) == 1
+
+
+def test_destroy_swap_removes_and_reports_position():
+    registry = EntityRegistry()
+    enemies = registry.table("enemy")
+    ids = [registry.spawn(enemy=name) for name in ("a", "b", "c")]
+    assert registry.destroy(ids[0]) == {"enemy": 0}
+    assert enemies.items == ["c", "b"]
+    assert enemies.index(ids[2]) == 0
+    assert enemies.get(ids[1]) == "b"
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+import pygame
+from config.config import TILE_SIZE
+from config.projectiles import ARROW, FIREBALL, ProjectilePool, segment_enters_box
+from config.spatial import SpatialHash
+
+
+def make_world(w=40, h=40):
+    return SimpleNamespace(w=w, h=h, enemy_grid=SpatialHash(), target_grid=SpatialHash())
+
+
+class NoWalls:
+    def first_solid(self, start, end, radius):
+        return -1.0
+
+
+def test_segment_starting_inside_box_enters_at_zero():
+    assert segment_enters_box(5, 5, 50, 5, 0, 0, 10, 10) == 0.0
+
+
+def test_vertical_segment_beside_box_misses():
+    assert segment_enters_box(20, -10, 20, 30, 0, 0, 10, 10) == -1.0
+
+
+def test_horizontal_segment_above_box_misses():
+    assert segment_enters_box(-10, -5, 30, -5, 0, 0, 10, 10) == -1.0
+
+
+def test_segment_entering_box_reports_entry_fraction():
+    assert segment_enters_box(-10, 5, 10, 5, 0, 0, 10, 10) == 0.5
+
+
+def test_fast_projectile_hits_thin_target_between_ticks():
+    world = make_world()
+    # 4 px wide, far thinner than the 50 px a fireball flies in this tick
+    target = SimpleNamespace(respawn_timer=0)
+    world.target_grid.insert(target, pygame.Rect(300, 80, 4, 40))
+    pool = ProjectilePool()
+    fireball = pool.spawn(FIREBALL, 270, 100, 1, 0, 10)
+    ended = pool.update(50 / FIREBALL.speed, world, NoWalls(), explosion_frames=4)
+    assert ended == [(fireball, target)]
+    assert fireball.exploding
+    # Stopped where its box touched the target's, not past it
+    assert fireball.x == 300 - FIREBALL.width / 2
+
+
+def test_arrow_stops_at_max_range_and_is_reused():
+    world = make_world(w=100, h=10)
+    pool = ProjectilePool()
+    arrow = pool.spawn(ARROW, TILE_SIZE, TILE_SIZE * 5, 1, 0, 3)
+    dt = 0.1
+    ticks = 0
+    while len(pool):
+        ended = pool.update(dt, world, NoWalls(), explosion_frames=4)
+        ticks += 1
+    assert ended == [(arrow, None)]
+    assert ARROW.max_range < arrow.travelled <= ARROW.max_range + ARROW.speed * dt
+    assert ticks == int(ARROW.max_range // (ARROW.speed * dt)) + 1
+    assert pool.free == [arrow]
+    assert pool.spawn(ARROW, 0, 0, 1, 0, 1) is arrow
+
+
+def test_update_compacts_finished_projectiles_in_order():
+    world = make_world(w=100, h=100)
+    target = SimpleNamespace(respawn_timer=0)
+    world.target_grid.insert(target, pygame.Rect(200, 180, 10, 40))
+    pool = ProjectilePool()
+    first = pool.spawn(ARROW, 1000, 1000, 1, 0, 1)
+    doomed = pool.spawn(ARROW, 190, 200, 1, 0, 1)
+    last = pool.spawn(ARROW, 1000, 2000, 0, 1, 1)
+    pool.update(0.01, world, NoWalls(), explosion_frames=4)
+    assert pool.active == [first, last]
+    assert pool.free == [doomed]
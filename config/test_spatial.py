@@ -0,0 +1,51 @@
+import pygame
+from config.spatial import SpatialHash
+
+
+def test_move_within_a_cell_keeps_the_buckets():
+    grid = SpatialHash(32)
+    obj = {"name": "slime"}
+    grid.insert(obj, pygame.Rect(2, 2, 10, 10))
+    cells = {key: list(bucket) for key, bucket in grid.cells.items()}
+    grid.move(obj, pygame.Rect(6, 6, 10, 10))
+    assert {key: list(bucket) for key, bucket in grid.cells.items()} == cells
+    assert grid.rect_of(obj) == pygame.Rect(6, 6, 10, 10)
+
+
+def test_move_across_cells_rebuckets():
+    grid = SpatialHash(32)
+    obj = {"name": "slime"}
+    grid.insert(obj, pygame.Rect(2, 2, 10, 10))
+    grid.move(obj, pygame.Rect(100, 100, 10, 10))
+    assert grid.query(pygame.Rect(0, 0, 32, 32)) == []
+    assert grid.query(pygame.Rect(96, 96, 32, 32)) == [obj]
+    assert list(grid.cells) == [(3, 3)]
+
+
+def test_remove_is_by_identity():
+    grid = SpatialHash(32)
+    # Equal rects stored as objects of their own: removing one must leave the other
+    a = pygame.Rect(0, 0, 40, 40)
+    b = pygame.Rect(0, 0, 40, 40)
+    grid.insert(a, a)
+    grid.insert(b, b)
+    grid.remove(a)
+    assert a not in grid
+    assert grid.colliding(pygame.Rect(10, 10, 5, 5)) == [b]
+    assert grid.colliding(pygame.Rect(10, 10, 5, 5))[0] is b
+    grid.remove(b)
+    assert len(grid) == 0
+    assert grid.cells == {}
+
+
+def test_colliding_checks_stored_rects_and_ignore():
+    grid = SpatialHash(32)
+    near = {"name": "near"}
+    far_in_cell = {"name": "far"}
+    grid.insert(near, pygame.Rect(0, 0, 10, 10))
+    grid.insert(far_in_cell, pygame.Rect(20, 20, 10, 10))
+    probe = pygame.Rect(5, 5, 4, 4)
+    assert len(grid.query(probe)) == 2
+    assert grid.colliding(probe) == [near]
+    assert grid.colliding(probe, ignore=near) == []
+    assert not grid.any_colliding(probe, ignore=near)
@@ -0,0 +1,42 @@
+from collections import OrderedDict
+import pygame
+from config.config import TEXT_CACHE_SIZE
+
+# (name, size, bold, italic) -> Font; SysFont resolves and loads a font file on every call
+_fonts: dict[tuple, pygame.font.Font] = {}
+# (font, text, color, antialias) -> rendered Surface, least recently used first
+_text_cache: OrderedDict = OrderedDict()
+
+
+def get_font(name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """Cached drop-in for pygame.font.SysFont."""
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+    return font
+
+
+def render_text(font: pygame.font.Font, text, color, antialias: bool = True, alpha: int = None) -> pygame.Surface:
+    """font.render(text, antialias, color), re-rendered only when the string changes.
+
+    The returned surface is shared with later calls for the same text: blit it,
+    don't draw on it. alpha sets its surface alpha (fully opaque when None).
+    """
+    text = str(text)
+    key = (font, text, tuple(color), antialias)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache[key] = font.render(text, antialias, color)
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    # Always reset: another caller may have faded this same surface.
+    # (set_alpha(None) would drop the per-pixel alpha of antialiased text)
+    surf.set_alpha(255 if alpha is None else alpha)
+    return surf
+
+
+def clear_text_cache() -> None:
+    _text_cache.clear()
@@ -7,4 +7,20 @@ def draw_light_mask(center, radius):
     for r in range(radius, 0, -1):
         alpha = int(255 * (1 - r / radius))
         pygame.draw.circle(mask, (0, 0, 0, alpha), center, r)
-    return mask
\ No newline at end of file
+    return mask
+
+
+class SilentSound:
+    """Stand-in for pygame.mixer.Sound when no audio device is initialized."""
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+    def get_length(self):
+        return 0.0
@@ -1,51 +1,74 @@
 import pygame
 import math
-from config.config import TILE_SIZE, MAP_CHARS, COL_FLOOR_A, COL_FLOOR_B
+from collections import OrderedDict
+from config.config import TILE_SIZE, TILE_CHUNK_SIZE, TILE_CHUNK_CACHE, MAP_CHARS, COL_BG, COL_FLOOR_A, COL_FLOOR_B
 from config.enemy import Enemy
 from config.target import Target
 from config.skeleton import Skeleton  # <-- Add this import
+from config.spatial import SpatialHash
+from config.entities import EntityRegistry
 import random
 
+# Scaled copies of the shared enemy and target images, made once for every level. The
+# sprite cache is keyed by surface, so one copy per spawn would add cache entries per spawn
+_scaled: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}
+
+
+def scaled_image(img: pygame.Surface, size) -> pygame.Surface:
+    """img scaled to size, shared by every enemy or target that uses it."""
+    key = (id(img), size)
+    entry = _scaled.get(key)
+    if entry is None or entry[0] is not img:
+        entry = _scaled[key] = (img, pygame.transform.scale(img, size).convert_alpha())
+    return entry[1]
+
+
 class World:
-    def __init__(self, level_layout, enemy_imgs, target_imgs, door_img=None, door_img_open=None, game_level=1, monster_level_min=1, monster_level_max=1, skeleton_walk_frames=None, skeleton_attack_frames=None):
+    def __init__(self, level_layout, enemy_imgs, target_imgs, door_img=None, door_img_open=None, game_level=1, monster_level_min=1, monster_level_max=1, skeleton_walk_frames=None, skeleton_attack_frames=None, wall_texture=None, ground_texture=None):
         self.layout = level_layout
         self.w = len(level_layout[0])
         self.h = len(level_layout)
         self.solids: list[pygame.Rect] = []
-        self.enemies: list[Enemy] = []
-        self.targets: list[Target] = []
+        # Enemies and targets are entities; their objects live in the registry's component tables
+        self.entities = EntityRegistry()
+        self.enemy_table = self.entities.table("enemy", Enemy)
+        self.target_table = self.entities.table("target", Target)
+        enemies: list[Enemy] = []
+        targets: list[Target] = []
         self.doors: list = []  # Add this line
         self.door_img = door_img  # Store door image
         self.door_img_open = door_img_open  # Store open door image
-        # Load wall and ground textures
-        self.wall_texture = pygame.image.load("textures/map/wall.jpg").convert()
-        self.wall_texture = pygame.transform.scale(self.wall_texture, (TILE_SIZE, TILE_SIZE))
-        self.ground_texture = pygame.image.load("textures/map/ground.png").convert()
-        self.ground_texture = pygame.transform.scale(self.ground_texture, (TILE_SIZE, TILE_SIZE))
+        # Wall and ground textures (Game passes them in from its AssetManager)
+        if wall_texture is None:
+            wall_texture = pygame.transform.scale(pygame.image.load("textures/map/wall.jpg").convert(), (TILE_SIZE, TILE_SIZE))
+        if ground_texture is None:
+            ground_texture = pygame.transform.scale(pygame.image.load("textures/map/ground.png").convert(), (TILE_SIZE, TILE_SIZE))
+        self.wall_texture = wall_texture
+        self.ground_texture = ground_texture
         for y, row in enumerate(level_layout):
             for x, ch in enumerate(row):
                 if MAP_CHARS.get(ch, 0) == 1:
                     self.solids.append(pygame.Rect(x*TILE_SIZE, y*TILE_SIZE, TILE_SIZE, TILE_SIZE))
                 elif MAP_CHARS.get(ch, 0) == 2:
                     img = random.choice(enemy_imgs)
-                    img = pygame.transform.scale(img, (40, 60)).convert_alpha()
+                    img = scaled_image(img, (40, 60))
                     # Monster level: monster_level_min..monster_level_max
                     level = random.randint(monster_level_min, monster_level_max)
-                    self.enemies.append(Enemy(x*TILE_SIZE+TILE_SIZE/2, y*TILE_SIZE+TILE_SIZE/2, 28, 36, img=img, level=level))
+                    enemies.append(Enemy(x*TILE_SIZE+TILE_SIZE/2, y*TILE_SIZE+TILE_SIZE/2, 28, 36, img=img, level=level))
                 elif MAP_CHARS.get(ch, 0) == 3:
                     img = random.choice(enemy_imgs)
-                    img = pygame.transform.scale(img, (int(40*1.5), int(60*1.5))).convert_alpha()
+                    img = scaled_image(img, (int(40*1.5), int(60*1.5)))
                     new_w = int(28 * 1.5)
                     new_h = int(36 * 1.5)
                     # Big monster level: monster_level_min..monster_level_max
                     level = random.randint(monster_level_min, monster_level_max)
-                    self.enemies.append(Enemy(x*TILE_SIZE+TILE_SIZE/2, y*TILE_SIZE+TILE_SIZE/2, new_w, new_h, img=img, level=level))
+                    enemies.append(Enemy(x*TILE_SIZE+TILE_SIZE/2, y*TILE_SIZE+TILE_SIZE/2, new_w, new_h, img=img, level=level))
                 elif MAP_CHARS.get(ch, 0) == 4:
                     img = random.choice(target_imgs)
-                    img = pygame.transform.scale(img, (40, 60)).convert_alpha()
+                    img = scaled_image(img, (40, 60))
                     tx = x*TILE_SIZE+TILE_SIZE/2
                     ty = y*TILE_SIZE+TILE_SIZE/2
-                    self.targets.append(Target(tx, ty, 40, 60, img=img))
+                    targets.append(Target(tx, ty, 40, 60, img=img))
                     solid_rect = pygame.Rect(
                         int(tx - 20),  # 40/2
                         int(ty - 30),  # 60/2
@@ -71,7 +94,7 @@ class World:
                     new_w = int(28 * 1.4)
                     new_h = int(36 * 1.4)
                     level = random.randint(monster_level_min, monster_level_max)
-                    self.enemies.append(Skeleton(
+                    enemies.append(Skeleton(
                         x*TILE_SIZE+TILE_SIZE//2,
                         y*TILE_SIZE+TILE_SIZE//2,
                         new_w, new_h,
@@ -79,50 +102,180 @@ class World:
                         attack_frames=attack_frames,
                         level=level
                     ))
+        # Baked chunks, least recently drawn first; Game.load_level bakes the ones around the player
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._door_states: list[bool] = [door.open for door in self.doors]
+        # --- Spatial index: static solids plus one grid per kind of dynamic entity ---
+        self.solid_grid = SpatialHash()
+        for solid in self.solids:
+            self.solid_grid.insert(solid, solid)
+        self.enemy_grid = SpatialHash()
+        self.enemies_spawned = 0  # add_enemy calls so far; lets other indexes notice new enemies
+        self.set_enemies(enemies)
+        self.target_grid = SpatialHash()
+        for target in targets:
+            target.entity_id = self.entities.spawn(target=target)
+            self.target_grid.insert(target, target.rect())
+        self.drop_grid = SpatialHash()
 
-    def draw(self, surf: pygame.Surface, cam_x: float, cam_y: float, view_rect: pygame.Rect) -> None:
-        start_x = max(0, view_rect.left // TILE_SIZE)
-        end_x = min(self.w, math.ceil(view_rect.right / TILE_SIZE))
-        start_y = max(0, view_rect.top // TILE_SIZE)
-        end_y = min(self.h, math.ceil(view_rect.bottom / TILE_SIZE))
+    @property
+    def enemies(self) -> list[Enemy]:
+        """Live enemies, densely packed; removing one moves the last enemy into its place."""
+        return self.enemy_table.items
+
+    @property
+    def targets(self) -> list[Target]:
+        return self.target_table.items
+
+    def set_enemies(self, enemies: list[Enemy]) -> None:
+        """Replace every enemy entity with enemies and re-index the enemy grid."""
+        for entity_id in list(self.enemy_table.entities):
+            self.entities.destroy(entity_id)
+        self.enemy_grid.clear()
+        for enemy in enemies:
+            self.add_enemy(enemy)
+
+    def add_enemy(self, enemy: Enemy) -> int:
+        enemy.entity_id = self.entities.spawn(enemy=enemy)
+        self.enemies_spawned += 1
+        self.enemy_grid.insert(enemy, enemy.draw_enemy())
+        return enemy.entity_id
+
+    def remove_enemy(self, enemy: Enemy):
+        """Destroy enemy's entity (with all its components); returns the index it had in enemies."""
+        self.enemy_grid.remove(enemy)
+        return self.entities.destroy(enemy.entity_id).get("enemy")
+
+    def add_drop(self, dropped: dict) -> None:
+        self.drop_grid.insert(dropped, dropped["rect"])
+
+    def remove_drop(self, dropped: dict) -> None:
+        self.drop_grid.remove(dropped)
+
+    # --- Pre-baked tile layer ---
+    # Walls, ground and doors are rendered once into chunk surfaces that cover the
+    # level plus a one-tile border (doors overhang the outer wall row). World.draw
+    # then only blits the handful of chunks that intersect the camera view. Chunks
+    # are baked when first seen and the least recently drawn ones are dropped once
+    # more than TILE_CHUNK_CACHE are held, so big maps never keep every chunk.
+    def _chunk_px(self) -> int:
+        return TILE_CHUNK_SIZE * TILE_SIZE
+
+    def _chunk_counts(self) -> tuple[int, int]:
+        cols = math.ceil((self.w + 2) / TILE_CHUNK_SIZE)
+        rows = math.ceil((self.h + 2) / TILE_CHUNK_SIZE)
+        return cols, rows
+
+    def _chunk_world_rect(self, cx: int, cy: int) -> pygame.Rect:
+        size = self._chunk_px()
+        bounds = pygame.Rect(-TILE_SIZE, -TILE_SIZE, (self.w + 2) * TILE_SIZE, (self.h + 2) * TILE_SIZE)
+        rect = pygame.Rect(bounds.x + cx * size, bounds.y + cy * size, size, size)
+        return rect.clip(bounds)
+
+    def _bake_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        rect = self._chunk_world_rect(cx, cy)
+        chunk = pygame.Surface(rect.size)
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        chunk.fill(COL_BG)
+        start_x = max(0, rect.left // TILE_SIZE)
+        end_x = min(self.w, math.ceil(rect.right / TILE_SIZE))
+        start_y = max(0, rect.top // TILE_SIZE)
+        end_y = min(self.h, math.ceil(rect.bottom / TILE_SIZE))
         for ty in range(start_y, end_y):
-            for tx in range(start_x, end_x):
-                world_x = tx*TILE_SIZE - cam_x
-                world_y = ty*TILE_SIZE - cam_y
-                r = pygame.Rect(world_x, world_y, TILE_SIZE, TILE_SIZE)
-                # Bounds checking for ty and tx
-                if ty < 0 or ty >= len(self.layout):
-                    continue  # Skip out-of-bounds rows
-                row = self.layout[ty]
-                if tx < 0 or tx >= len(row):
-                    continue  # Skip out-of-bounds columns
-                ch = row[tx]
-                if MAP_CHARS.get(ch, 0) == 1:
-                    surf.blit(self.wall_texture, r)
-                else:
-                    surf.blit(self.ground_texture, r)
+            row = self.layout[ty]
+            for tx in range(start_x, min(end_x, len(row))):
+                tile = self.wall_texture if MAP_CHARS.get(row[tx], 0) == 1 else self.ground_texture
+                chunk.blit(tile, (tx * TILE_SIZE - rect.x, ty * TILE_SIZE - rect.y))
+        # Doors are part of the static layer; they only change when opened
+        for door in self.doors:
+            if door.rect().colliderect(rect):
+                door.draw(chunk, rect.x, rect.y)
+        self._chunks[(cx, cy)] = chunk
+        return chunk
+
+    def _chunk_range(self, view_rect: pygame.Rect, margin: int = 0) -> tuple[range, range]:
+        """Chunk columns and rows intersecting view_rect, widened by margin chunks on every side."""
+        size = self._chunk_px()
+        cols, rows = self._chunk_counts()
+        start_cx = max(0, (view_rect.left + TILE_SIZE) // size - margin)
+        end_cx = min(cols, (view_rect.right + TILE_SIZE) // size + 1 + margin)
+        start_cy = max(0, (view_rect.top + TILE_SIZE) // size - margin)
+        end_cy = min(rows, (view_rect.bottom + TILE_SIZE) // size + 1 + margin)
+        return range(start_cx, end_cx), range(start_cy, end_cy)
 
-        # Draw doors after tiles
-        for door in getattr(self, "doors", []):
-            door.draw(surf, cam_x, cam_y)
+    def _chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """The baked chunk at (cx, cy), baking it if needed and evicting the least recently used."""
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._bake_chunk(cx, cy)
+            while len(self._chunks) > TILE_CHUNK_CACHE:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end((cx, cy))
+        return chunk
+
+    def bake_tiles(self, view_rect: pygame.Rect, margin: int = 1) -> None:
+        """Render the chunks of the static tile layer in view_rect plus margin chunks around it."""
+        col_range, row_range = self._chunk_range(view_rect, margin)
+        for cy in row_range:
+            for cx in col_range:
+                self._chunk(cx, cy)
+
+    def invalidate_tiles(self, rect: pygame.Rect = None) -> None:
+        """Drop baked chunks overlapping a world rect (all chunks if None); they re-bake on next draw."""
+        if rect is None:
+            self._chunks.clear()
+            return
+        for key in [key for key in self._chunks if self._chunk_world_rect(*key).colliderect(rect)]:
+            del self._chunks[key]
+
+    def _sync_doors(self) -> None:
+        # Doors are opened by setting door.open directly, so detect state flips here
+        for i, door in enumerate(self.doors):
+            if door.open != self._door_states[i]:
+                self._door_states[i] = door.open
+                self.invalidate_tiles(door.rect())
+
+    def draw(self, surf: pygame.Surface, cam_x: float, cam_y: float, view_rect: pygame.Rect) -> None:
+        self._sync_doors()
+        col_range, row_range = self._chunk_range(view_rect)
+        blits = []
+        for cy in row_range:
+            for cx in col_range:
+                rect = self._chunk_world_rect(cx, cy)
+                blits.append((self._chunk(cx, cy), (int(rect.x - cam_x), int(rect.y - cam_y))))
+        surf.blits(blits, doreturn=False)
 
-    def remove_target_solid(self, target: Target):
+    def remove_target_solid(self, target: Target) -> list[pygame.Rect]:
+        """Drop the solids under target (it was destroyed); returns the rects removed."""
         target_rect = pygame.Rect(
             int(target.x - target.w // 2),
             int(target.y - target.h // 2),
             target.w, target.h
         )
-        self.solids = [r for r in self.solids if not r.colliderect(target_rect)]
+        kept = []
+        removed = []
+        for r in self.solids:
+            if r.colliderect(target_rect):
+                self.solid_grid.remove(r)
+                removed.append(r)
+            else:
+                kept.append(r)
+        self.solids = kept
+        return removed
 
-    def add_target_solid(self, target: Target):
+    def add_target_solid(self, target: Target) -> pygame.Rect:
         target_rect = pygame.Rect(
             int(target.x - target.w // 2),
             int(target.y - target.h // 2),
             target.w, target.h
         )
         self.solids.append(target_rect)
+        self.solid_grid.insert(target_rect, target_rect)
+        return target_rect
 
-    def update(self, dt: float, target_pos, solids: list[pygame.Rect], player_rect: pygame.Rect, other_enemies: list[pygame.Rect], player=None):
+    def update(self, dt: float, target_pos, solids: SpatialHash, player_rect: pygame.Rect, other_enemies: SpatialHash, player=None):
         # ...existing code...
         for i, enemy in enumerate(self.enemies):
             # ...existing code...
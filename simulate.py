@@ -0,0 +1,120 @@
+"""Headless batch runs: step the game simulation without a window or audio.
+
+    python simulate.py --level 2 --ticks 3600 --seed 7 --autopilot
+
+Prints one JSON summary line per run (hp, xp, kills, ...) so balance and
+regression checks can compare many seeded fights.
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+# Textures and sounds are loaded relative to the repo root
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # the banner would go to stdout, ahead of the JSON
+
+import pygame
+from config.config import SIM_DT
+
+
+def autopilot(game, tick):
+    """Walk towards the nearest enemy, swing when close, cast fireballs from range.
+
+    Returns the step() inputs (sword_swing, shoot_fireball, aim, keys).
+    """
+    keys = defaultdict(bool)
+    player = game.player
+    enemies = game.world.enemies
+    if not enemies:
+        return False, False, None, keys
+    enemy = min(enemies, key=lambda e: math.hypot(e.x - player.x, e.y - player.y))
+    dx, dy = enemy.x - player.x, enemy.y - player.y
+    dist = math.hypot(dx, dy)
+    if dist > 60:
+        if dx < -8:
+            keys[pygame.K_a] = True
+        elif dx > 8:
+            keys[pygame.K_d] = True
+        if dy < -8:
+            keys[pygame.K_w] = True
+        elif dy > 8:
+            keys[pygame.K_s] = True
+    sword_swing = dist < 70 and not player.sword_swinging
+    shoot_fireball = 70 <= dist < 400 and tick % 30 == 0
+    return sword_swing, shoot_fireball, (enemy.x, enemy.y), keys
+
+
+def simulate(level, ticks, seed, use_autopilot=False, verbose=False):
+    random.seed(seed)
+    from Game import Game
+
+    # stdout is only for the JSON summary; the game logs to stderr (or LOG_OUTPUT, see config/log.py)
+    sink = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with sink:
+        game = Game(level_index=level, headless=True)
+        enemies_at_start = len(game.world.enemies)
+        start = time.perf_counter()
+        ticks_run = 0
+        outcome = "timeout"
+        for tick in range(ticks):
+            if use_autopilot:
+                sword_swing, shoot_fireball, aim, keys = autopilot(game, tick)
+            else:
+                sword_swing, shoot_fireball, aim, keys = False, False, None, defaultdict(bool)
+            game.step(SIM_DT, sword_swing=sword_swing, shoot_fireball=shoot_fireball, aim=aim, keys=keys)
+            ticks_run += 1
+            if game.player.hp <= 0:
+                outcome = "died"
+                break
+            if game.door_transition is not None:
+                outcome = "door"
+                break
+        elapsed = time.perf_counter() - start
+
+    player = game.player
+    return {
+        "level": level,
+        "seed": seed,
+        "ticks": ticks_run,
+        "sim_seconds": round(ticks_run * SIM_DT, 3),
+        "outcome": outcome,
+        "player_hp": round(player.hp, 2),
+        "player_mana": round(getattr(player, "mana", 0), 2),
+        "player_level": player.level,
+        "player_xp": player.xp,
+        "enemies_start": enemies_at_start,
+        "enemies_left": len(game.world.enemies),
+        "kills": len(game.defeated_enemies_per_level.get(game.level_index, ())),
+        "drops_on_ground": len(game.dropped_items),
+        "wall_seconds": round(elapsed, 4),
+        "ticks_per_second": round(ticks_run / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game simulation headless and print a JSON summary.")
+    parser.add_argument("--level", type=int, default=0, help="level index (0 = LEVEL_1)")
+    parser.add_argument("--ticks", type=int, default=60 * 60, help="simulation ticks to run (60 per second)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the run")
+    parser.add_argument("--runs", type=int, default=1, help="number of runs, seeds seed..seed+runs-1")
+    parser.add_argument("--autopilot", action="store_true", help="let a simple bot fight the nearest enemy")
+    parser.add_argument("--verbose", action="store_true", help="keep the game's own console output")
+    args = parser.parse_args(argv)
+
+    for run in range(args.runs):
+        summary = simulate(args.level, args.ticks, args.seed + run, args.autopilot, args.verbose)
+        print(json.dumps(summary), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())